@@ -0,0 +1,266 @@
+"""Avalia a estratégia do mapa em muitos campos sorteados do Simulador.
+
+Cada seed gera um campo do `Simulador` (sem renderização) e joga uma partida completa
+com `jogar_partida`: a leitura das lixeiras e, para cada bloco, a coleta pela
+`EstrategiaMapa` e o depósito na lixeira da sua cor. A partida acaba quando não sobra
+bloco com lixeira, quando o tempo simulado passa de TEMPO_LIMITE ou depois de
+LIMITE_ACOES ações. Os episódios rodam em paralelo em todos os núcleos.
+
+São registrados por episódio os movimentos, giros, blocos depositados, depósitos em
+lixeira errada, tempo simulado e o motivo do fim. O arquivo de resultados guarda essas colunas e um resumo com média
+e percentis. Como cada seed sempre gera o mesmo campo, duas versões da estratégia
+podem ser comparadas rodando as duas com a mesma lista de seeds.
+
+Com `--corpus`, os campos vêm de um arquivo gerado por `gerar_campos.py` e as seeds são
+os índices dos campos no arquivo (por padrão, todos). Cada processo abre o arquivo
+mapeado em memória uma vez e lê só os campos que joga.
+
+As opções de ruído ligam o `ModeloRuido` do simulador, com um gerador por seed: o
+desvio padrão das distâncias dos VL53, as probabilidades de falha de leitura, de falso
+bloco perto e de erro na cor dos blocos e das lixeiras. `--leituras` e `--tentativas`
+mudam as repetições da estratégia (leituras dos sensores laterais por encruzilhada e
+tentativas de pegar o bloco que continua à frente). Comparando um resultado sem ruído
+com outro com ruído nas mesmas seeds, cada nível de ruído vira movimentos e segundos a
+mais, e cada configuração das repetições mostra se ela compensa o tempo que gasta.
+
+Antes dos episódios, `conferir_saida_bloqueada` confere que a estratégia ainda acha
+um caminho até a área verde quando leituras erradas fecharam todas as saídas do robô.
+
+Uso:
+    python avaliar_estrategia.py --seeds 0-999 --saida resultados.json
+    python avaliar_estrategia.py --corpus campos.npy --saida resultados.json
+    python avaliar_estrategia.py --comparar antes.json depois.json
+    python avaliar_estrategia.py --falha-distancia 0.1 --falso-perto 0.05 --leituras 5 --saida ruido.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import settings
+from src.atuadores.simulador import FimDoEpisodio, Simulador
+from src.atuadores.simulador.campos import carregar_campos, simulador_do_campo
+from src.atuadores.simulador.partida import jogar_partida
+from src.atuadores.simulador.ruido import ModeloRuido
+from src.estrategias.estrategia_mapa import EstrategiaMapa
+from src.mapa import Mapa
+
+TEMPO_LIMITE = 900.0  # Segundos simulados; limite de segurança para estratégias que não terminam
+LIMITE_ACOES = 20_000
+METRICAS = ('movimentos', 'giros', 'blocos', 'erros_deposito', 'tempo')
+PERCENTIS = (0.05, 0.5, 0.95)
+
+# Campos do corpus aberto em cada processo, ou None para sortear pela seed
+_campos = None
+# Parâmetros do ModeloRuido e repetições da estratégia de cada processo (ver configuracao_padrao)
+_configuracao = None
+
+
+def configuracao_padrao() -> dict:
+    """Sem ruído e com as repetições da estratégia."""
+    return {
+        'ruido': {'desvio_distancia': 0.0, 'falha_distancia': 0.0, 'falso_perto': 0.0, 'erro_cor': 0.0},
+        'leituras': EstrategiaMapa.QTD_LEITURAS_SENSORES,
+        'tentativas': EstrategiaMapa.MAX_TENTATIVAS_PEGAR_BLOCO,
+    }
+
+
+def conferir_saida_bloqueada():
+    """Fecha com BLOCO saturado todas as arestas em volta do robô e confere que ele ainda planeja a saída."""
+    settings.DEBUG = False
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        estrategia = EstrategiaMapa(Simulador(seed=0, renderizar=False), Mapa())
+        estrategia.pos_anterior, estrategia.pos_atual = (2, 2), (2, 3)
+        # Leituras falsas de bloco próximo repetidas até a evidência saturar
+        for vizinho in estrategia.nos_vizinhos:
+            for _ in range(Mapa.OBSERVACOES_SUFICIENTES * 2):
+                estrategia.mapa.observar_aresta(estrategia.pos_atual, vizinho, 0.95)
+        assert estrategia.planejador.caminho_saida(estrategia.pos_atual, estrategia.direcao) is None
+        caminho = estrategia.caminho_para_area_verde()
+    assert caminho is not None
+    assert caminho[0] == (2, 3), caminho
+    assert caminho[-1] == Mapa.AREA_VERDE, caminho
+
+
+def _iniciar_processo(corpus: str | None = None, configuracao: dict | None = None):
+    """Desliga o serviço web e as mensagens da estratégia em cada processo do lote."""
+    global _campos, _configuracao  # noqa: PLW0603
+    settings.DEBUG = False
+    sys.stdout = open(os.devnull, 'w')
+    if corpus is not None:
+        _campos = carregar_campos(corpus)
+    _configuracao = configuracao
+
+
+def simular_episodio(seed: int) -> dict:
+    """Roda um episódio no campo da seed (ou do índice no corpus) e retorna suas métricas."""
+    configuracao = _configuracao or configuracao_padrao()
+    parametros = {
+        'renderizar': False,
+        'tempo_limite': TEMPO_LIMITE,
+        'limite_acoes': LIMITE_ACOES,
+        'ruido': ModeloRuido(**configuracao['ruido'], seed=seed),
+    }
+    if _campos is None:
+        robo = Simulador(seed=seed, **parametros)
+    else:
+        robo = simulador_do_campo(_campos[seed], seed=seed, **parametros)
+    estrategia = EstrategiaMapa(robo, Mapa(simetria=settings.SIMETRIA_CAMPO))
+    estrategia.QTD_LEITURAS_SENSORES = configuracao['leituras']
+    estrategia.MAX_TENTATIVAS_PEGAR_BLOCO = configuracao['tentativas']
+
+    fim = 'concluido'
+    try:
+        jogar_partida(robo, estrategia)
+    except FimDoEpisodio:
+        fim = 'limite'
+    except Exception as erro:
+        fim = f'erro: {type(erro).__name__}: {erro}'
+
+    return {
+        'seed': seed,
+        'movimentos': robo.movimentos,
+        'giros': robo.giros,
+        'blocos': robo.blocos_depositados,
+        'erros_deposito': robo.depositos_errados,
+        'tempo': round(robo.tempo, 3),
+        'fim': fim,
+    }
+
+
+def percentil(valores: list[float], fracao: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))]
+
+
+def resumir(colunas: dict) -> dict:
+    """Média e percentis de cada métrica."""
+    resumo = {}
+    for metrica in METRICAS:
+        valores = colunas[metrica]
+        resumo[metrica] = {'media': round(sum(valores) / len(valores), 3)}
+        for fracao in PERCENTIS:
+            resumo[metrica][f'p{round(fracao * 100)}'] = percentil(valores, fracao)
+    resumo['fins'] = {fim: colunas['fim'].count(fim) for fim in sorted(set(colunas['fim']))}
+    return resumo
+
+
+def avaliar(
+    seeds: list[int],
+    processos: int | None = None,
+    corpus: str | None = None,
+    configuracao: dict | None = None,
+) -> dict:
+    """Roda os episódios em paralelo e retorna a configuração, as colunas de métricas e o resumo."""
+    configuracao = configuracao or configuracao_padrao()
+    with ProcessPoolExecutor(
+        max_workers=processos, initializer=_iniciar_processo, initargs=(corpus, configuracao)
+    ) as executor:
+        episodios = list(executor.map(simular_episodio, seeds, chunksize=max(1, len(seeds) // 64)))
+
+    colunas = {chave: [episodio[chave] for episodio in episodios] for chave in ('seed', *METRICAS, 'fim')}
+    return {'configuracao': configuracao, 'colunas': colunas, 'resumo': resumir(colunas)}
+
+
+def comparar(arquivo_antes: str, arquivo_depois: str):
+    """Mostra a diferença média por métrica nos episódios com a mesma seed."""
+    with open(arquivo_antes) as arquivo:
+        antes = json.load(arquivo)['colunas']
+    with open(arquivo_depois) as arquivo:
+        depois = json.load(arquivo)['colunas']
+
+    indices_depois = {seed: indice for indice, seed in enumerate(depois['seed'])}
+    pares = [
+        (indice, indices_depois[seed]) for indice, seed in enumerate(antes['seed']) if seed in indices_depois
+    ]
+    print(f'{len(pares)} episódios em comum')
+    print(f'{"Métrica":<12} {"Antes":>10} {"Depois":>10} {"Diferença":>10} {"Melhorou":>9} {"Piorou":>7}')
+    # Resultados antigos não têm as métricas acrescentadas depois
+    for metrica in (metrica for metrica in METRICAS if metrica in antes and metrica in depois):
+        diferencas = [depois[metrica][j] - antes[metrica][i] for i, j in pares]
+        media_antes = sum(antes[metrica][i] for i, _ in pares) / len(pares)
+        media_depois = sum(depois[metrica][j] for _, j in pares) / len(pares)
+        # Mais blocos é melhor; nas outras métricas, menos é melhor
+        sinal = 1 if metrica == 'blocos' else -1
+        melhorou = sum(diferenca * sinal > 0 for diferenca in diferencas)
+        piorou = sum(diferenca * sinal < 0 for diferenca in diferencas)
+        print(
+            f'{metrica:<12} {media_antes:>10.2f} {media_depois:>10.2f}'
+            f' {media_depois - media_antes:>+10.2f} {melhorou:>9} {piorou:>7}'
+        )
+
+
+def ler_seeds(texto: str) -> list[int]:
+    """Converte '0-99,200,300-309' na lista de seeds."""
+    seeds = []
+    for parte in texto.split(','):
+        inicio, _, fim = parte.partition('-')
+        seeds.extend(range(int(inicio), int(fim or inicio) + 1))
+    return seeds
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--seeds', help='seeds dos campos, como 0-999 ou 1,5,10-20 (padrão: 0-199)')
+    parser.add_argument('--corpus', help='arquivo .npy de campos gerado por gerar_campos.py')
+    parser.add_argument('--saida', default='resultados_estrategia.json', help='arquivo de resultados')
+    parser.add_argument('--processos', type=int, default=None, help='processos em paralelo (padrão: núcleos)')
+    parser.add_argument('--comparar', nargs=2, metavar=('ANTES', 'DEPOIS'), help='compara dois resultados')
+    ruido = parser.add_argument_group('ruído dos sensores')
+    ruido.add_argument('--desvio-distancia', type=float, default=0.0, help='desvio padrão dos VL53, em mm')
+    ruido.add_argument('--falha-distancia', type=float, default=0.0, help='probabilidade de leitura falha')
+    ruido.add_argument('--falso-perto', type=float, default=0.0, help='probabilidade de falso bloco perto')
+    ruido.add_argument('--erro-cor', type=float, default=0.0, help='probabilidade de errar uma cor')
+    ruido.add_argument(
+        '--leituras', type=int, default=EstrategiaMapa.QTD_LEITURAS_SENSORES, help='leituras por encruzilhada'
+    )
+    ruido.add_argument(
+        '--tentativas', type=int, default=None, help='tentativas de pegar um bloco (padrão: sem limite)'
+    )
+    argumentos = parser.parse_args()
+
+    if argumentos.comparar:
+        comparar(*argumentos.comparar)
+        return
+
+    conferir_saida_bloqueada()
+
+    if argumentos.seeds:
+        seeds = ler_seeds(argumentos.seeds)
+    elif argumentos.corpus:
+        seeds = list(range(len(carregar_campos(argumentos.corpus))))
+    else:
+        seeds = ler_seeds('0-199')
+
+    configuracao = {
+        'ruido': {
+            'desvio_distancia': argumentos.desvio_distancia,
+            'falha_distancia': argumentos.falha_distancia,
+            'falso_perto': argumentos.falso_perto,
+            'erro_cor': argumentos.erro_cor,
+        },
+        'leituras': argumentos.leituras,
+        'tentativas': argumentos.tentativas,
+    }
+    resultados = avaliar(seeds, argumentos.processos, argumentos.corpus, configuracao)
+    with open(argumentos.saida, 'w') as arquivo:
+        json.dump(resultados, arquivo, separators=(',', ':'))
+
+    resumo = resultados['resumo']
+    print(f'{"Métrica":<12} {"Média":>10} {"p5":>10} {"p50":>10} {"p95":>10}')
+    for metrica in METRICAS:
+        valores = resumo[metrica]
+        print(
+            f'{metrica:<12} {valores["media"]:>10.2f} {valores["p5"]:>10.2f}'
+            f' {valores["p50"]:>10.2f} {valores["p95"]:>10.2f}'
+        )
+    print('Fins:', resumo['fins'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Mede o seguidor de linha do `RoboSeguidorDeLinha` no simulador cinemático.
+
+Para cada velocidade, o robô começa logo depois da coluna 0 de uma linha do mapa,
+deslocado para o lado e um pouco torto, e percorre a linha inteira com
+`seguir_ate_encruzilhada`, como a `EstrategiaMapa`. São medidos:
+
+- o tempo da volta, da partida até a última encruzilhada;
+- o sobressinal: o maior desvio lateral dos sensores depois de cruzarem a linha pela
+  primeira vez, e o desvio médio no mesmo trecho;
+- a detecção das encruzilhadas: o erro médio e o maior erro entre o ponto em que o robô
+  parou e a encruzilhada, e quantas paradas ficaram a até TOLERANCIA_ENCRUZILHADA dela.
+
+Uso:
+    python avaliar_seguidor.py
+    python avaliar_seguidor.py --velocidades 40,60,80 --modo velocidade
+"""
+
+import argparse
+import contextlib
+import io
+from math import sin
+
+from src.atuadores.cinematico import MundoCinematico
+from src.atuadores.cinematico.dispositivos import DISTANCIA_SENSORES
+from src.atuadores.cinematico.robo import RoboCinematico
+
+VELOCIDADES = (30, 45, 60, 80, 100)
+LINHA = 2
+# Sensores além da encruzilhada de partida, em mm, como depois do ande_certa_distancia(40) da estratégia
+AVANCO_INICIAL = 40
+DESVIO_INICIAL = 15  # mm para o lado, na partida
+ANGULO_INICIAL = -5  # graus
+TOLERANCIA_ENCRUZILHADA = 30  # mm
+MODOS = {'potencia': RoboCinematico.ModoMotor.POTENCIA, 'velocidade': RoboCinematico.ModoMotor.VELOCIDADE}
+
+
+def percorrer_linha(velocidade: int, modo: int) -> dict:
+    """Percorre a linha LINHA do campo e retorna as métricas da volta."""
+    mundo = MundoCinematico(registrar_trajetoria=True)
+    robo = RoboCinematico(mundo)
+    campo = mundo.campo
+
+    x_inicio, y_linha = campo.posicao_no(LINHA, 0)
+    mundo.posicionar(x_inicio + AVANCO_INICIAL - DISTANCIA_SENSORES, y_linha + DESVIO_INICIAL, ANGULO_INICIAL)
+    tempo_inicial = mundo.relogio.tempo
+
+    erros_parada = []
+    for coluna in range(1, campo.largura):
+        with contextlib.redirect_stdout(io.StringIO()):
+            robo.seguir_ate_encruzilhada(velocidade=velocidade, modo=modo, tempo_minimo=0.2)
+        x_sensores, _ = mundo.ponto(DISTANCIA_SENSORES, 0)
+        erros_parada.append(x_sensores - campo.posicao_no(LINHA, coluna)[0])
+
+    # Desvio lateral dos sensores depois de cruzarem a linha pela primeira vez
+    desvios = [y + DISTANCIA_SENSORES * sin(theta) - y_linha for _, _, y, theta in mundo.trajetoria]
+    cruzamento = next((i for i, desvio in enumerate(desvios) if desvio <= 0), len(desvios))
+    depois = [abs(desvio) for desvio in desvios[cruzamento:]] or [0.0]
+
+    return {
+        'tempo': mundo.relogio.tempo - tempo_inicial,
+        'sobressinal': max(depois),
+        'desvio_medio': sum(depois) / len(depois),
+        'erro_parada_medio': sum(abs(erro) for erro in erros_parada) / len(erros_parada),
+        'erro_parada_maximo': max(erros_parada, key=abs),
+        'acertos': sum(abs(erro) <= TOLERANCIA_ENCRUZILHADA for erro in erros_parada),
+        'encruzilhadas': len(erros_parada),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--velocidades', default=','.join(map(str, VELOCIDADES)), help='como 40,60,80')
+    parser.add_argument('--modo', choices=MODOS, default='potencia', help='modo dos motores no seguidor')
+    argumentos = parser.parse_args()
+
+    print(
+        f'{"Velocidade":>10} {"Volta (s)":>10} {"Sobressinal (mm)":>17} {"Desvio médio (mm)":>18}'
+        f' {"Parada média (mm)":>18} {"Pior parada (mm)":>17} {"Acertos":>8}'
+    )
+    for velocidade in map(int, argumentos.velocidades.split(',')):
+        metricas = percorrer_linha(velocidade, MODOS[argumentos.modo])
+        print(
+            f'{velocidade:>10} {metricas["tempo"]:>10.2f} {metricas["sobressinal"]:>17.1f}'
+            f' {metricas["desvio_medio"]:>18.1f} {metricas["erro_parada_medio"]:>18.1f}'
+            f' {metricas["erro_parada_maximo"]:>+17.1f} {metricas["acertos"]:>4}/{metricas["encruzilhadas"]}'
+        )
+
+
+if __name__ == '__main__':
+    main()
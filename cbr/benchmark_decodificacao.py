@@ -0,0 +1,158 @@
+"""Mede o custo de tratar e decodificar cada resposta das placas de sensores.
+
+Para cada placa, a mesma resposta passa REPETICOES vezes por dois caminhos:
+
+- antigo: o que os drivers faziam antes, reproduzido aqui: o transporte copiava a resposta
+  para um `bytes` novo, o driver guardava `list(dados)` e cada leitura fatiava a lista e
+  a convertia com `struct.unpack`;
+- atual: a resposta chega como memoryview da janela do `TransporteSerial`, o
+  `_trata_resposta` do driver a copia para o buffer livre e troca os buffers, e as
+  leituras usam o `struct.Struct.unpack_from` dos métodos do driver.
+
+Nos dois caminhos, depois de tratar a resposta são feitas as leituras que um laço de
+controle faria (os três ângulos do giroscópio, a reflexão e as cores do sensor de cor, as
+quatro portas dos multiplexadores). A tabela mostra o tempo por amostra e o pico de
+memória alocado durante cada amostra, medido com `tracemalloc` numa rodada separada.
+
+Os drivers abrem os emuladores em pseudo-terminais só para existirem; as leituras
+periódicas deles são paradas antes da medida.
+
+Uso:
+    python benchmark_decodificacao.py
+    python benchmark_decodificacao.py --placas giroscopio --repeticoes 200000
+"""
+
+import argparse
+import struct
+import time
+import tracemalloc
+
+from libs.giroscopio import Giroscopio
+from libs.placaMuxTCS34725 import PlacaMuxTCS34725
+from libs.placaMuxVl53l0x import PlacaMuxVl53l0x
+from libs.sensorCorReflexao import CorReflexao
+from src.emuladores import EmuladorCorReflexao, EmuladorGiroscopio, EmuladorMuxTCS34725, EmuladorMuxVl53l0x
+
+REPETICOES = 100_000
+# Rodada mais curta para o tracemalloc, que deixa cada alocação bem mais lenta
+REPETICOES_MEMORIA = 1_000
+
+
+def antigo_giroscopio(driver, dados):
+    lista = list(bytes(dados))
+    driver.amostras.publicar(dados)
+    return (
+        struct.unpack('>h', bytes(lista[0:2]))[0],
+        struct.unpack('>h', bytes(lista[2:4]))[0],
+        -struct.unpack('>h', bytes(lista[4:6]))[0],
+    )
+
+
+def atual_giroscopio(driver, dados):
+    driver._trata_resposta(dados)
+    return driver.le_angulo_x(), driver.le_angulo_y(), driver.le_angulo_z()
+
+
+def antigo_cor_reflexao(driver, dados):
+    lista = list(bytes(dados))
+    driver.amostras.publicar(dados)
+    return lista[0:4], lista[4:8], lista[8:12], lista[12:16], lista[20:23], lista[23:26], lista[26:29]
+
+
+def atual_cor_reflexao(driver, dados):
+    driver._trata_resposta(dados)
+    return (
+        driver.le_reflexao(),
+        driver.le_rgbc(1),
+        driver.le_rgbc(2),
+        driver.le_rgbc(3),
+        driver.le_hsv(1),
+        driver.le_hsv(2),
+        driver.le_hsv(3),
+    )
+
+
+def antigo_vl53(driver, dados):
+    lista = list(bytes(dados))
+    return [struct.unpack('>h', bytes(lista[porta * 2 : porta * 2 + 2]))[0] for porta in range(4)]
+
+
+def atual_vl53(driver, dados):
+    driver._trata_resposta(dados)
+    return [driver.le_distancia(porta) for porta in range(4)]
+
+
+def antigo_tcs(driver, dados):
+    lista = list(bytes(dados))
+    return [
+        tuple(
+            struct.unpack('>h', bytes(lista[porta * 4 + i * 2 : porta * 4 + i * 2 + 2]))[0] for i in range(4)
+        )
+        for porta in range(4)
+    ]
+
+
+def atual_tcs(driver, dados):
+    driver._trata_resposta(dados)
+    return [driver.le_sensor(porta) for porta in range(4)]
+
+
+# nome: (emulador, driver, caminho antigo, caminho atual)
+PLACAS = {
+    'giroscopio': (EmuladorGiroscopio, Giroscopio, antigo_giroscopio, atual_giroscopio),
+    'cor_reflexao': (EmuladorCorReflexao, CorReflexao, antigo_cor_reflexao, atual_cor_reflexao),
+    'vl53': (EmuladorMuxVl53l0x, PlacaMuxVl53l0x, antigo_vl53, atual_vl53),
+    'tcs': (EmuladorMuxTCS34725, PlacaMuxTCS34725, antigo_tcs, atual_tcs),
+}
+
+
+def medir(caminho, driver, dados, repeticoes) -> tuple[float, float]:
+    """Tempo em ns e pico de memória em bytes, por amostra."""
+    inicio = time.perf_counter_ns()
+    for _ in range(repeticoes):
+        caminho(driver, dados)
+    tempo = (time.perf_counter_ns() - inicio) / repeticoes
+
+    # O pico de cada chamada, acima do que já estava alocado, é o que ela criou de uma vez
+    tracemalloc.start()
+    pico_total = 0
+    for _ in range(REPETICOES_MEMORIA):
+        tracemalloc.reset_peak()
+        alocado, _ = tracemalloc.get_traced_memory()
+        caminho(driver, dados)
+        pico_total += tracemalloc.get_traced_memory()[1] - alocado
+    tracemalloc.stop()
+    return tempo, pico_total / REPETICOES_MEMORIA
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--placas', default=','.join(PLACAS), help='como giroscopio,tcs')
+    parser.add_argument('--repeticoes', type=int, default=REPETICOES, help='amostras por medida')
+    argumentos = parser.parse_args()
+
+    print(
+        f'{"Placa":<13} {"Antigo (ns)":>12} {"Atual (ns)":>11} {"Ganho":>6}'
+        f' {"Antigo (B)":>11} {"Atual (B)":>10}'
+    )
+    for nome in argumentos.placas.split(','):
+        classe_emulador, classe_driver, antigo, atual = PLACAS[nome]
+        with classe_emulador() as emulador:
+            driver = classe_driver(emulador.caminho)
+            driver._parar_leituras()
+            # A resposta como o transporte entrega: um trecho da janela de recepção
+            janela = bytearray(range(256))
+            dados = memoryview(janela)[: driver.quantidade_bytes_modo]
+            tempo_antigo, memoria_antiga = medir(antigo, driver, dados, argumentos.repeticoes)
+            tempo_atual, memoria_atual = medir(atual, driver, dados, argumentos.repeticoes)
+            print(
+                f'{nome:<13} {tempo_antigo:>12.0f} {tempo_atual:>11.0f} {tempo_antigo / tempo_atual:>5.1f}x'
+                f' {memoria_antiga:>11.1f} {memoria_atual:>10.1f}'
+            )
+            driver.ser.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Compara as políticas de exploração em campos sorteados.
+
+Os campos são sorteados em lote por `gerar_campos`, com pares de blocos espelhados pelo
+centro como no campo real e no `Simulador`, e cada política é medida com e sem a suposição de simetria do
+`Mapa`. Cada política explora o mesmo conjunto de campos até não sobrar aresta desconhecida
+alcançável. Os sensores são simulados como em `EstrategiaBase.atualizacao_dinamica_mapa`:
+em cada encruzilhada as leituras da esquerda, da frente e da direita revelam a aresta
+até o vizinho e, quando ela está livre, a aresta seguinte. O robô anda um nó por vez e
+replaneja a cada encruzilhada, como a estratégia. O tempo é estimado com o modelo de
+custos do `PlanejadorDirecional` (arestas, paradas e giros). As leituras são fundidas
+com `Mapa.observar_aresta`, como na estratégia.
+
+Uso:
+    python benchmark_exploracao.py
+"""
+
+from itertools import product
+
+import numpy as np
+from src.atuadores.simulador.campos import arestas_grade, gerar_campos
+from src.definicao_cores import Cores
+from src.mapa import Mapa
+from src.planejadores import (
+    InterfacePlanejador,
+    PlanejadorDirecional,
+    PlanejadorGanhoInformacao,
+    PlanejadorIncremental,
+)
+from src.planejadores.planejador_direcional import DIRECOES, DIREITA
+
+# Altura, largura e quantidade de blocos (cerca de 15% das arestas)
+TAMANHOS = [(5, 6, 7), (8, 9, 19)]
+QTD_CAMPOS = 200
+LIMITE_PASSOS = 500
+# Probabilidade de bloco informada ao mapa por uma leitura sem ruído
+LEITURA_BLOCO = 0.85
+LEITURA_LIVRE = 0.15
+SEED = 2025
+
+POLITICAS = {
+    'Mais próximo': PlanejadorIncremental,
+    'Mais próximo (giros)': PlanejadorDirecional,
+    'Ganho de informação': PlanejadorGanhoInformacao,
+}
+
+# Deslocamento de cada direção (mesma ordem de EstrategiaBase.Direcoes)
+DESLOCAMENTOS = {direcao: delta for delta, direcao in DIRECOES.items()}
+
+
+def blocos_do_campo(lixos: np.ndarray, arestas: tuple) -> set:
+    """Retorna o conjunto das arestas do campo que têm bloco, nos dois sentidos."""
+    blocos = set()
+    for indice in np.flatnonzero(lixos != Cores.VAZIO.value).tolist():
+        u, v = arestas[indice]
+        blocos.update(((u, v), (v, u)))
+    return blocos
+
+
+def ler_aresta(mapa: Mapa, blocos: set, u: tuple[int, int], v: tuple[int, int]) -> bool:
+    """Funde a leitura ideal da aresta no mapa. Retorna se ela está livre."""
+    livre = (u, v) not in blocos
+    mapa.observar_aresta(u, v, LEITURA_LIVRE if livre else LEITURA_BLOCO)
+    return livre
+
+
+def ler_sensores(mapa: Mapa, blocos: set, posicao: tuple[int, int], direcao: int):
+    """Atualiza o mapa com as leituras ideais dos três sensores."""
+    for direcao_sensor in (direcao, (direcao + 1) % 4, (direcao - 1) % 4):
+        delta_linha, delta_coluna = DESLOCAMENTOS[direcao_sensor]
+        vizinho = (posicao[0] + delta_linha, posicao[1] + delta_coluna)
+        vizinho_vizinho = (vizinho[0] + delta_linha, vizinho[1] + delta_coluna)
+        if not mapa.possui_aresta(posicao, vizinho):
+            continue
+        if ler_aresta(mapa, blocos, posicao, vizinho) and mapa.possui_aresta(vizinho, vizinho_vizinho):
+            ler_aresta(mapa, blocos, vizinho, vizinho_vizinho)
+
+
+def explorar(
+    classe_planejador, altura: int, largura: int, blocos: set, simetria: bool
+) -> tuple[float, int, bool]:
+    """Explora o campo com a política. Retorna o tempo estimado, os passos e se terminou."""
+    mapa = Mapa(altura, largura, simetria=simetria)
+    planejador: InterfacePlanejador = classe_planejador(mapa)
+    custos = PlanejadorDirecional(mapa)
+
+    posicao, direcao = (0, 0), DIREITA
+    tempo = 0.0
+    for passos in range(LIMITE_PASSOS):
+        ler_sensores(mapa, blocos, posicao, direcao)
+        if not mapa.ids_desconhecidos:
+            return tempo, passos, True
+
+        caminho = planejador.caminho_desconhecido_mais_proximo(posicao, direcao)
+        if caminho is None:
+            return tempo, passos, False
+
+        proximo = caminho[1]
+        direcao_nova = custos._direcao(posicao, proximo)
+        tempo += custos.custo_giro(direcao, direcao_nova)
+        direcao = direcao_nova
+        # Depois de girar o sensor da frente lê a aresta que será percorrida
+        if not ler_aresta(mapa, blocos, posicao, proximo):
+            continue
+
+        tempo += custos.custos_passo[Mapa.VAZIO]
+        posicao = proximo
+
+    return tempo, LIMITE_PASSOS, False
+
+
+def main():
+    print(
+        f'{"Grade":>8} {"Política":<22} {"Simetria":>8} {"Tempo médio (s)":>16}'
+        f' {"Passos médios":>14} {"Incompletos":>12}'
+    )
+    for altura, largura, qtd_blocos in TAMANHOS:
+        arestas = arestas_grade(altura, largura)
+        lixos = gerar_campos(QTD_CAMPOS, qtd_blocos, altura, largura, SEED)['lixos']
+        campos = [blocos_do_campo(lixos_campo, arestas) for lixos_campo in lixos]
+        for (nome, classe), simetria in product(POLITICAS.items(), (False, True)):
+            resultados = [explorar(classe, altura, largura, blocos, simetria) for blocos in campos]
+            tempo_medio = sum(tempo for tempo, _, _ in resultados) / len(resultados)
+            passos_medios = sum(passos for _, passos, _ in resultados) / len(resultados)
+            incompletos = sum(not terminou for _, _, terminou in resultados)
+            print(
+                f'{altura:>3}x{largura:<4} {nome:<22} {"sim" if simetria else "não":>8} {tempo_medio:>16.1f}'
+                f' {passos_medios:>14.1f} {incompletos:>12}'
+            )
+
+
+if __name__ == '__main__':
+    main()
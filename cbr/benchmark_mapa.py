@@ -0,0 +1,109 @@
+"""Compara o desempenho do mapa baseado em arrays com a implementação em NetworkX.
+
+As duas implementações recebem o mesmo conhecimento sorteado e as consultas feitas
+a cada encruzilhada são cronometradas. Antes, QTD_CONFERENCIAS estados sorteados
+conferem que as duas devolvem exatamente os mesmos caminhos (e portanto os mesmos
+destinos, com os mesmos desempates), não só caminhos do mesmo custo.
+
+Uso:
+    python benchmark_mapa.py
+"""
+
+import random
+from timeit import Timer
+
+import networkx as nx
+from src.mapa import Mapa, OpçõesConhecimentoAresta
+from src.mapa_grafo import MapaGrafo
+
+TAMANHOS = [(5, 6), (20, 20), (50, 50)]
+SEED = 2025
+QTD_CONFERENCIAS = 2000
+
+
+def sortear_conhecimento(mapas: list, seed: int):
+    """Aplica o mesmo conhecimento aleatório em todos os mapas."""
+    aleatorio = random.Random(seed)
+    opcoes = [
+        OpçõesConhecimentoAresta.VAZIO,
+        OpçõesConhecimentoAresta.DESCONHECIDA,
+        OpçõesConhecimentoAresta.BLOCO,
+    ]
+    for u, v, conhecimento in list(mapas[0].arestas()):
+        if conhecimento == OpçõesConhecimentoAresta.INICIO:
+            continue
+        novo = aleatorio.choices(opcoes, weights=(5, 4, 1))[0]
+        for mapa in mapas:
+            mapa.definir_conhecimento_aresta(u, v, novo)
+
+
+def caminho_saida_grafo(mapa_grafo: MapaGrafo, origem: tuple[int, int]) -> list | None:
+    """O `caminho_saida` do MapaGrafo, com None (como no Mapa) quando não há caminho."""
+    try:
+        return mapa_grafo.caminho_saida(origem)
+    except nx.NetworkXNoPath:
+        return None
+
+
+def conferir(altura: int, largura: int, seed: int):
+    """Confere em estados sorteados que as consultas das duas implementações são idênticas."""
+    aleatorio = random.Random(seed)
+    mapa = Mapa(altura, largura)
+    mapa_grafo = MapaGrafo(altura, largura)
+    for _ in range(QTD_CONFERENCIAS):
+        sortear_conhecimento([mapa, mapa_grafo], aleatorio.random())
+        origem = (aleatorio.randrange(altura), aleatorio.randrange(largura))
+        desconhecidos = mapa.nos_com_arestas_desconhecidas()
+
+        assert mapa.nos_com_bloco() == mapa_grafo.nos_com_bloco()
+        assert set(desconhecidos) == set(mapa_grafo.nos_com_arestas_desconhecidas())
+        assert mapa.caminho_saida(origem) == caminho_saida_grafo(mapa_grafo, origem), origem
+        if desconhecidos:
+            # Em ordem de prioridade: nos empates de distância vale o primeiro da lista
+            assert mapa.dijkstra_multiplos_destinos(origem, desconhecidos) == (
+                mapa_grafo.dijkstra_multiplos_destinos(origem, desconhecidos)
+            ), origem
+
+
+def cronometrar(funcao) -> float:
+    """Retorna o tempo médio de uma chamada em microssegundos."""
+    timer = Timer(funcao)
+    repeticoes, _ = timer.autorange()
+    melhor = min(timer.repeat(repeat=2, number=repeticoes))
+    return melhor / repeticoes * 1e6
+
+
+def main():
+    conferir(*TAMANHOS[0], SEED)
+    print(f'{"Grade":>8} {"Consulta":<32} {"NetworkX (us)":>14} {"Arrays (us)":>12} {"Ganho":>7}')
+    for altura, largura in TAMANHOS:
+        mapa = Mapa(altura, largura)
+        mapa_grafo = MapaGrafo(altura, largura)
+        sortear_conhecimento([mapa, mapa_grafo], SEED)
+
+        origem = (altura - 1, largura - 1)
+        desconhecidos = mapa.nos_com_arestas_desconhecidas()
+        assert mapa.dijkstra_multiplos_destinos(origem, desconhecidos) == (
+            mapa_grafo.dijkstra_multiplos_destinos(origem, desconhecidos)
+        )
+
+        consultas = {
+            'nos_com_bloco': lambda m: m.nos_com_bloco(),
+            'nos_com_arestas_desconhecidas': lambda m: m.nos_com_arestas_desconhecidas(),
+            'dijkstra_multiplos_destinos': lambda m, o=origem, d=desconhecidos: m.dijkstra_multiplos_destinos(
+                o, d
+            ),
+            'caminho_saida': lambda m, o=origem: m.caminho_saida(o),
+        }
+
+        for nome, consulta in consultas.items():
+            tempo_grafo = cronometrar(lambda c=consulta, m=mapa_grafo: c(m))
+            tempo_arrays = cronometrar(lambda c=consulta, m=mapa: c(m))
+            print(
+                f'{altura:>3}x{largura:<4} {nome:<32} {tempo_grafo:>14.1f} {tempo_arrays:>12.1f}'
+                f' {tempo_grafo / tempo_arrays:>6.1f}x'
+            )
+
+
+if __name__ == '__main__':
+    main()
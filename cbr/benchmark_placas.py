@@ -0,0 +1,261 @@
+"""Mede os drivers das placas seriais contra os emuladores de firmware em pseudo-terminais.
+
+Cada driver de `libs` abre o pseudo-terminal do emulador da sua placa no lugar da porta
+serial. Primeiro é feita uma conferência: valores postos no emulador precisam chegar
+certos às leituras do driver. Depois, para cada cenário de latência, jitter e perda
+de bytes:
+
+- vazão: com a thread do driver parada, o método de atualização é chamado sem parar
+  por DURACAO segundos; são medidas as chamadas por segundo, a fração que falhou e os
+  percentis do tempo de cada chamada;
+- laço: com a placa registrada na `CentralSensores`, a frequência real das leituras,
+  contada pelas requisições que chegaram ao emulador.
+
+Nos motores, cada chamada é uma iteração de um laço de controle: `velocidade_motores`
+com envio instantâneo, como o `Robo` usa, e `estado` para ler os encoders. Com
+`--motores-assincrono` os motores usam a thread de escrita, que fica sempre rodando.
+
+Uma chamada conta como acerto quando o driver aceita a resposta. Nas placas de modo o
+`TransporteSerial` deixa a próxima requisição a caminho, então a resposta aceita
+normalmente é a da chamada anterior. As colunas de perdas e latência vêm dos contadores
+do transporte de cada placa: a fração das requisições cuja resposta não chegou a tempo e
+a latência média dos quadros recebidos.
+
+Por fim, com `--central`, todas as placas de sensores escolhidas ficam registradas na
+central ao mesmo tempo, cada uma no seu período padrão, e a tabela da central mostra a
+frequência, o atraso e a ocupação de cada porta durante DURACAO segundos.
+
+Uso:
+    python benchmark_placas.py
+    python benchmark_placas.py --placas giroscopio,motores --cenarios ideal,perda
+    python benchmark_placas.py --placas motores --motores-assincrono
+    python benchmark_placas.py --placas giroscopio,cor_reflexao,vl53,tcs --cenarios latencia --central
+"""
+
+import argparse
+import time
+
+from libs.central_sensores import CentralSensores
+from libs.giroscopio import Giroscopio
+from libs.motores import Motores
+from libs.placaMuxTCS34725 import PlacaMuxTCS34725
+from libs.placaMuxVl53l0x import PlacaMuxVl53l0x
+from libs.sensorCorReflexao import CorReflexao
+from src.emuladores import (
+    EmuladorCorReflexao,
+    EmuladorGiroscopio,
+    EmuladorMotores,
+    EmuladorMuxTCS34725,
+    EmuladorMuxVl53l0x,
+)
+
+DURACAO = 1.0
+# Motores é um singleton, então o modo é um só para a execução inteira
+_motores_assincronos = False
+ESPERA_ENTRE_CENARIOS = 0.1
+CENARIOS = {
+    'ideal': {'latencia': 0.0, 'jitter': 0.0, 'perda': 0.0},
+    'latencia': {'latencia': 0.004, 'jitter': 0.002, 'perda': 0.0},
+    # Mais que o timeout de 10 ms dos drivers
+    'lento': {'latencia': 0.012, 'jitter': 0.0, 'perda': 0.0},
+    'perda': {'latencia': 0.001, 'jitter': 0.0, 'perda': 0.01},
+}
+
+
+def conferir_motores(emulador: EmuladorMotores, motores: Motores) -> bool:
+    motores.velocidade_motores(50, -50)
+    motores.atualiza_motores()
+    time.sleep(0.1)
+    motores.estado()
+    girando = (
+        motores.angulo_motor(1) > 0
+        and motores.angulo_motor(2) < 0
+        and motores.estado_motor(1) == motores.GIRANDO_NORMAL
+        and motores.estado_motor(2) == motores.GIRANDO_INVERTIDO
+    )
+    motores.move_motores(0, 1, 0, 1)
+    motores.atualiza_motores()
+    return girando and emulador.velocidades == [0, 0]
+
+
+def atualizar_leitura(placa):
+    """Atualiza até o driver ler os valores postos agora no emulador.
+
+    A primeira resposta aceita pode ser a de uma requisição que saiu antes da mudança.
+    """
+    placa.atualiza()
+    placa.atualiza()
+
+
+def conferir_giroscopio(emulador: EmuladorGiroscopio, giroscopio: Giroscopio) -> bool:
+    emulador.angulo_z = 37
+    atualizar_leitura(giroscopio)
+    lido = giroscopio.le_angulo_z()
+    giroscopio.reseta_z()
+    atualizar_leitura(giroscopio)
+    return lido == -37 and giroscopio.le_angulo_z() == 0
+
+
+def conferir_cor_reflexao(emulador: EmuladorCorReflexao, sensor: CorReflexao) -> bool:
+    emulador.lista = list(range(32))
+    atualizar_leitura(sensor)
+    return sensor.le_reflexao() == (0, 1, 2, 3) and sensor.le_hsv(1) == (20, 21, 22)
+
+
+def conferir_vl53(emulador: EmuladorMuxVl53l0x, placa: PlacaMuxVl53l0x) -> bool:
+    emulador.distancias = [100, 200, 300, 400]
+    emulador.botoes = [0, 1, 0, 1]
+    atualizar_leitura(placa)
+    return placa.le_distancia(2) == 300 and placa.botao_apertado(1) and not placa.botao_apertado(2)
+
+
+def conferir_tcs(emulador: EmuladorMuxTCS34725, placa: PlacaMuxTCS34725) -> bool:
+    emulador.leituras = [(1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12), (13, 14, 15, 16)]
+    atualizar_leitura(placa)
+    return placa.le_sensor(0) == (1, 2, 3, 4)
+
+
+def iteracao_controle(motores: Motores) -> bool:
+    motores.velocidade_motores(50, -50)
+    return motores.estado()
+
+
+# nome: (emulador, driver a partir do caminho, método de atualização, conferência)
+PLACAS = {
+    'motores': (
+        EmuladorMotores,
+        lambda caminho: Motores(True, porta=caminho, assincrono=_motores_assincronos),
+        iteracao_controle,
+        conferir_motores,
+    ),
+    'giroscopio': (EmuladorGiroscopio, Giroscopio, lambda placa: placa.atualiza(), conferir_giroscopio),
+    'cor_reflexao': (EmuladorCorReflexao, CorReflexao, lambda placa: placa.atualiza(), conferir_cor_reflexao),
+    'vl53': (EmuladorMuxVl53l0x, PlacaMuxVl53l0x, lambda placa: placa.atualiza(), conferir_vl53),
+    'tcs': (EmuladorMuxTCS34725, PlacaMuxTCS34725, lambda placa: placa.atualiza(), conferir_tcs),
+}
+
+
+def medir_vazao(atualizar, driver) -> dict:
+    """Chama a atualização do driver por DURACAO segundos e mede acertos e tempos."""
+    tempos = []
+    falhas = 0
+    fim = time.perf_counter() + DURACAO
+    while (inicio := time.perf_counter()) < fim:
+        try:
+            ok = atualizar(driver)
+        except Exception:  # O driver dos motores lança exceção quando a resposta não chega
+            ok = False
+        tempos.append(time.perf_counter() - inicio)
+        falhas += not ok
+    tempos.sort()
+    return {
+        'chamadas_s': len(tempos) / DURACAO,
+        'falhas': falhas / len(tempos),
+        'p50_ms': 1000 * tempos[len(tempos) // 2],
+        'p99_ms': 1000 * tempos[int(len(tempos) * 0.99)],
+    }
+
+
+def medir_laco(emulador, driver) -> float | None:
+    """Frequência em Hz das atualizações periódicas do driver, ou None se ele não tem.
+
+    As placas de sensores são lidas pela central; nos motores assíncronos a thread de
+    escrita já está rodando.
+    """
+    if hasattr(driver, '_iniciar_leituras'):
+        emulador.zerar_contadores()
+        driver._iniciar_leituras()
+        time.sleep(DURACAO)
+        driver._parar_leituras()
+    elif getattr(driver, 'assincrono', False):
+        emulador.zerar_contadores()
+        time.sleep(DURACAO)
+    else:
+        return None
+    return emulador.requisicoes / DURACAO
+
+
+def parar_atualizacoes(driver):
+    """Para as leituras da central ou a thread dos motores, para o driver usar a porta sozinho."""
+    if hasattr(driver, '_parar_leituras'):
+        driver._parar_leituras()
+    elif hasattr(driver, '_parar_thread'):
+        driver._parar_thread()
+
+
+def medir_central(nomes: list[str], cenario: dict):
+    """Lê todas as placas de sensores pela central ao mesmo tempo e mostra a tabela dela."""
+    sensores = [nome for nome in nomes if nome != 'motores']
+    emuladores = [PLACAS[nome][0](**cenario) for nome in sensores]
+    drivers = []
+    try:
+        for nome, emulador in zip(sensores, emuladores, strict=True):
+            emulador.iniciar()
+            drivers.append(PLACAS[nome][1](emulador.caminho))
+        CentralSensores().zerar_contadores()
+        time.sleep(DURACAO)
+        print()
+        CentralSensores().imprime_estatisticas()
+    finally:
+        for driver in drivers:
+            driver._parar_leituras()
+            driver.ser.close()
+        for emulador in emuladores:
+            emulador.parar()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--placas', default=','.join(PLACAS), help='como motores,giroscopio')
+    parser.add_argument('--cenarios', default=','.join(CENARIOS), help='como ideal,perda')
+    parser.add_argument('--motores-assincrono', action='store_true', help='motores com a thread de escrita')
+    parser.add_argument(
+        '--central', action='store_true', help='no fim, todas as placas de sensores juntas na central'
+    )
+    argumentos = parser.parse_args()
+    global _motores_assincronos  # noqa: PLW0603
+    _motores_assincronos = argumentos.motores_assincrono
+
+    print(
+        f'{"Placa":<13} {"Cenário":<9} {"Chamadas/s":>10} {"Falhas":>7}'
+        f' {"p50 (ms)":>9} {"p99 (ms)":>9} {"Perdas":>7} {"Lat. (ms)":>10} {"Laço (Hz)":>10}'
+    )
+    for nome in argumentos.placas.split(','):
+        classe_emulador, abrir_driver, atualizar, conferir = PLACAS[nome]
+        with classe_emulador() as emulador:
+            driver = abrir_driver(emulador.caminho)
+            if not getattr(driver, 'assincrono', False):
+                parar_atualizacoes(driver)
+            if not conferir(emulador, driver):
+                print(f'{nome:<13} conferência FALHOU: o driver não leu os valores do emulador')
+
+            for cenario in argumentos.cenarios.split(','):
+                for parametro, valor in CENARIOS[cenario].items():
+                    setattr(emulador, parametro, valor)
+                # Cada cenário começa sem respostas atrasadas do anterior na porta
+                time.sleep(ESPERA_ENTRE_CENARIOS)
+                driver.transporte.descartar()
+                driver.transporte.zerar_contadores()
+                vazao = medir_vazao(atualizar, driver)
+                transporte = driver.transporte.estatisticas()
+                laco = medir_laco(emulador, driver)
+                perdas = transporte['quadros_perdidos'] / max(transporte['requisicoes'], 1)
+                latencia = transporte['latencia_media_ms']
+                print(
+                    f'{nome:<13} {cenario:<9} {vazao["chamadas_s"]:>10.0f} {vazao["falhas"]:>7.1%}'
+                    f' {vazao["p50_ms"]:>9.2f} {vazao["p99_ms"]:>9.2f}'
+                    f' {perdas:>7.1%} {"-" if latencia is None else f"{latencia:.2f}":>10}'
+                    f' {"-" if laco is None else f"{laco:.0f}":>10}'
+                )
+            parar_atualizacoes(driver)
+            driver.ser.close()
+
+    if argumentos.central:
+        # No último cenário pedido
+        medir_central(argumentos.placas.split(','), CENARIOS[argumentos.cenarios.split(',')[-1]])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Mede a latência de planejamento por encruzilhada de cada planejador.
+
+Uma mesma sequência de encruzilhadas é reproduzida para todos os planejadores. Em
+cada encruzilhada o mapa recebe as leituras dos sensores (arestas vizinhas e
+vizinho do vizinho) e são feitas as consultas de `proximo_no` (bloco mais próximo
+ou, se não houver, desconhecido mais próximo) e de `caminho_saida`. O tempo
+medido inclui a atualização do mapa, já que os planejadores incrementais fazem
+parte do trabalho nesse momento. Também confere se os caminhos têm o mesmo custo.
+
+Uso:
+    python benchmark_planejadores.py
+"""
+
+import random
+from itertools import pairwise
+from time import perf_counter
+
+from src.mapa import Mapa, OpçõesConhecimentoAresta
+from src.planejadores import (
+    PlanejadorDijkstra,
+    PlanejadorDirecional,
+    PlanejadorIncremental,
+    PlanejadorTabelas,
+)
+
+TAMANHOS = [(5, 6), (20, 20)]
+QTD_ENCRUZILHADAS = 2000
+SEED = 2025
+
+PLANEJADORES = {
+    'Dijkstra (antes)': PlanejadorDijkstra,
+    'Incremental': PlanejadorIncremental,
+    'Tabelas': PlanejadorTabelas,
+    'Direcional': PlanejadorDirecional,
+}
+
+
+def gerar_percurso(altura: int, largura: int, seed: int) -> list:
+    """Gera a sequência de encruzilhadas como (posição, [(u, v, conhecimento), ...])."""
+    aleatorio = random.Random(seed)
+    mapa = Mapa(altura, largura)
+    real = {}
+    for u, v, conhecimento in mapa.arestas():
+        if conhecimento != OpçõesConhecimentoAresta.INICIO:
+            bloco = aleatorio.random() < 0.15
+            real[(u, v)] = real[(v, u)] = (
+                OpçõesConhecimentoAresta.BLOCO if bloco else OpçõesConhecimentoAresta.VAZIO
+            )
+
+    percurso = []
+    posicao = (0, 0)
+    for _ in range(QTD_ENCRUZILHADAS):
+        leituras = []
+        for delta_linha, delta_coluna in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            vizinho = (posicao[0] + delta_linha, posicao[1] + delta_coluna)
+            vizinho_vizinho = (posicao[0] + 2 * delta_linha, posicao[1] + 2 * delta_coluna)
+            for aresta in ((posicao, vizinho), (vizinho, vizinho_vizinho)):
+                if aresta in real:
+                    leituras.append((*aresta, real[aresta]))
+        percurso.append((posicao, leituras))
+
+        livres = [
+            v
+            for u, v, conhecimento in leituras
+            if u == posicao and conhecimento != OpçõesConhecimentoAresta.BLOCO
+        ]
+        posicao = aleatorio.choice(livres) if livres else (0, 0)
+        # De vez em quando um bloco é coletado e a aresta fica livre
+        blocos = [
+            aresta for aresta, conhecimento in real.items() if conhecimento == OpçõesConhecimentoAresta.BLOCO
+        ]
+        if blocos and aleatorio.random() < 0.05:
+            u, v = aleatorio.choice(blocos)
+            real[(u, v)] = real[(v, u)] = OpçõesConhecimentoAresta.VAZIO
+
+    return percurso
+
+
+def custo(mapa: Mapa, caminho: list | None) -> float | None:
+    if caminho is None:
+        return None
+    return sum(mapa.conhecimento_aresta(u, v)['peso'] for u, v in pairwise(caminho))
+
+
+def reproduzir(classe_planejador, altura: int, largura: int, percurso: list) -> tuple[list[float], list]:
+    """Reproduz o percurso com o planejador. Retorna os tempos por encruzilhada e os custos."""
+    mapa = Mapa(altura, largura)
+    planejador = classe_planejador(mapa)
+    tempos = []
+    resultados = []
+    for posicao, leituras in percurso:
+        inicio = perf_counter()
+        for u, v, conhecimento in leituras:
+            mapa.definir_conhecimento_aresta(u, v, conhecimento)
+        caminho = planejador.caminho_bloco_mais_proximo(
+            posicao
+        ) or planejador.caminho_desconhecido_mais_proximo(posicao)
+        saida = planejador.caminho_saida(posicao)
+        tempos.append(perf_counter() - inicio)
+        resultados.append((custo(mapa, caminho), custo(mapa, saida)))
+    return tempos, resultados
+
+
+def percentil(valores: list[float], fracao: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))]
+
+
+def main():
+    print(f'{"Grade":>8} {"Planejador":<18} {"Média (us)":>11} {"p50 (us)":>10} {"p95 (us)":>10}')
+    for altura, largura in TAMANHOS:
+        percurso = gerar_percurso(altura, largura, SEED)
+        referencia = None
+        for nome, classe in PLANEJADORES.items():
+            tempos, resultados = reproduzir(classe, altura, largura, percurso)
+            if classe is PlanejadorDijkstra:
+                referencia = resultados
+            elif classe is not PlanejadorDirecional:
+                assert resultados == referencia, f'{nome} encontrou caminhos com custo diferente'
+
+            media = sum(tempos) / len(tempos) * 1e6
+            print(
+                f'{altura:>3}x{largura:<4} {nome:<18} {media:>11.1f}'
+                f' {percentil(tempos, 0.5) * 1e6:>10.1f} {percentil(tempos, 0.95) * 1e6:>10.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Gera um corpus de campos espelhados para a avaliação e os benchmarks.
+
+Os campos são sorteados de uma vez com `gerar_campos` e salvos como um `.npy` que
+`avaliar_estrategia.py --corpus` abre mapeado em memória. A mesma seed sempre gera o
+mesmo corpus.
+
+Uso:
+    python gerar_campos.py --quantidade 100000 --saida campos.npy
+"""
+
+import argparse
+from time import perf_counter
+
+from src.atuadores.simulador.campos import gerar_campos, salvar_campos
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--quantidade', type=int, default=10_000, help='quantidade de campos')
+    parser.add_argument('--blocos', type=int, default=21, help='blocos por campo')
+    parser.add_argument('--altura', type=int, default=5)
+    parser.add_argument('--largura', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--saida', default='campos.npy', help='arquivo do corpus')
+    argumentos = parser.parse_args()
+
+    inicio = perf_counter()
+    campos = gerar_campos(
+        argumentos.quantidade, argumentos.blocos, argumentos.altura, argumentos.largura, argumentos.seed
+    )
+    salvar_campos(argumentos.saida, campos)
+    print(
+        f'{len(campos)} campos ({campos.nbytes / 1e6:.1f} MB) salvos em {argumentos.saida}'
+        f' em {perf_counter() - inicio:.2f} s'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# Buffer circular das leituras de um sensor
+#
+# Cada leitura publicada ganha um número de sequência e o instante (time.monotonic) em que
+# chegou, e fica num buffer de tamanho fixo guardado em arrays, então publicar só copia os
+# valores, sem criar listas novas, e as últimas `capacidade` leituras ficam disponíveis. Quem lê sabe a idade
+# da leitura (`ultima(idade_maxima)`), e um laço de controle, em vez de reler os mesmos
+# valores sem parar, dorme até a próxima leitura (`espera_proxima`) e acorda uma vez por
+# leitura nova.
+import threading
+import time
+from array import array
+
+
+class Amostra:
+    __slots__ = ('sequencia', 'instante', 'valores')
+
+    def __init__(self, sequencia, instante, valores):
+        self.sequencia = sequencia
+        self.instante = instante
+        self.valores = valores
+
+    # segundos desde que a leitura chegou
+    def idade(self):
+        return time.monotonic() - self.instante
+
+
+class BufferAmostras:
+    def __init__(self, largura, capacidade=32, tipo='B'):
+        self.largura = largura
+        self.capacidade = capacidade
+        self.tipo = tipo
+        self._valores = array(tipo, [0]) * (largura * capacidade)
+        self._vista = memoryview(self._valores)
+        self._instantes = array('d', [0.0]) * capacidade
+        # Número de leituras já publicadas, que é a sequência da mais recente (0: nenhuma)
+        self.sequencia = 0
+        self._condicao = threading.Condition()
+
+    def publicar(self, valores, instante=None):
+        """Guarda uma leitura com `largura` valores e acorda quem espera por ela."""
+        with self._condicao:
+            posicao = self.sequencia % self.capacidade
+            inicio = posicao * self.largura
+            if self.tipo == 'B':
+                # Bytes de uma resposta: cópia direta, sem objetos intermediários
+                self._vista[inicio : inicio + self.largura] = valores
+            else:
+                for indice, valor in enumerate(valores):
+                    self._valores[inicio + indice] = valor
+            self._instantes[posicao] = time.monotonic() if instante is None else instante
+            self.sequencia += 1
+            self._condicao.notify_all()
+
+    def ultima(self, idade_maxima=None):
+        """A leitura mais recente, ou None se não há nenhuma ou se ela passou de `idade_maxima` segundos."""
+        with self._condicao:
+            if not self.sequencia:
+                return None
+            amostra = self._amostra(self.sequencia)
+        if idade_maxima is not None and amostra.idade() > idade_maxima:
+            return None
+        return amostra
+
+    def espera_proxima(self, tempo_limite=None, apos=None):
+        """Dorme até chegar uma leitura mais nova que a de sequência `apos` e retorna a mais recente.
+
+        Sem `apos`, espera uma leitura que chegue depois da chamada. Retorna None se nada
+        chegar em `tempo_limite` segundos.
+        """
+        with self._condicao:
+            if apos is None:
+                apos = self.sequencia
+            if not self._condicao.wait_for(lambda: self.sequencia > apos, tempo_limite):
+                return None
+            return self._amostra(self.sequencia)
+
+    def historico(self, quantidade):
+        """As últimas `quantidade` leituras ainda no buffer, da mais antiga para a mais recente."""
+        with self._condicao:
+            quantidade = min(quantidade, self.capacidade, self.sequencia)
+            primeira = self.sequencia - quantidade + 1
+            return [self._amostra(sequencia) for sequencia in range(primeira, self.sequencia + 1)]
+
+    def _amostra(self, sequencia):
+        posicao = (sequencia - 1) % self.capacidade
+        inicio = posicao * self.largura
+        valores = self._valores[inicio : inicio + self.largura].tolist()
+        return Amostra(sequencia, self._instantes[posicao], valores)
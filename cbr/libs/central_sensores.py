@@ -0,0 +1,249 @@
+# Central de leitura dos sensores do brick
+#
+# Uma única thread atende todos os sensores, no lugar de uma thread por placa que dormia
+# um intervalo fixo depois de cada leitura. Cada placa serial é registrada com o seu
+# transporte e um período: a central envia a requisição da placa nos instantes marcados,
+# que seguem uma grade fixa (o tempo gasto numa leitura não empurra as seguintes), e
+# espera os bytes de todas as portas ao mesmo tempo num `selectors`, entregando cada
+# resposta ao driver assim que ela fica completa. Sensores sem porta para esperar, como
+# os VL53L0X no I2C, são tarefas periódicas curtas executadas na mesma thread.
+#
+# `estatisticas` mostra, por dispositivo, a frequência real das leituras, o atraso dos
+# envios em relação à grade e a ocupação: nas placas seriais, a fração da capacidade da
+# porta usada pelos bytes trocados (ida e volta somadas); nas tarefas, a fração do tempo
+# gasta nelas. A ocupação da própria thread da central também aparece.
+import os
+import selectors
+import threading
+import time
+
+from libs.util import singleton
+
+BITS_POR_BYTE = 10  # 8 bits de dados com os bits de início e de parada
+
+
+class _Dispositivo:
+    def __init__(self, nome, periodo, transporte=None, requisicao=None, tratar=None, tarefa=None):
+        self.nome = nome
+        self.periodo = periodo
+        self.transporte = transporte
+        self.requisicao = requisicao
+        self.tratar = tratar
+        self.tarefa = tarefa
+        # Guardado no registro: a porta pode ser fechada antes de o dispositivo ser removido
+        self.descritor = transporte.ser.fileno() if transporte is not None else None
+        self.proximo = time.monotonic()
+        self.zerar_contadores()
+
+    def zerar_contadores(self):
+        self.inicio = time.monotonic()
+        self.envios = 0
+        self.envios_ignorados = 0
+        self.leituras = 0
+        self.atraso_total = 0.0
+        self.atraso_maximo = 0.0
+        self.tempo_ocupado = 0.0
+        if self.transporte is not None:
+            self.transporte.zerar_contadores()
+
+
+@singleton
+class CentralSensores:
+    # Espera máxima do laço, para conferir se a central foi parada
+    INTERVALO_MAXIMO = 0.5
+
+    def __init__(self):
+        self._seletor = selectors.DefaultSelector()
+        # Quem registra ou remove um dispositivo acorda o laço por este pipe
+        self._aviso_leitura, self._aviso_escrita = os.pipe()
+        os.set_blocking(self._aviso_leitura, False)
+        os.set_blocking(self._aviso_escrita, False)
+        self._seletor.register(self._aviso_leitura, selectors.EVENT_READ)
+        self._dispositivos = {}
+        # A thread só mexe nos dispositivos com a trava, então depois de `remover` a porta
+        # do dispositivo fica livre para o driver
+        self._trava = threading.RLock()
+        self._ativa = False
+        self._thread = None
+        self._inicio = time.monotonic()
+        self._tempo_ocupado = 0.0
+
+    def registrar(self, chave, nome, transporte, requisicao, tratar, periodo):
+        """Lê uma placa serial a cada `periodo` segundos.
+
+        `requisicao()` retorna a requisição e o tamanho da resposta, e `tratar(resposta)`
+        recebe cada resposta a uma requisição igual à atual.
+        """
+        with self._trava:
+            self.remover(chave)
+            dispositivo = _Dispositivo(
+                nome, periodo, transporte=transporte, requisicao=requisicao, tratar=tratar
+            )
+            self._dispositivos[chave] = dispositivo
+            self._seletor.register(dispositivo.descritor, selectors.EVENT_READ, dispositivo)
+        self._acordar()
+
+    def agendar(self, chave, nome, tarefa, periodo):
+        """Executa `tarefa()` a cada `periodo` segundos na thread da central."""
+        with self._trava:
+            self.remover(chave)
+            self._dispositivos[chave] = _Dispositivo(nome, periodo, tarefa=tarefa)
+        self._acordar()
+
+    def remover(self, chave):
+        """Para as leituras do dispositivo. Não faz nada se ele não estiver registrado."""
+        with self._trava:
+            dispositivo = self._dispositivos.pop(chave, None)
+            if dispositivo is not None and dispositivo.descritor is not None:
+                self._seletor.unregister(dispositivo.descritor)
+
+    def _remover_dispositivo(self, dispositivo):
+        for chave, registrado in list(self._dispositivos.items()):
+            if registrado is dispositivo:
+                self.remover(chave)
+
+    def mudar_periodo(self, chave, periodo):
+        with self._trava:
+            dispositivo = self._dispositivos[chave]
+            dispositivo.periodo = periodo
+            dispositivo.proximo = time.monotonic()
+        self._acordar()
+
+    def registrado(self, chave):
+        return chave in self._dispositivos
+
+    def zerar_contadores(self):
+        with self._trava:
+            self._inicio = time.monotonic()
+            self._tempo_ocupado = 0.0
+            for dispositivo in self._dispositivos.values():
+                dispositivo.zerar_contadores()
+
+    def estatisticas(self):
+        """Contadores desde o registro ou o último `zerar_contadores`, por nome do dispositivo.
+
+        A chave None traz a ocupação da thread da central.
+        """
+        with self._trava:
+            agora = time.monotonic()
+            estatisticas = {None: {'ocupacao': self._tempo_ocupado / max(agora - self._inicio, 1e-9)}}
+            for dispositivo in self._dispositivos.values():
+                intervalo = max(agora - dispositivo.inicio, 1e-9)
+                linha = {
+                    'periodo_ms': 1000 * dispositivo.periodo,
+                    'frequencia_hz': dispositivo.leituras / intervalo,
+                    'envios_ignorados': dispositivo.envios_ignorados,
+                    'atraso_medio_ms': 1000 * dispositivo.atraso_total / max(dispositivo.envios, 1),
+                    'atraso_maximo_ms': 1000 * dispositivo.atraso_maximo,
+                }
+                if dispositivo.transporte is None:
+                    linha['ocupacao'] = dispositivo.tempo_ocupado / intervalo
+                else:
+                    transporte = dispositivo.transporte
+                    bits = BITS_POR_BYTE * (transporte.bytes_enviados + transporte.bytes_recebidos)
+                    linha['ocupacao'] = bits / (transporte.ser.baudrate * intervalo)
+                    linha.update(transporte.estatisticas())
+                estatisticas[dispositivo.nome] = linha
+            return estatisticas
+
+    def imprime_estatisticas(self):
+        estatisticas = self.estatisticas()
+        print(
+            f'{"Dispositivo":<28} {"Período":>8} {"Leituras/s":>10} {"Atraso máx.":>11} {"Ocupação":>9}'
+        )
+        for nome, linha in estatisticas.items():
+            if nome is None:
+                continue
+            print(
+                f'{nome:<28} {linha["periodo_ms"]:>6.0f}ms {linha["frequencia_hz"]:>10.1f}'
+                f' {linha["atraso_maximo_ms"]:>9.2f}ms {linha["ocupacao"]:>9.1%}'
+            )
+        print(f'{"Thread da central":<28} {"":>8} {"":>10} {"":>11} {estatisticas[None]["ocupacao"]:>9.1%}')
+
+    def parar(self):
+        """Para a thread da central. Os dispositivos continuam registrados para a próxima."""
+        self._ativa = False
+        self._avisar()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _acordar(self):
+        if self._ativa:
+            self._avisar()
+            return
+        self._ativa = True
+        self._thread = threading.Thread(target=self._executar)
+        self._thread.daemon = True  # Permite que o programa principal encerre mesmo com a thread ativa
+        self._thread.start()
+
+    def _avisar(self):
+        try:
+            os.write(self._aviso_escrita, b'\0')
+        except BlockingIOError:
+            pass  # Com o pipe cheio o laço já vai acordar
+
+    def _executar(self):
+        while self._ativa:
+            with self._trava:
+                proximos = [dispositivo.proximo for dispositivo in self._dispositivos.values()]
+            espera = self.INTERVALO_MAXIMO
+            if proximos:
+                espera = min(max(min(proximos) - time.monotonic(), 0), espera)
+            eventos = self._seletor.select(espera)
+            inicio = time.monotonic()
+            with self._trava:
+                for chave, _ in eventos:
+                    if chave.fileobj == self._aviso_leitura:
+                        try:
+                            os.read(self._aviso_leitura, 1024)
+                        except BlockingIOError:
+                            pass
+                    elif chave.data in self._dispositivos.values():
+                        self._receber(chave.data)
+                agora = time.monotonic()
+                for dispositivo in list(self._dispositivos.values()):
+                    if agora >= dispositivo.proximo:
+                        self._disparar(dispositivo, agora)
+                self._tempo_ocupado += time.monotonic() - inicio
+
+    def _disparar(self, dispositivo, agora):
+        atraso = agora - dispositivo.proximo
+        dispositivo.atraso_total += atraso
+        dispositivo.atraso_maximo = max(dispositivo.atraso_maximo, atraso)
+        dispositivo.proximo += dispositivo.periodo
+        if dispositivo.proximo <= agora:
+            # Ficou para trás (como depois de uma tarefa lenta): pula os instantes perdidos
+            dispositivo.proximo = agora + dispositivo.periodo
+        dispositivo.envios += 1
+        if dispositivo.tarefa is not None:
+            inicio = time.monotonic()
+            if dispositivo.tarefa():
+                dispositivo.leituras += 1
+            dispositivo.tempo_ocupado += time.monotonic() - inicio
+            return
+        requisicao, tamanho_resposta = dispositivo.requisicao()
+        try:
+            enviou = dispositivo.transporte.enviar(requisicao, tamanho_resposta)
+        except OSError as e:
+            print(f'Erro ao escrever em {dispositivo.nome}, leituras paradas: {e}')
+            self._remover_dispositivo(dispositivo)
+            return
+        if not enviou:
+            # As respostas anteriores ainda não chegaram: a placa não dá conta do período
+            dispositivo.envios_ignorados += 1
+
+    def _receber(self, dispositivo):
+        requisicao, _ = dispositivo.requisicao()
+        try:
+            # O seletor avisou que a porta tem o que ler
+            quadros = dispositivo.transporte.receber(pronta=True)
+        except OSError as e:
+            # A porta foi fechada ou a placa desconectada: a central segue com as outras
+            print(f'Erro ao ler {dispositivo.nome}, leituras paradas: {e}')
+            self._remover_dispositivo(dispositivo)
+            return
+        for pedido, resposta in quadros:
+            if pedido == requisicao:
+                dispositivo.tratar(resposta)
+                dispositivo.leituras += 1
@@ -1,17 +1,20 @@
 import os
-import time
+
+from libs.relogio import Relogio
 
 
 # retorna um tempo passado em milisegundos
 class Cronometro:
     # se a criação do cronometro for sem nome de arquivo, ele não salva o tempo em arquivos
     # essa situação é utilizaza para cronometros temporarios
-    def __init__(self, nome_arquivo=None):
+    # relogio: de onde vem o tempo, um RelogioVirtual para cronometrar tempo simulado
+    def __init__(self, nome_arquivo=None, relogio=None):
         self.nome_arquivo = nome_arquivo
+        self.relogio = relogio or Relogio()
         self.tempo_inicial = None
 
     def inicia(self):
-        self.tempo_inicial = time.time()
+        self.tempo_inicial = self.relogio.agora()
         if self.nome_arquivo is not None:
             self.salva()
 
@@ -23,14 +26,14 @@ class Cronometro:
             os.system(str(temp))
 
     def reseta(self):
-        self.tempo_inicial = time.time()
+        self.tempo_inicial = self.relogio.agora()
         self.salva()
 
     # retorna o tempo passado em milisegundos
     def tempo(self):
         if self.tempo_inicial is None:
             return None
-        return int(time.time() * 1000 - self.tempo_inicial * 1000)
+        return int(self.relogio.agora() * 1000 - self.tempo_inicial * 1000)
 
     def salva(self):
         if self.nome_arquivo is not None:
@@ -43,5 +46,5 @@ class Cronometro:
                 with open(self.nome_arquivo, 'r') as f:
                     self.tempo_inicial = float(f.read())
             except:  # se não conseguir carregar o arquivo, inicia o cronometro
-                self.tempo_inicial = time.time()
+                self.tempo_inicial = self.relogio.agora()
                 self.salva()
@@ -1,9 +1,11 @@
 import struct
-import threading
 import time
 
+from libs.amostras import BufferAmostras
+from libs.central_sensores import CentralSensores
 from libs.cronometro import Cronometro
 from libs.portas import Portas
+from libs.transporte_serial import TransporteSerial
 
 
 class Giroscopio:
@@ -12,44 +14,54 @@ class Giroscopio:
     GYRO_CAL = 2
     modo = 0
     quantidade_bytes_modo = 8
+    _ANGULO = struct.Struct('>h')  # inteiro de 16 bits com sinal
 
-    def __init__(self, porta_serial):
-        # 8 valores
-        self.lista = [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
+    def __init__(self, porta_serial, periodo=0.025):
+        # 8 valores, com um segundo buffer que recebe a próxima resposta
+        self.lista = bytearray(8)
+        self._lista_escrita = bytearray(8)
         portas = Portas()
         self.ser = portas.abre_porta_serial(porta_serial, 115200)
         if self.ser is None:
             raise Exception('Erro ao abrir a porta serial do giroscopio')
+        self.transporte = TransporteSerial(self.ser)
         self.set_modo(self.GYRO)
-        self._thread_ativa = False
-        self._thread = None
-        self._iniciar_thread()
+        # Cada resposta da placa, com o instante em que chegou
+        self.amostras = BufferAmostras(8)
+        self._sequencia_lida = 0
+        self.periodo = periodo
+        self._iniciar_leituras()
 
     def __del__(self):
-        """Destrutor da classe. Para a thread e fecha a porta serial."""
-        self._parar_thread()
+        """Destrutor da classe. Tira a placa da central de sensores e fecha a porta serial."""
+        self._parar_leituras()
         if self.ser is not None:
             self.ser.close()
 
-    def _atualiza_periodicamente(self):
-        """Função que chama `atualiza` a cada 25ms."""
-        while self._thread_ativa:
-            self.atualiza()
-            time.sleep(0.025)
-
-    def _iniciar_thread(self):
-        """Inicia a thread para chamar `atualiza` periodicamente."""
-        if not self._thread_ativa:
-            self._thread_ativa = True
-            self._thread = threading.Thread(target=self._atualiza_periodicamente)
-            self._thread.daemon = True  # Permite que o programa principal encerre mesmo com a thread ativa
-            self._thread.start()
-
-    def _parar_thread(self):
-        """Para a thread que chama `atualiza`."""
-        self._thread_ativa = False
-        if self._thread is not None:
-            self._thread.join()
+    def _iniciar_leituras(self):
+        """Registra a placa na central de sensores, que pede uma leitura a cada `periodo` segundos."""
+        CentralSensores().registrar(
+            self,
+            f'Giroscopio {self.ser.port}',
+            self.transporte,
+            self._requisicao,
+            self._trata_resposta,
+            self.periodo,
+        )
+
+    def _parar_leituras(self):
+        """Tira a placa da central de sensores, deixando a porta livre para o driver."""
+        CentralSensores().remover(self)
+
+    def _requisicao(self):
+        return bytes([self.modo]), self.quantidade_bytes_modo
+
+    def _trata_resposta(self, dados):
+        # Copia a resposta para o buffer livre e troca os dois: quem lê `lista` sempre vê uma
+        # resposta inteira, e nenhuma lista nova é criada a cada resposta
+        self._lista_escrita[: len(dados)] = dados
+        self.lista, self._lista_escrita = self._lista_escrita, self.lista
+        self.amostras.publicar(dados)
 
     def set_modo(self, modo):
         if modo < 0 or modo > 2:
@@ -60,38 +72,42 @@ class Giroscopio:
         elif modo == self.GYRO_CAL:
             self.quantidade_bytes_modo = 1
 
+    def espera_leitura(self, tempo_limite=0.1):
+        """Dorme até chegar uma leitura mais nova que a da última espera. Retorna se ela chegou a tempo."""
+        amostra = self.amostras.espera_proxima(tempo_limite, apos=self._sequencia_lida)
+        if amostra is None:
+            return False
+        self._sequencia_lida = amostra.sequencia
+        return True
+
+    def idade_leitura(self):
+        """Segundos desde a última leitura, ou None se nenhuma chegou."""
+        amostra = self.amostras.ultima()
+        return None if amostra is None else amostra.idade()
+
     def atualiza(self):
-        # limpo o buffer de entrada
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
-        # Envia o comando para solicitar o bytes necessarios
-        self.ser.write(bytes([self.modo]))
-
-        # Aguarda receber os self.quantidade_bytes_modo bytes via serial
-        dados = self.ser.read(self.quantidade_bytes_modo)
-        # print(self.quantidade_bytes_modo)
-        # print(dados)
-        # Verifica se recebeu exatamente self.quantidade_bytes_modo bytes
-        if len(dados) == self.quantidade_bytes_modo:
-            # Atualiza a lista com os valores recebidos
-            self.lista = list(dados)
+        # Pede a próxima leitura e trata a resposta mais recente, que normalmente já chegou
+        dados = self.transporte.consultar(*self._requisicao())
+
+        if dados is not None:
+            self._trata_resposta(dados)
             return True
         else:
             return False
 
     def le_angulo_x(self):
-        # tenho q usar struct pra pegar dois bytes da lista e transformar em inteiro com sinal
-        angulo_x = struct.unpack('>h', bytes(self.lista[0:2]))[0]
+        # dois bytes da lista lidos direto como inteiro com sinal, sem copiar
+        angulo_x = self._ANGULO.unpack_from(self.lista, 0)[0]
         return angulo_x
 
     def le_angulo_y(self):
-        # tenho q usar struct pra pegar dois bytes da lista e transformar em inteiro com sinal
-        angulo_y = struct.unpack('>h', bytes(self.lista[2:4]))[0]
+        # dois bytes da lista lidos direto como inteiro com sinal, sem copiar
+        angulo_y = self._ANGULO.unpack_from(self.lista, 2)[0]
         return angulo_y
 
     def le_angulo_z(self):
-        # tenho q usar struct pra pegar dois bytes da lista e transformar em inteiro com sinal
-        angulo_z = struct.unpack('>h', bytes(self.lista[4:6]))[0]
+        # dois bytes da lista lidos direto como inteiro com sinal, sem copiar
+        angulo_z = self._ANGULO.unpack_from(self.lista, 4)[0]
         return -angulo_z
 
     def reseta_z(self):
@@ -103,10 +119,12 @@ class Giroscopio:
         time.sleep(0.025)
 
     def calibra(self):
-        self._parar_thread()
+        self._parar_leituras()
         self.set_modo(self.GYRO_CAL)
         tempo = Cronometro()
         tempo.inicia()
+        # A calibração usa a porta diretamente, sem as leituras que estavam a caminho
+        self.transporte.descartar()
         # Aguarda 5 segundos para a calibração
         self.ser.write(bytes([self.modo]))  # envio o modo novo de calibração
         while tempo.tempo() < 5000:
@@ -116,7 +134,7 @@ class Giroscopio:
                 # Atualiza a lista com os valores recebidos
                 break
         self.set_modo(self.GYRO)
-        self._iniciar_thread()
+        self._iniciar_leituras()
         if tempo.tempo() >= 5000:
             print('Tempo de calibração excedido')
             return False
@@ -1,19 +1,19 @@
 # Classe para controlar os motores e servos da placa do Motores do novo brick
+#
+# Com assincrono=True, uma thread é a única que fala com a placa: os comandos só marcam o
+# quadro de motores, de servos ou de PID como alterado, e a thread envia apenas os quadros
+# alterados, sempre com o valor mais recente (comandos seguidos viram um só envio). Sem
+# quadros para enviar, a thread pede o estado da placa, e os ângulos e o estado dos
+# motores das respostas ficam nos mesmos atributos do modo síncrono, sem bloquear quem
+# comanda. Os movimentos por ângulo esperam a placa confirmar o quadro, e `estado` espera
+# a próxima resposta da placa.
 import struct
-import time
+import threading
 
 from libs.portas import Portas
-
-
-def singleton(cls):
-    instances = {}
-
-    def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
-
-    return get_instance
+from libs.relogio import Relogio
+from libs.transporte_serial import TransporteSerial
+from libs.util import singleton
 
 
 @singleton
@@ -36,28 +36,188 @@ class Motores:
     GIRANDO_NORMAL = 1
     GIRANDO_INVERTIDO = 2
     atualiza_instantaneo = False
+    assincrono = False
     ser = None
+    # Intervalo entre pedidos de estado da thread quando não há comando para enviar
+    PERIODO_ESTADO = 0.005
+    # Tempo máximo esperando uma resposta da thread antes de considerar erro
+    TEMPO_ESPERA_RESPOSTA = 0.1
+    # Resposta de 10 bytes da placa: comando, ângulo absoluto dos motores 1 e 2 e estado
+    _RESPOSTA = struct.Struct('>BiiB')
 
-    def __init__(self, atualiza_instantaneo=False):
+    # relogio: usado nas esperas dos comandos, um RelogioVirtual para simular sem esperar
+    # porta: a porta da placa ou o caminho de um dispositivo serial, como o de um emulador
+    # assincrono: envia os comandos pela thread de escrita em vez de esperar cada resposta
+    def __init__(self, atualiza_instantaneo=False, relogio=None, porta=Portas._SERIAL0, assincrono=False):
+        self.relogio = relogio or Relogio()
         self.lista_servos = [0xFD, 200, 200, 200, 200, 200, 200, 0, 0, 0]
         self.lista_motores = [0xFC, 0, 0, 0, 0, 0, 0, 0, 0, 0]
         self.lista_pid = [0xFE, 0, 0, 0, 0, 0, 0]
         portas = Portas()
-        self.ser = portas.abre_porta_serial(Portas._SERIAL0, 250000)
+        self.ser = portas.abre_porta_serial(porta, 250000)
         if self.ser is None:
             raise Exception('Erro ao abrir a porta serial')
+        self.transporte = TransporteSerial(self.ser)
         self.atualiza_instantaneo = atualiza_instantaneo
         self.atualiza_motores()
         self.atualiza_servos()
         self.reseta_angulo_motor(1)
         self.reseta_angulo_motor(2)
 
+        # No modo assíncrono todo comando é enviado, pela thread
+        self.atualiza_instantaneo = atualiza_instantaneo or assincrono
+        self.assincrono = assincrono
+        self._condicao = threading.Condition()
+        # Último quadro de motores pedido e ainda não enviado, e quadros alterados de servos e PID
+        self._quadro_motores = None
+        self._servos_alterados = False
+        self._pid_alterado = False
+        self._estado_pedido = False
+        # Quadro de motores que falhou e deve ser reenviado igual, se não vier outro
+        self._quadro_motores_pendente = None
+        # Versão do quadro de motores pedida e a última confirmada pela placa
+        self._versao_motores = 0
+        self._versao_motores_confirmada = 0
+        # Requisições enviadas pela thread e número da última respondida com sucesso
+        self._requisicoes = 0
+        self._ultima_resposta = 0
+        self._thread_ativa = False
+        self._thread = None
+        if assincrono:
+            self._iniciar_thread()
+
     def __del__(self):
+        # Sem a thread, a parada final vai direto pela porta
+        self._parar_thread()
+        self.assincrono = False
+        if not self.ser.is_open:
+            return
         self.para_motores()
         self.ser.close()
         if self.DEBUG:
             print('Fechando a porta serial do motores')
 
+    def _iniciar_thread(self):
+        """Inicia a thread que envia os quadros alterados e lê o estado da placa."""
+        if not self._thread_ativa:
+            self._thread_ativa = True
+            self._thread = threading.Thread(target=self._escreve_periodicamente)
+            self._thread.daemon = True  # Permite que o programa principal encerre mesmo com a thread ativa
+            self._thread.start()
+
+    def _parar_thread(self):
+        """Para a thread de escrita."""
+        with self._condicao:
+            self._thread_ativa = False
+            self._condicao.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _agenda(self, motores=False, servos=False, pid=False, aguardar=False):
+        """No modo assíncrono, marca os quadros alterados para a thread e retorna True.
+
+        Com `aguardar`, espera a placa confirmar o quadro de motores.
+        """
+        if not self.assincrono:
+            return False
+        with self._condicao:
+            if motores:
+                self._quadro_motores = bytes(self.lista_motores)
+                self._versao_motores += 1
+                # Zerados como em atualiza_motores: o ângulo só vale para o quadro em que foi pedido
+                self.angulo_motor1 = 0
+                self.angulo_motor2 = 0
+                self.lista_motores[5:9] = [0, 0, 0, 0]
+            self._servos_alterados |= servos
+            self._pid_alterado |= pid
+            self._condicao.notify_all()
+            if aguardar:
+                versao = self._versao_motores
+                confirmou = self._condicao.wait_for(
+                    lambda: self._versao_motores_confirmada >= versao, self.TEMPO_ESPERA_RESPOSTA
+                )
+                if not confirmou:
+                    raise Exception('Erro ao ler o estado dos motores')
+        return True
+
+    def _aguarda_estado(self):
+        """Espera a thread receber o estado de uma requisição feita depois desta chamada."""
+        with self._condicao:
+            requisicao = self._requisicoes + 1
+            self._estado_pedido = True
+            self._condicao.notify_all()
+            if not self._condicao.wait_for(
+                lambda: self._ultima_resposta >= requisicao, self.TEMPO_ESPERA_RESPOSTA
+            ):
+                raise Exception('Erro ao ler o estado dos motores')
+        return True
+
+    def _escreve_periodicamente(self):
+        """Envia os quadros alterados, ou pede o estado, enquanto a thread estiver ativa."""
+        while True:
+            with self._condicao:
+                self._condicao.wait_for(
+                    lambda: not self._thread_ativa
+                    or self._quadro_motores is not None
+                    or self._servos_alterados
+                    or self._pid_alterado
+                    or self._estado_pedido
+                    or self._quadro_motores_pendente is not None,
+                    self.PERIODO_ESTADO,
+                )
+                if not self._thread_ativa:
+                    return
+                if self._quadro_motores is not None:
+                    quadro_motores, versao = self._quadro_motores, self._versao_motores
+                    self._quadro_motores = None
+                elif self._quadro_motores_pendente is not None:
+                    quadro_motores, versao = self._quadro_motores_pendente
+                else:
+                    # Sem comando novo: só lê o estado, com o quadro atual e o comando 0xFB
+                    quadro_motores, versao = None, None
+                    quadro_estado = bytes([0xFB]) + bytes(self.lista_motores[1:])
+                quadro_servos = bytes(self.lista_servos) if self._servos_alterados else None
+                self._servos_alterados = False
+                quadro_pid = bytes(self.lista_pid) if self._pid_alterado else None
+                self._pid_alterado = False
+                self._estado_pedido = False
+                self._requisicoes += 1
+                requisicao = self._requisicoes
+
+            if quadro_pid is not None:
+                self.transporte.enviar(quadro_pid, 0)
+            if quadro_servos is not None:
+                self.transporte.trocar(quadro_servos, 1, cabecalho=0xFD)
+            if quadro_motores is None:
+                ok = self._publica_estado(self.transporte.trocar(quadro_estado, 10, cabecalho=0xFB), 0xFB)
+            else:
+                # A placa responde 0xFC aos comandos de velocidade e de potência
+                ok = self._publica_estado(self.transporte.trocar(quadro_motores, 10, cabecalho=0xFC), 0xFC)
+
+            with self._condicao:
+                if quadro_motores is not None:
+                    if ok:
+                        self._versao_motores_confirmada = max(self._versao_motores_confirmada, versao)
+                        self._quadro_motores_pendente = None
+                    elif self._quadro_motores is None:
+                        # Se a placa não respondeu, o mesmo quadro é reenviado, a menos que já haja outro
+                        self._quadro_motores_pendente = (quadro_motores, versao)
+                    else:
+                        self._quadro_motores_pendente = None
+                if ok:
+                    self._ultima_resposta = requisicao
+                self._condicao.notify_all()
+
+    def _publica_estado(self, retorno_serial, comando):
+        """Guarda os ângulos e o estado de uma resposta de 10 bytes ao `comando`. Retorna se ela era válida."""
+        if retorno_serial is not None and len(retorno_serial) == 10 and retorno_serial[0] == comando:
+            _, self.angulo_absoluto_motor1, self.angulo_absoluto_motor2, self.estado_motores = (
+                self._RESPOSTA.unpack_from(retorno_serial)
+            )
+            return True
+        return False
+
     def move_servo(self, servo, angulo, tempo=0):
         if servo <= 0:
             return
@@ -79,25 +239,24 @@ class Motores:
         for angulo_atual in range(angulo_inicial, angulo + passo, passo):
             self.lista_servos[servo] = angulo_atual
             self.atualiza_servos()
-            time.sleep(tempo)
+            self.relogio.dormir(tempo)
 
 
     def atualiza_servos(self):
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
-        self.ser.write(bytes(self.lista_servos))
+        if self._agenda(servos=True):
+            return True
+        retorno_serial = self.transporte.trocar(bytes(self.lista_servos), 1, cabecalho=0xFD)
         if self.DEBUG:
             print(f'Enviando: {self.lista_servos}')
-        retorno_serial = self.ser.read(1)
-        if len(retorno_serial) == 1:
+        if retorno_serial is not None:
             if retorno_serial[0] == 0xFD:
                 return True
         raise Exception('Erro ao ler o estado dos servos')
 
     def atualiza_motores(self):
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
-        self.ser.write(bytes(self.lista_motores))
+        if self._agenda(motores=True):
+            return True
+        quadro = bytes(self.lista_motores)
         if self.DEBUG:
             print(f'Enviando: {self.lista_motores}')
         self.angulo_motor1 = 0  # assim q envio zero isso pq zerado ele nao anda por angulo
@@ -108,32 +267,34 @@ class Motores:
         self.lista_motores[8] = 0
         # leio o retorno da serial e salvo na lista
 
-        retorno_serial = self.ser.read(10)
+        retorno_serial = self.transporte.trocar(quadro, 10, cabecalho=0xFC) or b''
         if self.DEBUG:
-            print(f'retorno_serial: {retorno_serial}')
+            print(f'retorno_serial: {bytes(retorno_serial)}')
         if len(retorno_serial) == 10:  # só leio se o retorno for exatamente 10 bytes
             if retorno_serial[0] == 0xFC:
-                self.angulo_absoluto_motor1 = struct.unpack('>i', bytes(retorno_serial[1:5]))[0]
-                self.angulo_absoluto_motor2 = struct.unpack('>i', bytes(retorno_serial[5:9]))[0]
-                self.estado_motores = retorno_serial[9]
+                _, self.angulo_absoluto_motor1, self.angulo_absoluto_motor2, self.estado_motores = (
+                    self._RESPOSTA.unpack_from(retorno_serial)
+                )
                 return True
         raise Exception('Erro ao ler o estado dos motores')
 
     # funcao que envia informacao mas sem atualizar velocidades do controlador de motor
     def estado(self):
+        if self.assincrono:
+            return self._aguarda_estado()
         temp = self.lista_motores[0]
         self.lista_motores[0] = 0xFB
-        self.ser.write(bytes(self.lista_motores))
+        quadro = bytes(self.lista_motores)
         if self.DEBUG:
             print(f'Enviando: {self.lista_motores}')
         self.lista_motores[0] = temp
         # leio o retorno da serial e salvo na lista
-        retorno_serial = self.ser.read(10)
+        retorno_serial = self.transporte.trocar(quadro, 10, cabecalho=0xFB) or b''
         if len(retorno_serial) == 10:  # só leio se o retorno for exatamente 10 bytes
             if retorno_serial[0] == 0xFB:
-                self.angulo_absoluto_motor1 = struct.unpack('>i', bytes(retorno_serial[1:5]))[0]
-                self.angulo_absoluto_motor2 = struct.unpack('>i', bytes(retorno_serial[5:9]))[0]
-                self.estado_motores = retorno_serial[9]
+                _, self.angulo_absoluto_motor1, self.angulo_absoluto_motor2, self.estado_motores = (
+                    self._RESPOSTA.unpack_from(retorno_serial)
+                )
                 if self.DEBUG:
                     print('Estado atualizado')
                 return True
@@ -199,9 +360,11 @@ class Motores:
         self.lista_motores[motor] = struct.pack('b', velocidade)[0]
         self.lista_motores[posicao_angulo_lista] = (angulo >> 8) & 0xFF  # pego o byte mais significativo
         self.lista_motores[posicao_angulo_lista + 1] = angulo & 0xFF  # pego o byte menos significativo
+        if self._agenda(motores=True, aguardar=True):
+            return
         if self.atualiza_instantaneo:
             self.atualiza_motores()
-            time.sleep(0.05)
+            self.relogio.dormir(0.05)
 
     # Função que move os motores 1 e 2 ao mesmo tempo
     # velocidade1 e velocidade2 são os valores de velocidade dos motores, angulo1 e angulo2 são os angulos que os motores devem se mover
@@ -231,9 +394,11 @@ class Motores:
         self.angulo_motor2 = angulo2
         self.lista_motores[7] = (angulo2 >> 8) & 0xFF  # pego o byte mais significativo
         self.lista_motores[8] = angulo2 & 0xFF
+        if self._agenda(motores=True, aguardar=True):
+            return
         if self.atualiza_instantaneo:
             self.atualiza_motores()
-            time.sleep(0.05)
+            self.relogio.dormir(0.05)
             self.atualiza_servos()
 
     # Função que move para sempre os motores 1 e 2 ao mesmo tempo
@@ -252,9 +417,11 @@ class Motores:
         if self.motor_invertido[motor - 1]:
             velocidade2 = -velocidade2
         self.lista_motores[motor] = struct.pack('b', int(velocidade2))[0]
+        if self._agenda(motores=True):
+            return
         if self.atualiza_instantaneo:
             self.atualiza_motores()
-            time.sleep(0.025)
+            self.relogio.dormir(0.025)
             self.atualiza_servos()
 
     # Função que move para sempre os motores 1 e 2 ao mesmo tempo
@@ -273,6 +440,8 @@ class Motores:
         if self.motor_invertido[motor - 1]:
             potencia2 = -potencia2
         self.lista_motores[motor] = struct.pack('b', int(potencia2))[0]
+        if self._agenda(motores=True):
+            return
         if self.atualiza_instantaneo:
             self.atualiza_motores()
             self.atualiza_servos()
@@ -320,7 +489,9 @@ class Motores:
         self.lista_pid[4] = ki & 0xFF
         self.lista_pid[5] = (kd >> 8) & 0xFF
         self.lista_pid[6] = kd & 0xFF
-        self.ser.write(bytes(self.lista_pid))
+        if self._agenda(pid=True):
+            return
+        self.transporte.enviar(bytes(self.lista_pid), 0)
         if self.DEBUG:
             print(f'Enviando PID: kp={kp}, ki={ki}, kd={kd} -> {self.lista_pid}')
         # Opcional: ler resposta da placa, se necessário
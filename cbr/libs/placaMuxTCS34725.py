@@ -1,8 +1,8 @@
 import struct
-import threading
-import time
 
+from libs.central_sensores import CentralSensores
 from libs.portas import Portas
+from libs.transporte_serial import TransporteSerial
 
 
 class PlacaMuxTCS34725:
@@ -12,44 +12,50 @@ class PlacaMuxTCS34725:
     RGB_16X_LED_OFF = 3
     modo = 0
     quantidade_bytes_modo = 32
+    _RGBC = struct.Struct('>hhhh')  # r, g, b e c, inteiros de 16 bits com sinal
 
-    def __init__(self, porta_serial):
-        self.lista = [
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # fmt: skip
+    def __init__(self, porta_serial, periodo=0.025):
+        # 32 valores, com um segundo buffer que recebe a próxima resposta
+        self.lista = bytearray(32)
+        self._lista_escrita = bytearray(32)
         portas = Portas()
         self.ser = portas.abre_porta_serial(porta_serial, 115200)
         if self.ser is None:
             raise Exception('Erro ao abrir a porta serial da placa mux TCS34725')
+        self.transporte = TransporteSerial(self.ser)
         self.set_modo(self.RGB_4X)
-        self._thread_ativa = False
-        self._thread = None
-        self._iniciar_thread()
+        self.periodo = periodo
+        self._iniciar_leituras()
 
     def __del__(self):
-        """Destrutor da classe. Para a thread e fecha a porta serial."""
-        self._parar_thread()
+        """Destrutor da classe. Tira a placa da central de sensores e fecha a porta serial."""
+        self._parar_leituras()
         if self.ser is not None:
             self.ser.close()
 
-    def _atualiza_periodicamente(self):
-        """Função que chama `atualiza` a cada 25ms."""
-        while self._thread_ativa:
-            self.atualiza()
-            time.sleep(0.025)  # 25ms
+    def _iniciar_leituras(self):
+        """Registra a placa na central de sensores, que pede uma leitura a cada `periodo` segundos."""
+        CentralSensores().registrar(
+            self,
+            f'PlacaMuxTCS34725 {self.ser.port}',
+            self.transporte,
+            self._requisicao,
+            self._trata_resposta,
+            self.periodo,
+        )
 
-    def _iniciar_thread(self):
-        """Inicia a thread para chamar `atualiza` periodicamente."""
-        if not self._thread_ativa:
-            self._thread_ativa = True
-            self._thread = threading.Thread(target=self._atualiza_periodicamente)
-            self._thread.daemon = True  # Permite que o programa principal encerre mesmo com a thread ativa
-            self._thread.start()
+    def _parar_leituras(self):
+        """Tira a placa da central de sensores, deixando a porta livre para o driver."""
+        CentralSensores().remover(self)
 
-    def _parar_thread(self):
-        """Para a thread que chama `atualiza`."""
-        self._thread_ativa = False
-        if self._thread is not None:
-            self._thread.join()
+    def _requisicao(self):
+        return bytes([self.modo]), self.quantidade_bytes_modo
+
+    def _trata_resposta(self, dados):
+        # Copia a resposta para o buffer livre e troca os dois: quem lê `lista` sempre vê uma
+        # resposta inteira, e nenhuma lista nova é criada a cada resposta
+        self._lista_escrita[: len(dados)] = dados
+        self.lista, self._lista_escrita = self._lista_escrita, self.lista
 
     def set_modo(self, modo):
         if modo < 0 or modo >= 4:
@@ -57,19 +63,11 @@ class PlacaMuxTCS34725:
         self.modo = modo
 
     def atualiza(self):
-        # limpo o buffer de entrada
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
-        # Envia o comando para solicitar o bytes necessarios
-        self.ser.write(bytes([self.modo]))
-
-        # Aguarda receber os self.quantidade_bytes_modo bytes via serial
-        dados = self.ser.read(self.quantidade_bytes_modo)
+        # Pede a próxima leitura e trata a resposta mais recente, que normalmente já chegou
+        dados = self.transporte.consultar(*self._requisicao())
 
-        # Verifica se recebeu exatamente self.quantidade_bytes_modo bytes
-        if len(dados) == self.quantidade_bytes_modo:
-            # Atualiza a lista com os valores recebidos
-            self.lista = list(dados)
+        if dados is not None:
+            self._trata_resposta(dados)
             return True
         else:
             return False
@@ -78,10 +76,5 @@ class PlacaMuxTCS34725:
         # Atualiza os dados antes de ler
         if porta < 0 or porta > 3:
             raise ValueError('Porta inválida. Deve ser 0, 1, 2 ou 3.')
-        # tenho que usar struct pra pegar dois bytes da lista e transformar em inteiro com sinal
-        indice = porta * 4
-        r = struct.unpack('>h', bytes(self.lista[indice : indice + 2]))[0]
-        g = struct.unpack('>h', bytes(self.lista[indice + 2 : indice + 4]))[0]
-        b = struct.unpack('>h', bytes(self.lista[indice + 4 : indice + 6]))[0]
-        c = struct.unpack('>h', bytes(self.lista[indice + 6 : indice + 8]))[0]
-        return (r, g, b, c)
+        # os quatro valores de dois bytes lidos direto da lista, sem copiar
+        return self._RGBC.unpack_from(self.lista, porta * 4)
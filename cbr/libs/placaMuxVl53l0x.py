@@ -1,71 +1,66 @@
 import struct
-import threading
-import time
 
+from libs.central_sensores import CentralSensores
 from libs.portas import Portas
+from libs.transporte_serial import TransporteSerial
 
 
 class PlacaMuxVl53l0x:
     DISTANCIA_4_PORTAS = 0
     modo = 0
     quantidade_bytes_modo = 16
+    _VALOR = struct.Struct('>h')  # inteiro de 16 bits com sinal
 
-    def __init__(self, porta_serial):
-        # 8 valores
-        self.lista = [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]  # fmt: skip
+    def __init__(self, porta_serial, periodo=0.1):
+        # 16 valores, com um segundo buffer que recebe a próxima resposta
+        self.lista = bytearray(16)
+        self._lista_escrita = bytearray(16)
 
         portas = Portas()
         self.ser = portas.abre_porta_serial(porta_serial, 115200)
         if self.ser is None:
             raise Exception('Erro ao abrir a porta serial da placa mux Vl53l0x')
+        self.transporte = TransporteSerial(self.ser)
         self.modo = self.DISTANCIA_4_PORTAS
-        self._thread_ativa = False
-        self._thread = None
-        self._iniciar_thread()
+        self.periodo = periodo
+        self._iniciar_leituras()
 
     def __del__(self):
-        """Destrutor da classe. Para a thread e fecha a porta serial."""
-        self._parar_thread()
+        """Destrutor da classe. Tira a placa da central de sensores e fecha a porta serial."""
+        self._parar_leituras()
         if self.ser is not None:
             self.ser.close()
 
-    def _atualiza_periodicamente(self):
-        """Função que chama `atualiza` a cada 100ms."""
-        while self._thread_ativa:
-            self.atualiza()
-            time.sleep(0.1)  # 100ms
+    def _iniciar_leituras(self):
+        """Registra a placa na central de sensores, que pede uma leitura a cada `periodo` segundos."""
+        CentralSensores().registrar(
+            self,
+            f'PlacaMuxVl53l0x {self.ser.port}',
+            self.transporte,
+            self._requisicao,
+            self._trata_resposta,
+            self.periodo,
+        )
 
-    def _iniciar_thread(self):
-        """Inicia a thread para chamar `atualiza` periodicamente."""
-        if not self._thread_ativa:
-            self._thread_ativa = True
-            self._thread = threading.Thread(target=self._atualiza_periodicamente)
-            self._thread.daemon = True  # Permite que o programa principal encerre mesmo com a thread ativa
-            self._thread.start()
+    def _parar_leituras(self):
+        """Tira a placa da central de sensores, deixando a porta livre para o driver."""
+        CentralSensores().remover(self)
 
-    def _parar_thread(self):
-        """Para a thread que chama `atualiza`."""
-        self._thread_ativa = False
-        if self._thread is not None:
-            self._thread.join()
+    def _requisicao(self):
+        return bytes([self.modo]), self.quantidade_bytes_modo
 
-    def atualiza(self):
-        # limpo o buffer de entrada
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
-        # limpo o buffer de entrada
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
-        # Envia o comando para solicitar o bytes necessarios
-        self.ser.write(bytes([self.modo]))
+    def _trata_resposta(self, dados):
+        # Copia a resposta para o buffer livre e troca os dois: quem lê `lista` sempre vê uma
+        # resposta inteira, e nenhuma lista nova é criada a cada resposta
+        self._lista_escrita[: len(dados)] = dados
+        self.lista, self._lista_escrita = self._lista_escrita, self.lista
 
-        # Aguarda receber os self.quantidade_bytes_modo bytes via serial
-        dados = self.ser.read(self.quantidade_bytes_modo)
+    def atualiza(self):
+        # Pede a próxima leitura e trata a resposta mais recente, que normalmente já chegou
+        dados = self.transporte.consultar(*self._requisicao())
 
-        # Verifica se recebeu exatamente self.quantidade_bytes_modo bytes
-        if len(dados) == self.quantidade_bytes_modo:
-            # Atualiza a lista com os valores recebidos
-            self.lista = list(dados)
+        if dados is not None:
+            self._trata_resposta(dados)
             return True
         else:
             return False
@@ -74,15 +69,13 @@ class PlacaMuxVl53l0x:
         # Atualiza os dados antes de ler
         if porta < 0 or porta > 3:
             raise ValueError('Porta inválida. Deve ser 0, 1, 2 ou 3.')
-        # tenho q usar struct pra pegar dois bytes da lista e transformar em inteiro com sinal
-        indice = porta * 2
-        distancia = struct.unpack('>h', bytes(self.lista[indice : indice + 2]))[0]
+        # dois bytes da lista lidos direto como inteiro com sinal, sem copiar
+        distancia = self._VALOR.unpack_from(self.lista, porta * 2)[0]
         return distancia
 
     def botao_apertado(self, porta):
         if porta < 0 or porta > 3:
             raise ValueError('Porta inválida. Deve ser 0, 1, 2 ou 3.')
-        # tenho q usar struct pra pegar dois bytes da lista e transformar em inteiro com sinal
-        indice = (porta * 2) + 8
-        botao = struct.unpack('>h', bytes(self.lista[indice : indice + 2]))[0]
+        # dois bytes da lista lidos direto como inteiro com sinal, sem copiar
+        botao = self._VALOR.unpack_from(self.lista, (porta * 2) + 8)[0]
         return botao == 1  # True or False
@@ -20,7 +20,11 @@ class Portas:
     I2C7 = 6
     I2C8 = 7
 
+    # porta pode ser uma das constantes SERIAL ou o caminho de um dispositivo, como o
+    # pseudo-terminal de um emulador de placa
     def porta_serial_real(self, porta):
+        if isinstance(porta, str):
+            return porta
         if porta == self._SERIAL0:
             try:
                 result = subprocess.check_output(['ls', '-l', '/dev/serial/by-path/'], text=True)
@@ -0,0 +1,30 @@
+# Relógio usado pelo código de controle no lugar de time.time e time.sleep
+# O Relogio usa o tempo real. O RelogioVirtual não espera de verdade: dormir só avança o
+# tempo dele, então o mesmo código de controle roda muito mais rápido que o tempo real
+# quando os sensores e motores são simulados
+import time
+
+
+class Relogio:
+    # retorna o tempo atual em segundos
+    def agora(self) -> float:
+        return time.time()
+
+    def dormir(self, segundos: float):
+        time.sleep(segundos)
+
+
+class RelogioVirtual(Relogio):
+    def __init__(self, inicio: float = 0.0):
+        self.tempo = inicio
+
+    # retorna os segundos simulados desde o inicio
+    def agora(self) -> float:
+        return self.tempo
+
+    def dormir(self, segundos: float):
+        self.avancar(segundos)
+
+    # avança o tempo sem esperar, usado pelos simuladores para gastar o tempo de uma ação
+    def avancar(self, segundos: float):
+        self.tempo += segundos
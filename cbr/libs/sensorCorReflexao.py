@@ -1,8 +1,10 @@
-import threading
-import time
+import struct
 
+from libs.amostras import BufferAmostras
+from libs.central_sensores import CentralSensores
 from libs.cronometro import Cronometro
 from libs.portas import Portas
+from libs.transporte_serial import TransporteSerial
 
 
 class CorReflexao:
@@ -12,45 +14,58 @@ class CorReflexao:
     MODO_CALIBRA_BRANCO = 3
     MODO_CALIBRA_PRETO = 4
     MODO_RAW_AUTO = 5
-
-    def __init__(self, porta_serial):
-        # 32 valores
-        self.lista = [0xFF, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1A, 0x1B, 0x1C, 0x1D, 0x1E, 0x1F, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2A, 0x2B]  # fmt: skip
+    # Trechos da lista lidos direto dela, sem copiar
+    _REFLEXAO = struct.Struct('4B')
+    _RGBC = struct.Struct('4B')
+    _HSV = struct.Struct('3B')
+
+    def __init__(self, porta_serial, periodo=0.01):
+        # 32 valores, com um segundo buffer que recebe a próxima resposta
+        self.lista = bytearray([0xFF, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1A, 0x1B, 0x1C, 0x1D, 0x1E, 0x1F, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2A, 0x2B])  # fmt: skip
+        self._lista_escrita = bytearray(self.lista)
         portas = Portas()
         self.ser = portas.abre_porta_serial(porta_serial, 115200)
         if self.ser is None:
             raise Exception('Erro ao abrir a porta serial do sensor de cor e reflexão')
+        self.transporte = TransporteSerial(self.ser)
         self.modo = 2
         self.quantidade_bytes_modo = 32
-        self._thread_ativa = False
-        self._thread = None
-        self._iniciar_thread()
+        # Cada resposta da placa, com o instante em que chegou
+        self.amostras = BufferAmostras(32)
+        self._sequencia_lida = 0
+        self.periodo = periodo
+        self._iniciar_leituras()
 
     def __del__(self):
-        """Destrutor da classe. Para a thread e fecha a porta serial."""
-        self._parar_thread()
+        """Destrutor da classe. Tira a placa da central de sensores e fecha a porta serial."""
+        self._parar_leituras()
         if self.ser is not None:
             self.ser.close()
 
-    def _atualiza_periodicamente(self):
-        """Função que chama `atualiza` a cada 1ms."""
-        while self._thread_ativa:
-            self.atualiza()
-            time.sleep(0.01)
-
-    def _iniciar_thread(self):
-        """Inicia a thread para chamar `atualiza` periodicamente."""
-        if not self._thread_ativa:
-            self._thread_ativa = True
-            self._thread = threading.Thread(target=self._atualiza_periodicamente)
-            self._thread.daemon = True  # Permite que o programa principal encerre mesmo com a thread ativa
-            self._thread.start()
-
-    def _parar_thread(self):
-        """Para a thread que chama `atualiza`."""
-        self._thread_ativa = False
-        if self._thread is not None:
-            self._thread.join()
+    def _iniciar_leituras(self):
+        """Registra a placa na central de sensores, que pede uma leitura a cada `periodo` segundos."""
+        CentralSensores().registrar(
+            self,
+            f'CorReflexao {self.ser.port}',
+            self.transporte,
+            self._requisicao,
+            self._trata_resposta,
+            self.periodo,
+        )
+
+    def _parar_leituras(self):
+        """Tira a placa da central de sensores, deixando a porta livre para o driver."""
+        CentralSensores().remover(self)
+
+    def _requisicao(self):
+        return bytes([self.modo]), self.quantidade_bytes_modo
+
+    def _trata_resposta(self, dados):
+        # Copia a resposta para o buffer livre e troca os dois: quem lê `lista` sempre vê uma
+        # resposta inteira, e nenhuma lista nova é criada a cada resposta
+        self._lista_escrita[: len(dados)] = dados
+        self.lista, self._lista_escrita = self._lista_escrita, self.lista
+        self.amostras.publicar(dados)
 
     def set_modo(self, modo):
         self.modo = modo
@@ -59,27 +74,32 @@ class CorReflexao:
         else:
             self.quantidade_bytes_modo = 1
 
+    def espera_leitura(self, tempo_limite=0.1):
+        """Dorme até chegar uma leitura mais nova que a da última espera. Retorna se ela chegou a tempo."""
+        amostra = self.amostras.espera_proxima(tempo_limite, apos=self._sequencia_lida)
+        if amostra is None:
+            return False
+        self._sequencia_lida = amostra.sequencia
+        return True
+
+    def idade_leitura(self):
+        """Segundos desde a última leitura, ou None se nenhuma chegou."""
+        amostra = self.amostras.ultima()
+        return None if amostra is None else amostra.idade()
+
     def atualiza(self):
-        # Envia o comando para solicitar os 32 bytes
-        # limpo o buffer de entrada
-        self.ser.reset_input_buffer()
-        self.ser.reset_output_buffer()
-        self.ser.write(bytes([self.modo]))
-
-        # Aguarda receber os self.quantidade_bytes_modo bytes via serial
-        dados = self.ser.read(self.quantidade_bytes_modo)
-
-        # Verifica se recebeu exatamente self.quantidade_bytes_modo bytes
-        if len(dados) == self.quantidade_bytes_modo:
-            # Atualiza a lista com os valores recebidos
-            self.lista = list(dados)
+        # Pede a próxima leitura e trata a resposta mais recente, que normalmente já chegou
+        dados = self.transporte.consultar(*self._requisicao())
+
+        if dados is not None:
+            self._trata_resposta(dados)
             return True
         else:
             return False
 
     def le_reflexao(self):
         # Atualiza os dados antes de ler
-        return self.lista[0:4]
+        return self._REFLEXAO.unpack_from(self.lista, 0)
 
     def posicao(self):
         # Atualiza os dados antes de ler
@@ -88,31 +108,33 @@ class CorReflexao:
     def le_rgbc(self, sensor):
         # Atualiza os dados antes de ler
         if sensor == 1:
-            return self.lista[4:8]
+            return self._RGBC.unpack_from(self.lista, 4)
         elif sensor == 2:
-            return self.lista[8:12]
+            return self._RGBC.unpack_from(self.lista, 8)
         elif sensor == 3:
-            return self.lista[12:16]
+            return self._RGBC.unpack_from(self.lista, 12)
         else:
             return None
 
     def le_hsv(self, sensor):
         # Atualiza os dados antes de ler
         if sensor == 1:
-            return self.lista[20:23]
+            return self._HSV.unpack_from(self.lista, 20)
         elif sensor == 2:
-            return self.lista[23:26]
+            return self._HSV.unpack_from(self.lista, 23)
         elif sensor == 3:
-            return self.lista[26:29]
+            return self._HSV.unpack_from(self.lista, 26)
         else:
             return None
 
     def calibra_branco(self):
-        self._parar_thread()
+        self._parar_leituras()
         modo_antigo = self.modo
         self.set_modo(self.MODO_CALIBRA_BRANCO)
         tempo = Cronometro()
         tempo.inicia()
+        # A calibração usa a porta diretamente, sem as leituras que estavam a caminho
+        self.transporte.descartar()
         # Aguarda 5 segundos para a calibração
         self.ser.write(bytes([self.modo]))  # envio o modo novo de calibração do branco
         while tempo.tempo() < 5000:
@@ -120,11 +142,11 @@ class CorReflexao:
             # Verifica se recebeu exatamente self.quantidade_bytes_modo bytes
             if len(dados) == self.quantidade_bytes_modo:
                 # Atualiza a lista com os valores recebidos
-                self.lista = list(dados)
+                self.lista[: len(dados)] = dados
                 break
         self.set_modo(modo_antigo)
         self.ser.write(bytes([self.modo]))  # envio o modo novo de calibração do branco
-        self._iniciar_thread()
+        self._iniciar_leituras()
         if tempo.tempo() >= 5000:
             print('Tempo de calibração excedido')
             return False
@@ -132,11 +154,13 @@ class CorReflexao:
         return True
 
     def calibra_preto(self):
-        self._parar_thread()
+        self._parar_leituras()
         modo_antigo = self.modo
         self.set_modo(self.MODO_CALIBRA_PRETO)
         tempo = Cronometro()
         tempo.inicia()
+        # A calibração usa a porta diretamente, sem as leituras que estavam a caminho
+        self.transporte.descartar()
         # Aguarda 5 segundos para a calibração
         self.ser.write(bytes([self.modo]))  # envio o modo novo de calibração do branco
         while tempo.tempo() < 3000:
@@ -144,11 +168,11 @@ class CorReflexao:
             # Verifica se recebeu exatamente self.quantidade_bytes_modo bytes
             if len(dados) == self.quantidade_bytes_modo:
                 # Atualiza a lista com os valores recebidos
-                self.lista = list(dados)
+                self.lista[: len(dados)] = dados
                 break
         self.set_modo(modo_antigo)
         self.ser.write(bytes([self.modo]))  # envio o modo novo de calibração do branco
-        self._iniciar_thread()
+        self._iniciar_leituras()
         if tempo.tempo() >= 3000:
             print('Tempo de calibração excedido')
             return False
@@ -0,0 +1,197 @@
+# Transporte de requisição e resposta das placas seriais do brick
+#
+# Em vez de limpar os buffers da porta antes de cada requisição e descartar o que chegar
+# atrasado, o transporte guarda os bytes recebidos num buffer persistente e separa os
+# quadros de resposta pelo tamanho (e pelo byte de cabeçalho, nas placas que repetem o
+# comando na resposta), casando cada quadro com a requisição pendente mais antiga. Até
+# `max_em_voo` requisições podem estar a caminho ao mesmo tempo, então a placa já prepara a
+# próxima resposta enquanto o driver trata a anterior. Uma requisição sem resposta depois
+# de `tempo_limite` segundos conta como quadro perdido, e os bytes incompletos dela são
+# descartados para o buffer voltar a ficar alinhado. Os contadores medem, por placa,
+# requisições, quadros recebidos e perdidos, bytes trocados e descartados e a latência dos
+# quadros.
+#
+# A recepção não cria objetos por byte: o descritor da porta é lido direto (os.readv) para
+# uma janela de tamanho fixo, e cada resposta é entregue como um memoryview dessa janela.
+# O memoryview vale até a próxima leitura do transporte, então o driver copia a resposta
+# para os buffers dele antes de pedir outra.
+import os
+import select
+import time
+from collections import deque
+
+
+class TransporteSerial:
+    def __init__(self, ser, tempo_limite=0.05, max_em_voo=2, tamanho_janela=512):
+        self.ser = ser
+        self.tempo_limite = tempo_limite
+        self.max_em_voo = max_em_voo
+        self._descritor = ser.fileno()
+        # Os bytes recebidos e ainda não separados em quadros ficam entre _inicio e _fim
+        self._janela = bytearray(tamanho_janela)
+        self._vista = memoryview(self._janela)
+        self._inicio = 0
+        self._fim = 0
+        # (instante de envio, requisição, tamanho da resposta, cabeçalho da resposta ou None)
+        self._pendentes = deque()
+        self.zerar_contadores()
+
+    def zerar_contadores(self):
+        self.requisicoes = 0
+        self.quadros = 0
+        self.quadros_perdidos = 0
+        self.bytes_enviados = 0
+        self.bytes_recebidos = 0
+        self.bytes_descartados = 0
+        self.latencia_total = 0.0
+        self.latencia_maxima = 0.0
+
+    def estatisticas(self):
+        """Contadores da placa, com as latências em milissegundos."""
+        return {
+            'requisicoes': self.requisicoes,
+            'quadros': self.quadros,
+            'quadros_perdidos': self.quadros_perdidos,
+            'bytes_enviados': self.bytes_enviados,
+            'bytes_recebidos': self.bytes_recebidos,
+            'bytes_descartados': self.bytes_descartados,
+            'latencia_media_ms': 1000 * self.latencia_total / self.quadros if self.quadros else None,
+            'latencia_maxima_ms': 1000 * self.latencia_maxima,
+        }
+
+    @property
+    def em_voo(self):
+        return len(self._pendentes)
+
+    def enviar(self, requisicao, tamanho_resposta, cabecalho=None):
+        """Envia a requisição se houver vaga entre as que estão a caminho. Retorna se enviou."""
+        self._expirar(time.monotonic())
+        if tamanho_resposta and len(self._pendentes) >= self.max_em_voo:
+            return False
+        self._escrever(requisicao, tamanho_resposta, cabecalho)
+        return True
+
+    def receber(self, espera=0.0, pronta=False):
+        """Lê o que chegou e retorna os quadros completos, em ordem, como (requisição, resposta).
+
+        Com `espera`, aguarda até `espera` segundos enquanto não chega nenhum quadro. As
+        respostas são memoryviews da janela de recepção, válidos até a próxima leitura.
+        `pronta` diz que um select já avisou que a porta tem o que ler, como na central.
+        """
+        limite = time.monotonic() + espera
+        quadros = []
+        while True:
+            if self._ler() == 0 and pronta:
+                # Fim de arquivo logo depois de o select avisar que havia o que ler
+                raise OSError('a porta não retornou dados: a placa foi desconectada')
+            quadros += self._separar_quadros()
+            agora = time.monotonic()
+            self._expirar(agora)
+            if quadros or not self._pendentes or agora >= limite:
+                return quadros
+            # Espera o próximo byte chegar
+            pronta = bool(select.select([self._descritor], [], [], limite - agora)[0])
+
+    def consultar(self, requisicao, tamanho_resposta, cabecalho=None):
+        """Deixa a requisição a caminho e retorna a resposta mais recente a uma igual, ou None.
+
+        É o uso em laço das placas de modo: cada chamada trata a resposta pedida na chamada
+        anterior, que normalmente já chegou, e deixa a próxima a caminho. Só espera quando
+        ainda não chegou nenhuma resposta, como na primeira chamada.
+        """
+        quadros = self.receber()
+        self.enviar(requisicao, tamanho_resposta, cabecalho)
+        if not quadros:
+            quadros = self.receber(self.tempo_limite)
+            # A espera consumiu a resposta da requisição que acabou de sair; deixa outra a caminho
+            self.enviar(requisicao, tamanho_resposta, cabecalho)
+        for pedido, resposta in reversed(quadros):
+            if pedido == requisicao:
+                return resposta
+        return None
+
+    def trocar(self, requisicao, tamanho_resposta, cabecalho=None):
+        """Envia a requisição e espera a resposta dela, ou None se ela não chegar a tempo."""
+        pedido = self._escrever(requisicao, tamanho_resposta, cabecalho)
+        limite = time.monotonic() + self.tempo_limite
+        while self._pendentes and pedido in self._pendentes:
+            for requisicao_recebida, resposta in self.receber(max(limite - time.monotonic(), 0)):
+                if requisicao_recebida is pedido[1]:
+                    return resposta
+        return None
+
+    def descartar(self):
+        """Esquece as requisições pendentes e tudo o que chegou, para usar a porta diretamente."""
+        self._pendentes.clear()
+        self._inicio = self._fim = 0
+        self.ser.reset_input_buffer()
+
+    def _escrever(self, requisicao, tamanho_resposta, cabecalho):
+        self.ser.write(requisicao)
+        self.requisicoes += 1
+        self.bytes_enviados += len(requisicao)
+        pedido = (time.monotonic(), requisicao, tamanho_resposta, cabecalho)
+        if tamanho_resposta:
+            self._pendentes.append(pedido)
+        return pedido
+
+    def _ler(self):
+        # Lê o que já chegou, até o fim da janela, sem esperar. Retorna quantos bytes leu, 0 no
+        # fim de arquivo ou None se ainda não havia nada para ler
+        if self._fim == len(self._janela):
+            self._compactar()
+        try:
+            lidos = os.readv(self._descritor, [self._vista[self._fim :]])
+        except BlockingIOError:
+            return None
+        self._fim += lidos
+        self.bytes_recebidos += lidos
+        return lidos
+
+    def _compactar(self):
+        guardados = self._fim - self._inicio
+        if guardados == len(self._janela):
+            # Janela cheia sem nenhum quadro completo: são bytes que não servem para nada
+            self.bytes_descartados += guardados
+            guardados = 0
+        else:
+            self._vista[:guardados] = self._vista[self._inicio : self._fim]
+        self._inicio, self._fim = 0, guardados
+
+    def _separar_quadros(self):
+        quadros = []
+        while self._pendentes:
+            instante, requisicao, tamanho, cabecalho = self._pendentes[0]
+            if cabecalho is not None:
+                # Bytes antes do cabeçalho são restos de um quadro que se perdeu
+                inicio = self._janela.find(cabecalho, self._inicio, self._fim)
+                descartados = (self._fim if inicio < 0 else inicio) - self._inicio
+                if descartados:
+                    self.bytes_descartados += descartados
+                    self._inicio += descartados
+            if self._fim - self._inicio < tamanho:
+                break
+            resposta = self._vista[self._inicio : self._inicio + tamanho]
+            self._inicio += tamanho
+            self._pendentes.popleft()
+            latencia = time.monotonic() - instante
+            self.quadros += 1
+            self.latencia_total += latencia
+            self.latencia_maxima = max(self.latencia_maxima, latencia)
+            quadros.append((requisicao, resposta))
+        if not self._pendentes:
+            # Sem requisição pendente, os bytes são de respostas que já foram dadas como perdidas
+            self.bytes_descartados += self._fim - self._inicio
+            self._inicio = self._fim
+        if self._inicio == self._fim:
+            # Janela vazia: a próxima leitura volta para o começo
+            self._inicio = self._fim = 0
+        return quadros
+
+    def _expirar(self, agora):
+        while self._pendentes and agora - self._pendentes[0][0] > self.tempo_limite:
+            self._pendentes.popleft()
+            self.quadros_perdidos += 1
+            # O que chegou da resposta perdida está incompleto
+            self.bytes_descartados += self._fim - self._inicio
+            self._inicio = self._fim = 0
@@ -0,0 +1,14 @@
+# Utilitários compartilhados pelos drivers do brick
+
+
+# Decorador que faz a classe ter uma única instância: as chamadas seguintes retornam a
+# primeira, ignorando os argumentos
+def singleton(cls):
+    instances = {}
+
+    def get_instance(*args, **kwargs):
+        if cls not in instances:
+            instances[cls] = cls(*args, **kwargs)
+        return instances[cls]
+
+    return get_instance
@@ -1,6 +1,7 @@
 from smbus2 import SMBus
-import threading
-import time
+
+from libs.amostras import BufferAmostras
+from libs.central_sensores import CentralSensores
 
 
 class VL53L0X:  # noqa
@@ -83,7 +84,11 @@ class VL53L0X:  # noqa
         self.perform_ref_calibration()
 
         self.valor_distancia_thread = 0
+        # Distâncias lidas pela central, com o instante de cada uma
+        self.amostras = BufferAmostras(1, tipo='i')
+        self._sequencia_lida = 0
         self._thread_ativa = False
+        self._medicao_em_andamento = False
 
     def select_channel(self):
         self.bus.write_byte(self.MUX_ADDR, 1 << self.porta_mux)
@@ -450,20 +455,51 @@ class VL53L0X:  # noqa
             return 0
 
     def _atualizar_periodicamente(self):
-        while self._thread_ativa:
-            self.valor_distancia_thread = self.read_range_single_millimeters()
-            time.sleep(0.02)
+        # Executada pela central de sensores: nunca espera o sensor, que ficaria segurando a
+        # thread de todas as placas. Se a medição terminou, guarda a distância e já começa a
+        # próxima; senão, confere de novo no próximo período
+        self.select_channel()
+        self.select_channel()
+        if self._medicao_em_andamento:
+            if (self.read_byte(0x13) & 0x07) == 0:  # RESULT_INTERRUPT_STATUS
+                return False
+            self.valor_distancia_thread = self.read_word(0x14 + 10)  # RESULT_RANGE_STATUS + 10
+            self.write_byte(0x0B, 0x01)  # SYSTEM_INTERRUPT_CLEAR
+            self.amostras.publicar((self.valor_distancia_thread,))
+        self.solicita_leitura()
+        lida = self._medicao_em_andamento
+        self._medicao_em_andamento = True
+        return lida
+
+    def espera_leitura(self, tempo_limite=0.1):
+        """Dorme até chegar uma leitura mais nova que a da última espera. Retorna se ela chegou a tempo."""
+        amostra = self.amostras.espera_proxima(tempo_limite, apos=self._sequencia_lida)
+        if amostra is None:
+            return False
+        self._sequencia_lida = amostra.sequencia
+        return True
 
+    def idade_leitura(self):
+        """Segundos desde a última leitura, ou None se nenhuma chegou."""
+        amostra = self.amostras.ultima()
+        return None if amostra is None else amostra.idade()
 
-    def iniciar_thread(self):
+    def iniciar_thread(self, periodo=0.02):
+        # As leituras periódicas são feitas pela central de sensores, e não por uma thread própria
         if not self._thread_ativa:
             self._thread_ativa = True
             self.valor_distancia_thread = self.read_range_single_millimeters()
-            self._thread = threading.Thread(target=self._atualizar_periodicamente)
-            self._thread.daemon = True  # Permite que o programa principal encerre mesmo com a thread ativa
-            self._thread.start()
+            self.amostras.publicar((self.valor_distancia_thread,))
+            self._medicao_em_andamento = False
+            CentralSensores().agendar(
+                self, f'VL53L0X {self.porta_mux}', self._atualizar_periodicamente, periodo
+            )
 
     def parar_thread(self):
         if self._thread_ativa:
             self._thread_ativa = False
-            self._thread.join()  # Aguarda a thread terminar
\ No newline at end of file
+            CentralSensores().remover(self)  # Depois disso a central não usa mais o sensor
+            if self._medicao_em_andamento:
+                # Termina a medição que ficou em andamento, para a próxima leitura direta começar limpa
+                self.read_range_continuous_millimeters()
+                self._medicao_em_andamento = False
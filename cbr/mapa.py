@@ -1,11 +1,11 @@
-from settings import VELOCIDADE_BAIXA
+from settings import SIMETRIA_CAMPO, VELOCIDADE_BAIXA
 from src.atuadores.robo.seguidor_linha import RoboSeguidorDeLinha
 from src.definicao_cores import Cores
 from src.estrategias.estrategia_mapa import EstrategiaMapa
 from src.mapa import Mapa
 
 robo = RoboSeguidorDeLinha()
-estrategia = EstrategiaMapa(robo, Mapa())
+estrategia = EstrategiaMapa(robo, Mapa(simetria=SIMETRIA_CAMPO))
 estrategia.posicoes_lixeiras = [
     Cores.VERMELHO,
     Cores.AMARELO,
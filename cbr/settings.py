@@ -12,9 +12,38 @@ CHAVE_SENSOR_COR_ESQUERDO = 'sensor_cor_lateral_esquerda'
 KP_PADRAO = 0.5
 KD_PADRAO = 0.5
 
-KP_BAIXA_VELOCIDADE = 0.5
+KP_SIMPLES = 0.7
+KD_SIMPLES = 0.7
+
+KP_BAIXA_VELOCIDADE = 0.2
 KD_BAIXA_VELOCIDADE = 0.2
 
 VALOR_ENCRUZILHADA = 50
 
 DEPOSITAR_DE_FRENTE = False
+
+# Envia os comandos dos motores por uma thread, sem esperar a resposta da placa (ver libs/motores.py)
+MOTORES_ASSINCRONO = False
+
+# Conversões de movimento do robô (usadas pelo Robo e pelo modelo de tempo do Simulador)
+DISTANCIA_PARA_GRAUS = 800 / 300 * 1.6  # Fator de conversão de distância (mm) para graus do motor
+GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA = 6.67
+GRAUS_PARA_GRAUS_ANGULAR_DIREITA = 7.15
+
+# Tempos estimados (em segundos) usados pelo planejador que considera a direção do robô
+CUSTO_ARESTA = 1.5
+CUSTO_PARADA = 0.4
+CUSTO_GIRO_90 = 1.2
+CUSTO_GIRO_180 = 2.0
+CUSTO_LIXEIRA = 1.0  # Tempo para passar por cada lixeira ao procurar a lixeira de depósito
+
+# Modelo de tempo do Simulador. A velocidade dos motores é convertida em graus do motor por
+# segundo; o fator foi estimado para que uma aresta em VELOCIDADE_BASE_SEGUIDOR leve CUSTO_ARESTA
+COMPRIMENTO_ARESTA = 300  # Distância entre encruzilhadas, em mm
+GRAUS_MOTOR_POR_VELOCIDADE = 14.0  # Graus do motor por segundo para cada unidade de velocidade
+
+# Política de exploração dos nós desconhecidos (valores de EstrategiaBase.PoliticaExploracao)
+POLITICA_EXPLORACAO = 'mais_proximo'
+
+# Supõe o campo espelhado pelo centro: cada leitura também sugere o estado da aresta espelhada
+SIMETRIA_CAMPO = False
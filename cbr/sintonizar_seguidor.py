@@ -0,0 +1,264 @@
+"""Varre os ganhos e velocidades do seguidor de linha num lote do simulador cinemático.
+
+Cada manobra do `RoboSeguidorDeLinha` roda com todas as combinações de KP, KD e
+velocidade da grade ao mesmo tempo, num `LoteCinematico`, com o mesmo controle, os
+mesmos truncamentos, o mesmo período de ciclo e o atraso da leitura dos sensores. Cada combinação parte de
+todas as posições de PARTIDAS, deslocada para o lado e torta:
+
+- completo: `seguir_linha` (4 sensores de reflexão, potência) numa linha reta preta;
+  ganhos KP_PADRAO/KD_PADRAO e velocidade VELOCIDADE_BASE_SEGUIDOR;
+- simples: `seguir_linha_simples` (sensor de cor direito na borda entre o amarelo, à
+  esquerda, e o verde, em velocidade); ganhos KP_SIMPLES/KD_SIMPLES;
+- aproximacao: `seguir_linha_distancia` lento, como na aproximação do bloco em
+  `pegar_bloco`; ganhos KP_BAIXA_VELOCIDADE/KD_BAIXA_VELOCIDADE.
+
+Uma combinação é estável se, em todas as partidas, o sensor nunca se afasta mais de
+LIMITE_PERDA da linha e, depois de TEMPO_ACOMODACAO (na aproximação: ao completar a
+distância), fica a até TOLERANCIA_DESVIO dela. Para cada manobra é escolhida a maior
+velocidade com alguma combinação estável e, nela, os ganhos com o menor desvio médio
+da partida ao fim, que junta a rapidez da correção e o sobressinal.
+O fim da saída é um trecho pronto para o `settings.py`.
+
+Uso:
+    python sintonizar_seguidor.py
+    python sintonizar_seguidor.py --manobras completo --velocidades 50,60,70
+"""
+
+import argparse
+import time
+
+import numpy as np
+from src.atuadores.cinematico import CampoRaster, Material
+from src.atuadores.cinematico.campo import LARGURA_LINHA, MARGEM
+from src.atuadores.cinematico.dispositivos import (
+    DISTANCIA_SENSORES,
+    PERIODO_LEITURA,
+    POSICOES_COR,
+    TEMPO_SERIAL,
+)
+from src.atuadores.cinematico.lote import MM_POR_VELOCIDADE, LoteCinematico
+from src.atuadores.simulador.modelo_tempo import TEMPO_COMANDO_VELOCIDADE
+from src.definicao_cores import ValorAlinhamentoSeguidor
+
+VALOR_MAXIMO = 100  # RoboSeguidorDeLinha.VALOR_MAXIMO
+LIMITE_POTENCIA = 100
+LIMITE_VELOCIDADE = 120
+SENSOR_SIMPLES = 3  # Sensor de cor direito, o que a EstrategiaAreaVerde usa na linha amarela
+INDICE_COR_SIMPLES, VALOR_ALINHAMENTO_SIMPLES = ValorAlinhamentoSeguidor.VERDE_AMARELO
+# Idade média da leitura dos sensores quando o comando chega aos motores: a thread da
+# CorReflexao lê a cada PERIODO_LEITURA e o comando passa pela serial
+ATRASO_COMANDO = PERIODO_LEITURA / 2 + 2 * TEMPO_SERIAL
+
+# (desvio lateral em mm, ângulo em graus) de cada partida
+PARTIDAS = ((15, -5), (-15, 5), (0, 10), (0, -10))
+PARTIDAS_APROXIMACAO = ((5, -3), (-5, 3), (0, 5), (0, -5))
+LIMITE_PERDA = 30  # mm; mais longe que isso os sensores saem da linha
+TEMPO_ACOMODACAO = 1.5  # s
+TOLERANCIA_DESVIO = 4  # mm
+TOLERANCIA_ANGULO = 3  # graus, no fim da aproximação
+DISTANCIA_APROXIMACAO = 70  # mm, como em pegar_bloco
+
+KPS = np.round(np.arange(0.1, 1.51, 0.1), 2)
+KDS = np.round(np.arange(0.0, 2.01, 0.1), 2)
+
+MANOBRAS = {
+    'completo': {
+        'ganhos': ('KP_PADRAO', 'KD_PADRAO'),
+        'velocidade': 'VELOCIDADE_BASE_SEGUIDOR',
+        'velocidades': (40, 50, 60, 70, 80, 90, 100),
+        'periodo': 2 * TEMPO_SERIAL + 0.02,  # potencia_motores e a espera de seguir_linha
+        'limite': LIMITE_POTENCIA,
+        'duracao': 3.0,
+        'partidas': PARTIDAS,
+    },
+    'simples': {
+        'ganhos': ('KP_SIMPLES', 'KD_SIMPLES'),
+        'velocidade': None,
+        'velocidades': (15, 25, 35, 45, 55, 65),
+        'periodo': 2 * TEMPO_SERIAL + TEMPO_COMANDO_VELOCIDADE + 0.025,
+        'limite': LIMITE_VELOCIDADE,
+        'duracao': 3.0,
+        'partidas': PARTIDAS,
+    },
+    'aproximacao': {
+        'ganhos': ('KP_BAIXA_VELOCIDADE', 'KD_BAIXA_VELOCIDADE'),
+        'velocidade': None,
+        'velocidades': (6, 9, 12, 15, 20, 25, 30),
+        'periodo': 2 * TEMPO_SERIAL + TEMPO_COMANDO_VELOCIDADE + 0.02,
+        'limite': LIMITE_VELOCIDADE,
+        'distancia': DISTANCIA_APROXIMACAO,
+        'partidas': PARTIDAS_APROXIMACAO,
+    },
+}
+
+
+def compensacao_potencia(potencia1: np.ndarray, potencia2: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """`RoboSeguidorDeLinha.compensacao_potencia` para arrays."""
+    excesso = np.maximum(potencia1 - VALOR_MAXIMO, 0)
+    potencia1, potencia2 = potencia1 - excesso, potencia2 - excesso
+    excesso = np.maximum(potencia2 - VALOR_MAXIMO, 0)
+    return potencia1 - excesso, potencia2 - excesso
+
+
+def montar_campo(nome: str, comprimento: float) -> tuple[CampoRaster, float, float]:
+    """Campo reto da manobra; retorna o campo, o x da partida e o y que os sensores seguem."""
+    largura_campo = 2 * MARGEM
+    campo = CampoRaster(comprimento + 2 * MARGEM, largura_campo)
+    y_referencia = largura_campo / 2
+    if nome == 'simples':
+        # Linha amarela à esquerda da borda e a área verde à direita, como na área verde
+        campo.pintar_retangulo(
+            0, y_referencia - LARGURA_LINHA, comprimento + 2 * MARGEM, y_referencia, Material.AMARELO
+        )
+        campo.pintar_retangulo(0, y_referencia, comprimento + 2 * MARGEM, largura_campo, Material.VERDE)
+    else:
+        campo.pintar_linha((0, y_referencia), (comprimento + 2 * MARGEM, y_referencia))
+    return campo, MARGEM, y_referencia
+
+
+def simular(nome: str, velocidades: tuple[int, ...]) -> dict:
+    """Roda a manobra para todas as combinações e partidas; os arrays têm forma (KP, KD, velocidade, partida)."""
+    manobra = MANOBRAS[nome]
+    partidas = np.array(manobra['partidas'], dtype=np.float64)
+    kp, kd, velocidade, partida = np.meshgrid(
+        KPS, KDS, np.array(velocidades), np.arange(len(partidas)), indexing='ij'
+    )
+    forma = kp.shape
+    kp, kd, velocidade, partida = kp.ravel(), kd.ravel(), velocidade.ravel(), partida.ravel()
+
+    distancia = manobra.get('distancia')
+    duracao = manobra.get('duracao') or 1.5 * distancia / (min(velocidades) * MM_POR_VELOCIDADE)
+    comprimento = max(velocidades) * MM_POR_VELOCIDADE * duracao
+    campo, x_inicio, y_referencia = montar_campo(nome, comprimento)
+    # Posição lateral do sensor que segue a linha
+    esquerda_sensor = POSICOES_COR[SENSOR_SIMPLES - 1] if nome == 'simples' else 0
+
+    lote = LoteCinematico(campo, kp.size)
+    desvio_inicial, angulo = partidas[partida].T
+    lote.posicionar(x_inicio, y_referencia + desvio_inicial, angulo)
+    # Os sensores começam deslocados de desvio_inicial, não o eixo das rodas
+    _, y_sensor = lote.ponto(DISTANCIA_SENSORES, esquerda_sensor)
+    lote.y += y_referencia + desvio_inicial - y_sensor[:, 0]
+
+    erro_anterior = np.zeros(kp.size)
+    pior_desvio = np.zeros(kp.size)
+    desvio_final = np.full(kp.size, np.inf)
+    soma_desvio = np.zeros(kp.size)
+    ciclos = ciclos_acomodados = 0
+    desvio_chegada = np.full(kp.size, np.nan)
+    angulo_chegada = np.full(kp.size, np.nan)
+
+    for _ in range(round(duracao / manobra['periodo'])):
+        if nome == 'simples':
+            erro = lote.le_rgbc(SENSOR_SIMPLES)[:, INDICE_COR_SIMPLES] - VALOR_ALINHAMENTO_SIMPLES
+        else:
+            reflexao = lote.le_reflexao()
+            erro = (reflexao[:, 3] + reflexao[:, 2]) - (reflexao[:, 0] + reflexao[:, 1])
+        valor = np.trunc(erro * kp + (erro - erro_anterior) * kd)
+        erro_anterior = erro
+        potencia1, potencia2 = compensacao_potencia(velocidade + valor, velocidade - valor)
+        if nome == 'simples':
+            # seguir_linha_simples manda as potências trocadas para os motores
+            potencia1, potencia2 = potencia2, potencia1
+        lote.integrar(ATRASO_COMANDO)
+        lote.comandar(potencia1, potencia2, manobra['limite'])
+        lote.integrar(manobra['periodo'] - ATRASO_COMANDO)
+
+        x_sensor, y_sensor = lote.ponto(DISTANCIA_SENSORES, esquerda_sensor)
+        desvio = np.abs(y_sensor[:, 0] - y_referencia)
+        pior_desvio = np.maximum(pior_desvio, desvio)
+        soma_desvio += desvio
+        ciclos += 1
+        if distancia is not None:
+            chegou = np.isnan(desvio_chegada) & (x_sensor[:, 0] - x_inicio - DISTANCIA_SENSORES >= distancia)
+            desvio_chegada[chegou] = desvio[chegou]
+            angulo_chegada[chegou] = np.abs(np.degrees(lote.theta[chegou]))
+        elif lote.tempo >= TEMPO_ACOMODACAO:
+            desvio_final = np.where(ciclos_acomodados, np.maximum(desvio_final, desvio), desvio)
+            ciclos_acomodados += 1
+
+    estavel = pior_desvio <= LIMITE_PERDA
+    if distancia is None:
+        estavel &= desvio_final <= TOLERANCIA_DESVIO
+    else:
+        estavel &= (desvio_chegada <= TOLERANCIA_DESVIO) & (angulo_chegada <= TOLERANCIA_ANGULO)
+    desvio_medio = soma_desvio / ciclos
+
+    return {
+        'estavel': estavel.reshape(forma),
+        'pior_desvio': pior_desvio.reshape(forma),
+        'desvio_medio': desvio_medio.reshape(forma),
+        'robos': kp.size,
+    }
+
+
+def melhores_por_velocidade(resultado: dict, velocidades: tuple[int, ...]) -> list[dict]:
+    """Para cada velocidade, os ganhos estáveis em todas as partidas com o menor desvio médio."""
+    estavel = resultado['estavel'].all(axis=3)
+    desvio_medio = np.where(estavel, resultado['desvio_medio'].mean(axis=3), np.inf)
+    pior_desvio = resultado['pior_desvio'].max(axis=3)
+    linhas = []
+    for indice, velocidade in enumerate(velocidades):
+        i_kp, i_kd = np.unravel_index(np.argmin(desvio_medio[:, :, indice]), desvio_medio.shape[:2])
+        linhas.append({
+            'velocidade': velocidade,
+            'estaveis': int(estavel[:, :, indice].sum()),
+            'kp': float(KPS[i_kp]),
+            'kd': float(KDS[i_kd]),
+            'pior_desvio': float(pior_desvio[i_kp, i_kd, indice]),
+            'desvio_medio': float(desvio_medio[i_kp, i_kd, indice]),
+        })
+    return linhas
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--manobras', default=','.join(MANOBRAS), help='como completo,simples')
+    parser.add_argument('--velocidades', help='como 40,60,80; por padrão, a grade de cada manobra')
+    argumentos = parser.parse_args()
+
+    trecho_settings = []
+    for nome in argumentos.manobras.split(','):
+        manobra = MANOBRAS[nome]
+        velocidades = (
+            tuple(map(int, argumentos.velocidades.split(',')))
+            if argumentos.velocidades
+            else manobra['velocidades']
+        )
+        inicio = time.perf_counter()
+        resultado = simular(nome, velocidades)
+        linhas = melhores_por_velocidade(resultado, velocidades)
+        print(f'\n{nome}: {resultado["robos"]} robôs em {time.perf_counter() - inicio:.1f} s')
+        print(
+            f'{"Velocidade":>10} {"Estáveis":>9} {"KP":>5} {"KD":>5}'
+            f' {"Pior desvio (mm)":>17} {"Desvio médio (mm)":>18}'
+        )
+        for linha in linhas:
+            if not linha['estaveis']:
+                print(f'{linha["velocidade"]:>10} {0:>9} {"-":>5} {"-":>5} {"-":>17} {"-":>18}')
+                continue
+            print(
+                f'{linha["velocidade"]:>10} {linha["estaveis"]:>9} {linha["kp"]:>5.2f} {linha["kd"]:>5.2f}'
+                f' {linha["pior_desvio"]:>17.1f} {linha["desvio_medio"]:>18.1f}'
+            )
+
+        estaveis = [linha for linha in linhas if linha['estaveis']]
+        nome_kp, nome_kd = manobra['ganhos']
+        if not estaveis:
+            trecho_settings.append(f'# {nome}: nenhuma combinação estável')
+            continue
+        melhor = max(estaveis, key=lambda linha: linha['velocidade'])
+        trecho_settings.append(f'# {nome}: estável até a velocidade {melhor["velocidade"]}')
+        trecho_settings.append(f'{nome_kp} = {melhor["kp"]:g}')
+        trecho_settings.append(f'{nome_kd} = {melhor["kd"]:g}')
+        if manobra['velocidade']:
+            trecho_settings.append(f'{manobra["velocidade"]} = {melhor["velocidade"]}')
+
+    print('\n# Trecho para o settings.py')
+    print('\n'.join(trecho_settings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Simulador cinemático do robô seguidor de linha.
+
+Diferente do `Simulador`, que anda de encruzilhada em encruzilhada num grafo, este
+simulador move o robô continuamente num campo rasterizado (`campo.py`) com a
+cinemática de tração diferencial (`mundo.py`). As placas de motores, de reflexão e cor
+e o giroscópio são emuladas (`dispositivos.py`), então os métodos de controle do
+`RoboSeguidorDeLinha` rodam sem mudanças em `RoboCinematico` (`robo.py`). Como o
+relógio é virtual, a simulação roda muito mais rápido que o tempo real. O
+`LoteCinematico` (`lote.py`) integra muitos robôs juntos com o NumPy, para varrer
+ganhos e velocidades do seguidor de linha.
+
+`robo.py` importa o `RoboSeguidorDeLinha` e as bibliotecas do hardware, por isso não é
+importado aqui.
+"""
+
+from .campo import CampoGrade, CampoRaster, Material
+from .dispositivos import CorReflexaoEmulada, GiroscopioEmulado, MotoresEmulados
+from .lote import LoteCinematico
+from .mundo import MundoCinematico, RelogioCinematico
+
+__all__ = [
+    'CampoGrade',
+    'CampoRaster',
+    'CorReflexaoEmulada',
+    'GiroscopioEmulado',
+    'LoteCinematico',
+    'Material',
+    'MotoresEmulados',
+    'MundoCinematico',
+    'RelogioCinematico',
+]
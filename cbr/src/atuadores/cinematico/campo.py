@@ -0,0 +1,124 @@
+"""Campo rasterizado usado pelos sensores emulados do simulador cinemático.
+
+O piso é uma imagem de códigos de `Material`, com `resolucao` mm por pixel. As
+coordenadas são em mm, com x para a direita e y para baixo, como as linhas e colunas
+da imagem (e as linhas e colunas do mapa). Cada material tem os valores que a placa
+`CorReflexao` entrega sobre ele: a reflexão dos quatro sensores de linha e o RGBC e o
+HSV dos três sensores de cor. Os valores de HSV passam nas funções de
+`DefinicaoCoresLinha` e os de RGBC ficam nos dois lados dos valores de
+`ValorAlinhamentoSeguidor`.
+"""
+
+import numpy as np
+from settings import COMPRIMENTO_ARESTA
+from src.atuadores.simulador.area_verde import AreaVerdeSimulada
+
+RESOLUCAO = 1.0  # mm por pixel
+LARGURA_LINHA = 20  # Largura das linhas preta e amarela, em mm
+MARGEM = 150  # Piso branco em volta do campo, em mm
+
+
+class Material:
+    BRANCO = 0
+    PRETO = 1
+    VERDE = 2
+    AMARELO = 3
+    AZUL = 4
+    VERMELHO = 5
+
+
+# Valores da placa de cada material, indexados pelo código do Material
+REFLEXAO = np.array([100, 5, 60, 90, 45, 65], dtype=np.float64)
+RGBC = np.array(
+    [
+        (110, 110, 110, 127),
+        (6, 6, 6, 8),
+        (25, 60, 35, 45),
+        (85, 80, 25, 110),
+        (15, 35, 70, 45),
+        (55, 15, 15, 45),
+    ],
+    dtype=np.float64,
+)
+HSV = np.array(
+    [(0, 5, 120), (0, 0, 8), (45, 40, 40), (18, 60, 90), (77, 45, 45), (5, 60, 75)], dtype=np.uint8
+)
+
+
+class CampoRaster:
+    """Piso de `largura` x `altura` mm, inicialmente branco."""
+
+    def __init__(self, largura: float, altura: float, resolucao: float = RESOLUCAO):
+        self.resolucao = resolucao
+        self.materiais = np.full(
+            (int(np.ceil(altura / resolucao)), int(np.ceil(largura / resolucao))),
+            Material.BRANCO,
+            dtype=np.uint8,
+        )
+
+    def pintar_retangulo(self, x0: float, y0: float, x1: float, y1: float, material: int):
+        """Pinta o retângulo entre os cantos (x0, y0) e (x1, y1)."""
+        coluna0, coluna1 = sorted((round(x0 / self.resolucao), round(x1 / self.resolucao)))
+        linha0, linha1 = sorted((round(y0 / self.resolucao), round(y1 / self.resolucao)))
+        self.materiais[max(linha0, 0) : linha1, max(coluna0, 0) : coluna1] = material
+
+    def pintar_linha(
+        self, inicio: tuple[float, float], fim: tuple[float, float], material: int = Material.PRETO
+    ):
+        """Pinta uma linha horizontal ou vertical de largura LARGURA_LINHA entre dois pontos."""
+        meia = LARGURA_LINHA / 2
+        (x0, y0), (x1, y1) = inicio, fim
+        self.pintar_retangulo(
+            min(x0, x1) - meia, min(y0, y1) - meia, max(x0, x1) + meia, max(y0, y1) + meia, material
+        )
+
+    def amostrar(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Materiais nos pontos (xs, ys); fora da imagem o piso é branco."""
+        colunas = np.floor(xs / self.resolucao).astype(np.intp)
+        linhas = np.floor(ys / self.resolucao).astype(np.intp)
+        altura, largura = self.materiais.shape
+        dentro = (linhas >= 0) & (linhas < altura) & (colunas >= 0) & (colunas < largura)
+        materiais = np.full(xs.shape, Material.BRANCO, dtype=np.uint8)
+        materiais[dentro] = self.materiais[linhas[dentro], colunas[dentro]]
+        return materiais
+
+
+class CampoGrade(CampoRaster):
+    """Campo da competição: a grade de linhas pretas do mapa e a área verde à esquerda.
+
+    Cada linha do mapa continua da coluna 0 até a borda da área verde e, do outro lado
+    da área verde, fica a linha amarela das lixeiras, com a mesma geometria da
+    `AreaVerdeSimulada`.
+    """
+
+    def __init__(
+        self,
+        altura: int = 5,
+        largura: int = 6,
+        comprimento_aresta: float = COMPRIMENTO_ARESTA,
+        resolucao: float = RESOLUCAO,
+    ):
+        self.altura = altura
+        self.largura = largura
+        self.comprimento_aresta = comprimento_aresta
+
+        # A coluna 0 fica depois da margem, da linha amarela, da área verde e do trecho até ela
+        borda_verde = MARGEM + LARGURA_LINHA + AreaVerdeSimulada.LARGURA_AREA_VERDE
+        self.origem = (borda_verde + AreaVerdeSimulada.DISTANCIA_AREA_VERDE, MARGEM + comprimento_aresta / 2)
+        x_ultima, y_ultima = self.posicao_no(altura - 1, largura - 1)
+        super().__init__(x_ultima + MARGEM, y_ultima + comprimento_aresta / 2 + MARGEM, resolucao)
+
+        y_topo, y_base = MARGEM, y_ultima + comprimento_aresta / 2
+        self.pintar_retangulo(MARGEM, y_topo, borda_verde, y_base, Material.VERDE)
+        self.pintar_retangulo(MARGEM, y_topo, MARGEM + LARGURA_LINHA, y_base, Material.AMARELO)
+
+        for linha in range(altura):
+            _, y_no = self.posicao_no(linha, 0)
+            self.pintar_linha((borda_verde, y_no), self.posicao_no(linha, largura - 1))
+        for coluna in range(largura):
+            self.pintar_linha(self.posicao_no(0, coluna), self.posicao_no(altura - 1, coluna))
+
+    def posicao_no(self, linha: int, coluna: int) -> tuple[float, float]:
+        """Posição em mm da encruzilhada (linha, coluna) do mapa."""
+        x0, y0 = self.origem
+        return x0 + coluna * self.comprimento_aresta, y0 + linha * self.comprimento_aresta
@@ -0,0 +1,261 @@
+"""Placas do robô emuladas sobre o `MundoCinematico`.
+
+Cada classe tem os métodos da biblioteca do hardware que o `Robo` e o
+`RoboSeguidorDeLinha` usam, com os mesmos sinais e unidades:
+
+- `MotoresEmulados` (`libs.motores.Motores`): velocidade e potência dos motores 1
+  (direito) e 2 (esquerdo), movimentos por ângulo, estado e encoders com o
+  `angulo_motor` relativo ao último `reseta_angulo_motor`. Cada comando gasta o tempo
+  da troca de mensagens na serial e as mesmas esperas da biblioteca;
+- `CorReflexaoEmulada` (`libs.sensorCorReflexao.CorReflexao`): a lista de 32 valores
+  da placa, lida do campo na posição dos sensores e atualizada a cada PERIODO_LEITURA;
+- `GiroscopioEmulado` (`libs.giroscopio.Giroscopio`): o ângulo z em graus inteiros,
+  crescendo no giro para a direita.
+
+O `espera_leitura` das placas de sensores dorme no relógio do mundo até a próxima
+leitura da placa, como o dos drivers espera a próxima resposta da central de sensores.
+"""
+
+from math import degrees
+
+import numpy as np
+from settings import GRAUS_MOTOR_POR_VELOCIDADE
+from src.atuadores.simulador.modelo_tempo import TEMPO_COMANDO_ANGULO, TEMPO_COMANDO_VELOCIDADE
+
+from .campo import HSV, REFLEXAO, RGBC
+from .mundo import MundoCinematico, Roda
+
+TEMPO_SERIAL = 0.002  # Envio de um comando e leitura da resposta de uma placa
+PERIODO_LEITURA = 0.01  # Intervalo entre as leituras da CorReflexao pela central de sensores
+PERIODO_GIROSCOPIO = 0.025  # Intervalo entre as leituras do Giroscopio pela central de sensores
+
+# Posição dos sensores em mm: à frente do eixo das rodas e à esquerda do centro do robô
+DISTANCIA_SENSORES = 70
+# Sensores de reflexão na ordem de `le_reflexao`. A primeira leitura é a do sensor mais à
+# esquerda: é a ordem em que o `erro_pid` vira o robô de volta para a linha
+POSICOES_REFLEXAO = (24, 8, -8, -24)
+# Sensores de cor 1 (esquerdo), 2 (centro) e 3 (direito)
+POSICOES_COR = (30, 0, -30)
+RAIO_SENSOR = 4  # Raio da área do piso que cada sensor enxerga, em mm
+
+
+class MotoresEmulados:
+    NORMAL = 0
+    INVERTIDO = 1
+    BREAK = 0
+    HOLD = 1
+    PARADO = Roda.PARADO
+    GIRANDO_NORMAL = Roda.GIRANDO_NORMAL
+    GIRANDO_INVERTIDO = Roda.GIRANDO_INVERTIDO
+
+    def __init__(self, mundo: MundoCinematico):
+        self.mundo = mundo
+        self.relogio = mundo.relogio
+        self.motor_invertido = [False, False, False, False]
+        self.modo_freio = self.BREAK
+        self.lista_servos = [0xFD, 200, 200, 200, 200, 200, 200, 0, 0, 0]
+        self.angulo_delta_motor1 = 0
+        self.angulo_delta_motor2 = 0
+
+    def _comandar(self, motor: int, velocidade: float, graus_por_unidade: float, angulo: int | None = None):
+        if self.motor_invertido[motor - 1]:
+            velocidade = -velocidade
+        self.mundo.rodas[motor - 1].comandar(int(velocidade) * graus_por_unidade, angulo)
+
+    def _serial(self):
+        self.relogio.dormir(TEMPO_SERIAL)
+
+    @property
+    def angulo_absoluto_motor1(self) -> int:
+        return round(self.mundo.rodas[0].angulo)
+
+    @property
+    def angulo_absoluto_motor2(self) -> int:
+        return round(self.mundo.rodas[1].angulo)
+
+    @property
+    def estado_motores(self) -> int:
+        return self.mundo.rodas[0].estado | (self.mundo.rodas[1].estado << 2)
+
+    def move_servo(self, servo, angulo, tempo=0):
+        if not 1 <= servo <= 6:
+            return
+        angulo = min(max(angulo, 0), 180)
+        self.lista_servos[servo] = angulo
+        self._serial()
+        if tempo > 0:
+            self.relogio.dormir(tempo)
+
+    def atualiza_motores(self):
+        self._serial()
+        return True
+
+    def atualiza_servos(self):
+        self._serial()
+        return True
+
+    def estado(self):
+        self._serial()
+        return True
+
+    def direcao_motor(self, motor, direcao):
+        if 1 <= motor <= 4:
+            self.motor_invertido[motor - 1] = direcao != self.NORMAL
+            self._serial()
+
+    def set_modo_freio(self, modo):
+        self.modo_freio = self.BREAK if modo == self.BREAK else self.HOLD
+        self._serial()
+
+    def velocidade_motor(self, motor, velocidade):
+        if 1 <= motor <= 2:
+            self._comandar(motor, min(max(velocidade, -120), 120), GRAUS_MOTOR_POR_VELOCIDADE)
+            self._serial()
+
+    def move_motor(self, motor, velocidade, angulo):
+        angulo = abs(angulo)
+        if angulo > 65535 or not 1 <= motor <= 2:
+            return
+        self._comandar(motor, min(max(velocidade, -120), 120), GRAUS_MOTOR_POR_VELOCIDADE, angulo)
+        self._serial()
+        self.relogio.dormir(TEMPO_COMANDO_ANGULO)
+
+    def move_motores(self, velocidade1, angulo1, velocidade2, angulo2):
+        angulo1, angulo2 = abs(angulo1), abs(angulo2)
+        if angulo1 > 65535 or angulo2 > 65535:
+            return
+        self._comandar(1, min(max(velocidade1, -120), 120), GRAUS_MOTOR_POR_VELOCIDADE, angulo1)
+        self._comandar(2, min(max(velocidade2, -120), 120), GRAUS_MOTOR_POR_VELOCIDADE, angulo2)
+        self._serial()
+        self.relogio.dormir(TEMPO_COMANDO_ANGULO)
+        self._serial()
+
+    def velocidade_motores(self, velocidade1, velocidade2):
+        self._comandar(1, min(max(velocidade1, -120), 120), GRAUS_MOTOR_POR_VELOCIDADE)
+        self._comandar(2, min(max(velocidade2, -120), 120), GRAUS_MOTOR_POR_VELOCIDADE)
+        self._serial()
+        self.relogio.dormir(TEMPO_COMANDO_VELOCIDADE)
+        self._serial()
+
+    def potencia_motores(self, potencia1, potencia2):
+        # Sem carga, a potência em % leva a roda à mesma velocidade que o valor igual em velocidade_motores
+        self._comandar(1, min(max(potencia1, -100), 100), GRAUS_MOTOR_POR_VELOCIDADE)
+        self._comandar(2, min(max(potencia2, -100), 100), GRAUS_MOTOR_POR_VELOCIDADE)
+        self._serial()
+        self._serial()
+
+    def para_motores(self):
+        self.move_motores(0, 1, 0, 1)
+
+    def reseta_angulo_motor(self, motor):
+        if motor == 1:
+            self.angulo_delta_motor1 = self.angulo_absoluto_motor1
+        elif motor == 2:
+            self.angulo_delta_motor2 = self.angulo_absoluto_motor2
+        else:
+            return
+        self._serial()
+
+    def angulo_motor(self, motor):
+        if motor == 1:
+            if self.motor_invertido[0]:
+                return -self.angulo_absoluto_motor1 + self.angulo_delta_motor1
+            return self.angulo_absoluto_motor1 - self.angulo_delta_motor1
+        if motor == 2:
+            if self.motor_invertido[1]:
+                return -self.angulo_absoluto_motor2 + self.angulo_delta_motor2
+            return self.angulo_absoluto_motor2 - self.angulo_delta_motor2
+        return 0
+
+    def estado_motor(self, motor):
+        if motor == 1:
+            return self.estado_motores & 0b11
+        if motor == 2:
+            return (self.estado_motores >> 2) & 0b11
+        return 0
+
+
+class CorReflexaoEmulada:
+    def __init__(self, mundo: MundoCinematico):
+        self.mundo = mundo
+        self.lista = [0] * 32
+        self._tempo_leitura = None
+
+        # Pontos da área vista por um sensor, relativos ao centro dele
+        passos = np.arange(-RAIO_SENSOR, RAIO_SENSOR + 1, mundo.campo.resolucao)
+        frente, esquerda = np.meshgrid(passos, passos)
+        dentro = frente**2 + esquerda**2 <= RAIO_SENSOR**2
+        self._area = (frente[dentro], esquerda[dentro])
+
+    def _materiais(self, esquerda: float) -> np.ndarray:
+        """Materiais na área vista pelo sensor que fica `esquerda` mm à esquerda do centro."""
+        frente_area, esquerda_area = self._area
+        xs, ys = self.mundo.ponto(DISTANCIA_SENSORES + frente_area, esquerda + esquerda_area)
+        return self.mundo.campo.amostrar(xs, ys)
+
+    def atualiza(self):
+        lista = [0] * 32
+        for indice, esquerda in enumerate(POSICOES_REFLEXAO):
+            lista[indice] = int(REFLEXAO[self._materiais(esquerda)].mean())
+        for indice, esquerda in enumerate(POSICOES_COR):
+            materiais = self._materiais(esquerda)
+            lista[4 + 4 * indice : 8 + 4 * indice] = RGBC[materiais].mean(axis=0).astype(int).tolist()
+            # O HSV é o do material no centro do sensor
+            lista[20 + 3 * indice : 23 + 3 * indice] = HSV[materiais[len(materiais) // 2]].tolist()
+        self.lista = lista
+        self._tempo_leitura = self.mundo.tempo
+        return True
+
+    def espera_leitura(self, tempo_limite=0.1):
+        if self._tempo_leitura is not None:
+            self.mundo.relogio.dormir(max(self._tempo_leitura + PERIODO_LEITURA - self.mundo.tempo, 0))
+        self.atualiza()
+        return True
+
+    def idade_leitura(self):
+        return None if self._tempo_leitura is None else self.mundo.tempo - self._tempo_leitura
+
+    def _atualizar_se_preciso(self):
+        if self._tempo_leitura is None or self.mundo.tempo - self._tempo_leitura >= PERIODO_LEITURA:
+            self.atualiza()
+
+    def le_reflexao(self):
+        self._atualizar_se_preciso()
+        return self.lista[0:4]
+
+    def posicao(self):
+        self._atualizar_se_preciso()
+        return self.lista[29]
+
+    def le_rgbc(self, sensor):
+        self._atualizar_se_preciso()
+        if sensor in {1, 2, 3}:
+            return self.lista[4 * sensor : 4 * sensor + 4]
+        return None
+
+    def le_hsv(self, sensor):
+        self._atualizar_se_preciso()
+        if sensor in {1, 2, 3}:
+            return self.lista[17 + 3 * sensor : 20 + 3 * sensor]
+        return None
+
+
+class GiroscopioEmulado:
+    def __init__(self, mundo: MundoCinematico):
+        self.mundo = mundo
+        self.theta_inicial = mundo.theta
+        self._tempo_espera = None
+
+    def espera_leitura(self, tempo_limite=0.1):
+        # O ângulo é sempre o atual; só o intervalo entre leituras da placa é respeitado
+        if self._tempo_espera is not None:
+            self.mundo.relogio.dormir(max(self._tempo_espera + PERIODO_GIROSCOPIO - self.mundo.tempo, 0))
+        self._tempo_espera = self.mundo.tempo
+        return True
+
+    def le_angulo_z(self):
+        return round(degrees(self.mundo.theta - self.theta_inicial))
+
+    def reseta_z(self):
+        self.theta_inicial = self.mundo.theta
+        self.mundo.relogio.dormir(0.025)
@@ -0,0 +1,94 @@
+"""Lote de robôs do simulador cinemático integrados juntos com arrays do NumPy.
+
+Cada robô do `LoteCinematico` tem a mesma cinemática do `MundoCinematico` (rodas com
+atraso de primeira ordem, passos de PASSO segundos) e os mesmos sensores da
+`CorReflexaoEmulada`, mas o estado é um array com um elemento por robô. Todos os robôs
+andam no mesmo campo e no mesmo passo, então milhares de combinações de ganhos e
+velocidades do seguidor de linha rodam no tempo de poucas simulações do robô sozinho.
+
+O lote só recebe comandos de velocidade, já no sentido das rodas: as velocidades de
+`comandar` são os valores que o `RoboSeguidorDeLinha` passa para `potencia_motores` e
+`velocidade_motores` (motor 1 é a roda direita), com o motor 1 invertido como no `Robo`.
+"""
+
+import numpy as np
+from settings import DISTANCIA_PARA_GRAUS, GRAUS_MOTOR_POR_VELOCIDADE
+
+from .campo import REFLEXAO, RGBC, CampoRaster
+from .dispositivos import DISTANCIA_SENSORES, POSICOES_COR, POSICOES_REFLEXAO, RAIO_SENSOR
+from .mundo import BITOLA, CONSTANTE_TEMPO_MOTOR, PASSO
+
+# mm/s da roda para cada unidade de velocidade ou potência da placa
+MM_POR_VELOCIDADE = GRAUS_MOTOR_POR_VELOCIDADE / DISTANCIA_PARA_GRAUS
+
+
+class LoteCinematico:
+    """`qtd` robôs de tração diferencial no `campo`, parados na origem até `posicionar`."""
+
+    def __init__(self, campo: CampoRaster, qtd: int, *, constante_tempo_motor: float = CONSTANTE_TEMPO_MOTOR):
+        self.campo = campo
+        self.qtd = qtd
+        self.fator_resposta = 1 - np.exp(-PASSO / constante_tempo_motor)
+        self.x = np.zeros(qtd)
+        self.y = np.zeros(qtd)
+        self.theta = np.zeros(qtd)
+        # Velocidade atual e pedida das rodas direita e esquerda, em mm/s para a frente
+        self.velocidade = np.zeros((qtd, 2))
+        self.alvo = np.zeros((qtd, 2))
+        self.tempo = 0.0
+
+        # Pontos da área vista por um sensor, relativos ao centro dele, como na CorReflexaoEmulada
+        passos = np.arange(-RAIO_SENSOR, RAIO_SENSOR + 1, campo.resolucao)
+        frente, esquerda = np.meshgrid(passos, passos)
+        dentro = frente**2 + esquerda**2 <= RAIO_SENSOR**2
+        self._area = (frente[dentro], esquerda[dentro])
+
+    def posicionar(self, x: np.ndarray | float, y: np.ndarray | float, angulo: np.ndarray | float):
+        """Coloca os robôs parados em (x, y) mm, com `angulo` em graus no sentido horário a partir de +x."""
+        self.x = np.broadcast_to(np.asarray(x, dtype=np.float64), (self.qtd,)).copy()
+        self.y = np.broadcast_to(np.asarray(y, dtype=np.float64), (self.qtd,)).copy()
+        self.theta = np.broadcast_to(np.radians(angulo), (self.qtd,)).copy()
+        self.velocidade[:] = 0
+        self.alvo[:] = 0
+
+    def comandar(self, motor1: np.ndarray, motor2: np.ndarray, limite: int):
+        """Pede as velocidades dos motores 1 (direito) e 2 (esquerdo), limitadas e truncadas como na placa."""
+        for indice, valor in enumerate((motor1, motor2)):
+            self.alvo[:, indice] = np.trunc(np.clip(valor, -limite, limite)) * MM_POR_VELOCIDADE
+
+    def integrar(self, segundos: float):
+        """Move todos os robôs por `segundos`, em passos de PASSO."""
+        for _ in range(round(segundos / PASSO)):
+            self.velocidade += (self.alvo - self.velocidade) * self.fator_resposta
+            direita, esquerda = (self.velocidade * PASSO).T
+            self.theta += (esquerda - direita) / BITOLA
+            distancia = (direita + esquerda) / 2
+            self.x += distancia * np.cos(self.theta)
+            self.y += distancia * np.sin(self.theta)
+            self.tempo += PASSO
+
+    def ponto(
+        self, frente: np.ndarray | float, esquerda: np.ndarray | float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Posição no campo de pontos presos aos robôs, com uma linha do resultado por robô."""
+        cos_theta, sin_theta = np.cos(self.theta)[:, None], np.sin(self.theta)[:, None]
+        frente, esquerda = np.atleast_1d(frente), np.atleast_1d(esquerda)
+        return (
+            self.x[:, None] + frente * cos_theta + esquerda * sin_theta,
+            self.y[:, None] + frente * sin_theta - esquerda * cos_theta,
+        )
+
+    def _materiais(self, esquerda: float) -> np.ndarray:
+        frente_area, esquerda_area = self._area
+        return self.campo.amostrar(*self.ponto(DISTANCIA_SENSORES + frente_area, esquerda + esquerda_area))
+
+    def le_reflexao(self) -> np.ndarray:
+        """Leituras dos quatro sensores de reflexão, na ordem de `le_reflexao`, com uma coluna por sensor."""
+        return np.stack(
+            [np.trunc(REFLEXAO[self._materiais(esquerda)].mean(axis=1)) for esquerda in POSICOES_REFLEXAO],
+            axis=1,
+        )
+
+    def le_rgbc(self, sensor: int) -> np.ndarray:
+        """RGBC do sensor de cor 1, 2 ou 3, com uma linha por robô."""
+        return np.trunc(RGBC[self._materiais(POSICOES_COR[sensor - 1])].mean(axis=1))
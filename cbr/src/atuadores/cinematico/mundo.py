@@ -0,0 +1,144 @@
+"""Cinemática de tração diferencial do robô sobre o `CampoGrade`.
+
+O estado do robô é a posição do centro do eixo das rodas e o ângulo `theta` em
+radianos, medido de +x em direção a +y (no sentido horário, já que y cresce para baixo).
+Cada roda responde à velocidade pedida com um atraso de primeira ordem e, nos
+movimentos por ângulo, para ao completar os graus pedidos, como a placa dos motores.
+
+O tempo só passa quando o `RelogioCinematico` avança: as esperas do código de controle
+(`relogio.dormir`) e as trocas de mensagens com as placas emuladas integram o movimento
+em passos de PASSO segundos.
+"""
+
+from math import cos, exp, pi, radians, sin
+
+from libs.relogio import RelogioVirtual
+from settings import DISTANCIA_PARA_GRAUS, GRAUS_PARA_GRAUS_ANGULAR_DIREITA, GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA
+
+from .campo import CampoGrade
+
+PASSO = 0.001  # Segundos por passo de integração
+CONSTANTE_TEMPO_MOTOR = 0.08  # Segundos para a roda chegar a 63% da velocidade pedida
+
+# Distância entre as rodas, em mm, a partir das conversões de giro do Robo: girando no
+# lugar, cada roda anda meia bitola vezes o ângulo
+BITOLA = (
+    (GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA + GRAUS_PARA_GRAUS_ANGULAR_DIREITA) / DISTANCIA_PARA_GRAUS * 180 / pi
+)
+
+
+class Roda:
+    """Motor com encoder de uma roda, em graus do motor no sentido da placa."""
+
+    PARADO = 0
+    GIRANDO_NORMAL = 1
+    GIRANDO_INVERTIDO = 2
+
+    def __init__(self):
+        self.velocidade = 0.0  # graus/s
+        self.alvo = 0.0
+        self.angulo = 0.0
+        # Graus que ainda faltam num movimento por ângulo, ou None girando sem limite
+        self.restante = None
+
+    def comandar(self, velocidade: float, angulo: float | None = None):
+        self.alvo = velocidade
+        self.restante = angulo if velocidade else None
+
+    @property
+    def estado(self) -> int:
+        if not self.alvo:
+            return self.PARADO
+        return self.GIRANDO_NORMAL if self.alvo > 0 else self.GIRANDO_INVERTIDO
+
+    def integrar(self, dt: float, fator_resposta: float) -> float:
+        """Avança `dt` segundos e retorna quantos graus a roda girou."""
+        self.velocidade += (self.alvo - self.velocidade) * fator_resposta
+        graus = self.velocidade * dt
+        if self.restante is not None:
+            if abs(graus) >= self.restante:
+                graus = self.restante if graus > 0 else -self.restante
+                self.comandar(0)
+                self.velocidade = 0.0
+            else:
+                self.restante -= abs(graus)
+        self.angulo += graus
+        return graus
+
+
+class RelogioCinematico(RelogioVirtual):
+    """Relógio virtual que move o robô do `MundoCinematico` a cada avanço."""
+
+    def __init__(self, mundo: 'MundoCinematico'):
+        super().__init__()
+        self.mundo = mundo
+
+    def avancar(self, segundos: float):
+        self.mundo.integrar(segundos)
+        super().avancar(segundos)
+
+
+class MundoCinematico:
+    """Robô de tração diferencial no campo, com as duas rodas e o relógio da simulação."""
+
+    # Motor 1 (roda direita) é montado espelhado: velocidade positiva na placa anda para trás
+    SENTIDO_RODAS = (-1, 1)
+
+    def __init__(
+        self,
+        campo: CampoGrade | None = None,
+        *,
+        constante_tempo_motor: float = CONSTANTE_TEMPO_MOTOR,
+        registrar_trajetoria: bool = False,
+    ):
+        self.campo = campo or CampoGrade()
+        self.relogio = RelogioCinematico(self)
+        self.rodas = (Roda(), Roda())
+        self.fator_resposta = 1 - exp(-PASSO / constante_tempo_motor)
+        self.x, self.y, self.theta = self.campo.posicao_no(0, 0) + (0.0,)
+        self.tempo = 0.0  # Tempo já integrado; fica até um PASSO atrás do relógio
+        self._resto = 0.0
+        # (tempo, x, y, theta) a cada passo, quando registrar_trajetoria
+        self.trajetoria = [] if registrar_trajetoria else None
+
+    def posicionar(self, x: float, y: float, angulo: float):
+        """Coloca o robô parado em (x, y) mm, com `angulo` em graus no sentido horário a partir de +x.
+
+        A trajetória registrada recomeça daqui.
+        """
+        self.x, self.y, self.theta = x, y, radians(angulo)
+        for roda in self.rodas:
+            roda.comandar(0)
+            roda.velocidade = 0.0
+        if self.trajetoria is not None:
+            self.trajetoria.clear()
+
+    def ponto(self, frente: float, esquerda: float) -> tuple[float, float]:
+        """Posição no campo de um ponto preso ao robô, `frente` mm à frente do eixo e `esquerda` mm à esquerda."""
+        cos_theta, sin_theta = cos(self.theta), sin(self.theta)
+        # Com y para baixo, a esquerda do robô é o vetor da frente girado no sentido anti-horário
+        return (
+            self.x + frente * cos_theta + esquerda * sin_theta,
+            self.y + frente * sin_theta - esquerda * cos_theta,
+        )
+
+    def integrar(self, segundos: float):
+        """Move o robô por `segundos`, em passos de PASSO; o resto fica para o próximo avanço."""
+        self._resto += segundos
+        while self._resto >= PASSO:
+            self._resto -= PASSO
+            self._passo()
+
+    def _passo(self):
+        direita, esquerda = (
+            sentido * roda.integrar(PASSO, self.fator_resposta) / DISTANCIA_PARA_GRAUS
+            for sentido, roda in zip(self.SENTIDO_RODAS, self.rodas, strict=True)
+        )
+        distancia = (direita + esquerda) / 2
+        # Com a roda esquerda andando mais o robô vira para a direita, que é o sentido de theta
+        self.theta += (esquerda - direita) / BITOLA
+        self.x += distancia * cos(self.theta)
+        self.y += distancia * sin(self.theta)
+        self.tempo += PASSO
+        if self.trajetoria is not None:
+            self.trajetoria.append((self.tempo, self.x, self.y, self.theta))
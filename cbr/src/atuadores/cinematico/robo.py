@@ -0,0 +1,26 @@
+"""`RoboSeguidorDeLinha` ligado às placas emuladas do `MundoCinematico`.
+
+Só a criação dos dispositivos muda: o seguidor de linha, os giros e os movimentos por
+distância são os métodos do robô real. A garra, os sensores de distância e o sensor de
+cor lateral não são emulados; os métodos que usam esses sensores não rodam aqui.
+"""
+
+from src.atuadores.robo.seguidor_linha import RoboSeguidorDeLinha
+from src.atuadores.simulador import TelaSimulada
+
+from .dispositivos import CorReflexaoEmulada, GiroscopioEmulado, MotoresEmulados
+from .mundo import MundoCinematico
+
+
+class RoboCinematico(RoboSeguidorDeLinha):
+    def __init__(self, mundo: MundoCinematico):
+        self.mundo = mundo
+        super().__init__(mundo.relogio)
+
+    def _iniciar_dispositivos(self):
+        self.motores = MotoresEmulados(self.mundo)
+        self.giroscopio = GiroscopioEmulado(self.mundo)
+        self.sensor_de_linha = CorReflexaoEmulada(self.mundo)
+        self.garra = None
+        self.sensor_cor_esquerdo = None
+        self.tela_teclado = TelaSimulada()
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Callable, Tuple
 
+from libs.relogio import Relogio
 from settings import VALOR_ENCRUZILHADA, VELOCIDADE_PADRAO
 
 
 class InterfaceAtuador(ABC):
+    # Relógio das esperas e medições de tempo, compartilhado com as estratégias
+    relogio: Relogio
+
     @abstractmethod
     def ande_certa_distancia(self, distancia: int, *, velocidade: int = VELOCIDADE_PADRAO) -> None:
         pass
@@ -50,3 +54,32 @@ class InterfaceAtuador(ABC):
     def pare(self) -> None:
         """Para todos os motores do robô"""
         pass
+
+    @abstractmethod
+    def seguir_linha_ate_cor(
+        self, funcao_cor: Callable[[tuple[int, int, int]], bool], *, velocidade: int, modo: int
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def ande_ate_cor(
+        self, funcao_cor: Callable[[tuple[int, int, int]], bool], *, velocidade: int = VELOCIDADE_PADRAO
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def ande_ate_deixar_de_ver_cor(
+        self, funcao_cor: Callable[[tuple[int, int, int]], bool], *, velocidade: int = VELOCIDADE_PADRAO
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def encontrar_linha_preta(self, *, velocidade: int = VELOCIDADE_PADRAO, valor: int = 70) -> None:
+        """Gira até os sensores encontrarem a linha preta"""
+        pass
+
+    @abstractmethod
+    def alinhe_entre_linhas(
+        self, dados_alinhamento: tuple[int, int], tolerancia: int = 5, *, velocidade: int = VELOCIDADE_PADRAO
+    ) -> None:
+        pass
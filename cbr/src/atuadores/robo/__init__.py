@@ -9,11 +9,16 @@ from typing import Callable
 from libs.giroscopio import Giroscopio
 from libs.motores import Motores
 from libs.portas import Portas
+from libs.relogio import Relogio
 from libs.sensorCorReflexao import CorReflexao
 from libs.tcs34725 import TCS34725
 from libs.vl53 import VL53L0X
 from settings import (
     CHAVE_SENSOR_COR_ESQUERDO,
+    DISTANCIA_PARA_GRAUS,
+    GRAUS_PARA_GRAUS_ANGULAR_DIREITA,
+    GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA,
+    MOTORES_ASSINCRONO,
     PORTA_SENSOR_COR_ESQUERDO,
     PORTA_SENSOR_COR_LINHA,
     VALOR_ENCRUZILHADA,
@@ -37,9 +42,9 @@ class Robo:
     """
 
     # Constantes de conversão
-    DISTANCIA_PARA_GRAUS = 800 / 300 * 1.6  # Fator de conversão de distância para graus do motor
-    GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA = 6.67
-    GRAUS_PARA_GRAUS_ANGULAR_DIREITA = 7.15
+    DISTANCIA_PARA_GRAUS = DISTANCIA_PARA_GRAUS  # Fator de conversão de distância para graus do motor
+    GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA = GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA
+    GRAUS_PARA_GRAUS_ANGULAR_DIREITA = GRAUS_PARA_GRAUS_ANGULAR_DIREITA
 
     # Índices dos motores
     MOTOR_DIREITO = 1
@@ -54,21 +59,33 @@ class Robo:
         VELOCIDADE = 0
         POTENCIA = 1
 
-    def __init__(self):
+    def __init__(self, relogio: Relogio | None = None):
         """
         Inicializa o robô configurando os motores, a garra e os sensores.
         Define a direção dos motores e o modo de freio.
+
+        O `relogio` é usado em todas as esperas e medições de tempo do controle (por
+        padrão, o tempo real); com um `RelogioVirtual` elas não esperam de verdade.
         """
         super().__init__()
+        self.relogio = relogio or Relogio()
+        self._iniciar_dispositivos()
 
-        # Inicialização dos motores
-        self.motores = Motores(True)
+        # Direção dos motores e modo de freio
         self.motores.direcao_motor(self.MOTOR_ESQUERDO, self.motores.NORMAL)
         self.motores.direcao_motor(self.MOTOR_DIREITO, self.motores.INVERTIDO)
         self.motores.set_modo_freio(self.motores.HOLD)
 
+    def _iniciar_dispositivos(self):
+        """Abre as placas e os sensores do robô.
+
+        O simulador cinemático sobrescreve este método para usar as placas emuladas.
+        """
+        # Inicialização dos motores
+        self.motores = Motores(True, self.relogio, assincrono=MOTORES_ASSINCRONO)
+
         # Inicialização da garra
-        self.garra = Garra()
+        self.garra = Garra(self.relogio)
 
         # Inicialização dos sensores de distância
         self.sensor_distancia_direito = VL53L0X(Portas.I2C4)
@@ -145,6 +162,8 @@ class Robo:
         angulo_atual = angulo_inicial
 
         while abs(angulo_atual - angulo_inicial) < abs(graus):
+            # Uma iteração por leitura nova do giroscópio, em vez de reler o mesmo ângulo
+            self.giroscopio.espera_leitura()
             angulo_atual = self.giroscopio.le_angulo_z()
 
             # Reduz velocidade ao se aproximar do alvo para maior precisão
@@ -247,6 +266,7 @@ class Robo:
         self, *, velocidade: int = VELOCIDADE_PADRAO, valor_encruzilhada: int = VALOR_ENCRUZILHADA
     ):
         while True:
+            self.sensor_de_linha.espera_leitura()
             extrema_direita, direita, esquerda, extrema_esquerda = self.sensor_de_linha.le_reflexao()
             media = (extrema_esquerda + esquerda + direita + extrema_direita) / 4
 
@@ -266,6 +286,7 @@ class Robo:
     ):
         valor_giroscopio_inicial = self.giroscopio.le_angulo_z()
         while True:
+            self.sensor_de_linha.espera_leitura()
             valor1 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_ESQUERDO)
             valor2 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_CENTRO)
             valor3 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_DIREITO)
@@ -290,6 +311,7 @@ class Robo:
     ):
         valor_giroscopio_inicial = self.giroscopio.le_angulo_z()
         while True:
+            self.sensor_de_linha.espera_leitura()
             valor1 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_ESQUERDO)
             valor2 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_CENTRO)
             valor3 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_DIREITO)
@@ -5,11 +5,11 @@ Fornece a classe `Garra`, que gerencia os servos da garra, alavanca e porta,
 além de métodos para ações como pegar, depositar e identificar blocos.
 """
 
-from time import sleep
-
 from libs.motores import Motores
 from libs.portas import Portas
+from libs.relogio import Relogio
 from libs.tcs34725 import TCS34725
+from settings import MOTORES_ASSINCRONO
 from src.definicao_cores import Cores, DefinicaoCoresBloco
 
 
@@ -45,19 +45,21 @@ class Garra:
     POSICAO_PORTA_ABERTA = 83
     POSICAO_PORTA_FECHADA = 180
 
-    def __init__(self):
+    def __init__(self, relogio: Relogio | None = None):
         """
         Inicializa a garra, configurando os motores e o sensor de cor.
         Define a posição inicial da garra (subida, aberta e com porta fechada).
+        As esperas usam o `relogio` (por padrão, o tempo real).
         """
-        self.motores = Motores(True)
+        self.relogio = relogio or Relogio()
+        self.motores = Motores(True, self.relogio, assincrono=MOTORES_ASSINCRONO)
         self.sensor_cor = TCS34725(self.PORTA_SENSOR_COR, chave_sensor=self.CHAVE_SENSOR_COR)
 
         # Configuração inicial da garra
         self.subir()
         self.abrir()
         self.fechar_porta()
-        sleep(1)
+        self.relogio.dormir(1)
 
     # =========== Controle da alavanca ===========
     def subir(self, *, tempo: float = 0):
@@ -102,11 +104,11 @@ class Garra:
     def depositar_bloco(self, abrir_porta: bool = True):
         self.abrir_e_abaixar_parcial_depositar(abrir_porta=abrir_porta)
         self.abrir_parcial(tempo=0.5)
-        sleep(0.2)
+        self.relogio.dormir(0.2)
         self.abrir()
         self.subir()
         self.fechar_porta()
-        sleep(0.5)
+        self.relogio.dormir(0.5)
 
     def ler_cor_bloco(self) -> Cores:
         rgbc = self.sensor_cor.le_rgbc(usar_calibracao=False)
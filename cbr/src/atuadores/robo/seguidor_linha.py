@@ -6,13 +6,16 @@ detectar cores e manipular blocos.
 
 from __future__ import annotations
 
-import time
-from time import sleep
 from typing import Callable
 
+from libs.relogio import Relogio
 from settings import (
+    KD_BAIXA_VELOCIDADE,
     KD_PADRAO,
+    KD_SIMPLES,
+    KP_BAIXA_VELOCIDADE,
     KP_PADRAO,
+    KP_SIMPLES,
     VALOR_ENCRUZILHADA,
     VELOCIDADE_BAIXA,
     VELOCIDADE_BASE_SEGUIDOR,
@@ -35,12 +38,12 @@ class RoboSeguidorDeLinha(Robo):
     """
 
     # Constantes para controle PID
-    KP_SIMPLES = 0.7
-    KD_SIMPLES = 0.7
+    KP_SIMPLES = KP_SIMPLES
+    KD_SIMPLES = KD_SIMPLES
     VALOR_MAXIMO = 100
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, relogio: Relogio | None = None):
+        super().__init__(relogio)
         # Variáveis de estado para controle PID
         self.erro_anterior = 0
         self.erro_anterior_simples = 0
@@ -114,7 +117,7 @@ class RoboSeguidorDeLinha(Robo):
         elif modo == Robo.ModoMotor.VELOCIDADE:
             self.motores.velocidade_motores(potencia1, potencia2)
 
-        sleep(0.02)
+        self.relogio.dormir(0.02)
 
     def seguir_linha_distancia(
         self,
@@ -164,14 +167,14 @@ class RoboSeguidorDeLinha(Robo):
         evita a detecção de falsos positivos, exigindo que o robô siga por um tempo mínimo.
         """
         # Se tempo_minimo for maior que 0, espera esse tempo antes de começar a detectar encruzilhadas
-        tempo_inicio_execucao = time.time()
+        tempo_inicio_execucao = self.relogio.agora()
 
         while True:
             extrema_direita, direita, esquerda, extrema_esquerda = self.sensor_de_linha.le_reflexao()
             # media = (extrema_esquerda + esquerda + direita + extrema_direita) // 4
 
             # Só detecta a encruzilhada se já passou o tempo mínimo definido
-            tempo_atual = time.time() - tempo_inicio_execucao
+            tempo_atual = self.relogio.agora() - tempo_inicio_execucao
             # if media < valor_encruzilhada and tempo_atual >= tempo_minimo:
             #     break
             if (
@@ -198,7 +201,7 @@ class RoboSeguidorDeLinha(Robo):
                     + DefinicaoCoresLinha.e_verde(valor3)
                 ) >= 2:
                     self.pare_suave()
-                    sleep(1)
+                    self.relogio.dormir(1)
                     self.pare()
                     valor1 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_ESQUERDO)
                     valor2 = self.sensor_de_linha.le_hsv(self.SENSOR_COR_CENTRO)
@@ -241,13 +244,13 @@ class RoboSeguidorDeLinha(Robo):
         self,
         tempo=0.5,
     ):
-        tempo_inicial = time.time()
-        while time.time() - tempo_inicial < tempo:
+        tempo_inicial = self.relogio.agora()
+        while self.relogio.agora() - tempo_inicial < tempo:
             self.seguir_linha(
                 velocidade=0,
                 modo=Robo.ModoMotor.VELOCIDADE,
             )
-            sleep(0.02)
+            self.relogio.dormir(0.02)
 
     # ====================================================================
     # SEGUIDOR DE LINHA SIMPLES
@@ -285,7 +288,7 @@ class RoboSeguidorDeLinha(Robo):
         elif modo == Robo.ModoMotor.VELOCIDADE:
             self.motores.velocidade_motores(potencia2, potencia1)
 
-        sleep(0.025)
+        self.relogio.dormir(0.025)
 
     def seguir_linha_simples_distancia(
         self,
@@ -348,8 +351,8 @@ class RoboSeguidorDeLinha(Robo):
         direcao=DirecaoSeguirLinhaSimples.NORTE,
         tempo=0.8,
     ):
-        tempo_inicial = time.time()
-        while time.time() - tempo_inicial < tempo:
+        tempo_inicial = self.relogio.agora()
+        while self.relogio.agora() - tempo_inicial < tempo:
             self.seguir_linha_simples(
                 velocidade=0,
                 indice_sensor=indice_sensor,
@@ -357,7 +360,7 @@ class RoboSeguidorDeLinha(Robo):
                 modo=Robo.ModoMotor.VELOCIDADE,
                 direcao=direcao,
             )
-            sleep(0.02)
+            self.relogio.dormir(0.02)
 
         self.pare()
 
@@ -403,8 +406,8 @@ class RoboSeguidorDeLinha(Robo):
             70,
             velocidade=VELOCIDADE_BAIXA // 2,
             modo=Robo.ModoMotor.VELOCIDADE,
-            kp=0.2,
-            kd=0.2,
+            kp=KP_BAIXA_VELOCIDADE,
+            kd=KD_BAIXA_VELOCIDADE,
         )
 
         self.voltar_encruzilhada(velocidade=VELOCIDADE_BAIXA)
@@ -413,14 +416,14 @@ class RoboSeguidorDeLinha(Robo):
         self.ande_certa_distancia(distancia, velocidade=VELOCIDADE_BAIXA)
 
         self.garra.pegar_bloco()
-        sleep(1)
+        self.relogio.dormir(1)
 
         # Primeira verificação da cor do bloco
         cor = self.garra.ler_cor_bloco()
         self.tela_teclado.escreve_cor(cor)
 
         if cor is None or cor not in posicoes_lixeiras:
-            sleep(1)
+            self.relogio.dormir(1)
             cor = self.garra.ler_cor_bloco()
             self.tela_teclado.escreve_cor(cor)
 
@@ -433,7 +436,7 @@ class RoboSeguidorDeLinha(Robo):
 
         # Levanta a garra e faz uma segunda verificação da cor
         self.garra.subir()
-        sleep(0.5)
+        self.relogio.dormir(0.5)
         cor = self.garra.ler_cor_bloco()
         self.tela_teclado.escreve_cor(cor)
         if cor == Cores.BRANCO or cor is None or cor not in posicoes_lixeiras:
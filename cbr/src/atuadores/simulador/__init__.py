@@ -1,17 +1,60 @@
+"""Simulador do robô sobre um campo sorteado com blocos espelhados.
+
+Com `renderizar=False` o simulador roda sem desenhar nada e sem importar o
+matplotlib, o que permite simular muitas partidas rapidamente. Com a renderização
+ligada, o grafo é desenhado uma única vez e a cada movimento só o desenho do robô
+(com as quatro imagens já rotacionadas) e as cores das arestas são atualizados.
+
+O simulador conta os movimentos, giros e blocos pegos e estima o tempo de cada ação
+com o `ModeloTempo`, a partir das constantes e velocidades do robô real. O tempo
+simulado fica no `relogio` (um `RelogioVirtual`), que as estratégias também usam nas
+suas esperas. Para saber quanto falta até a
+próxima encruzilhada, o simulador guarda o quanto os sensores já passaram da última.
+Com `tempo_limite` ou `limite_acoes`, a ação que ultrapassar o limite lança
+`FimDoEpisodio`.
+
+Os blocos têm cores e só os de cor com lixeira são levados; os brancos, e os de cor
+sem lixeira, ficam no campo. A área verde e as lixeiras ficam em `area_verde.py` e a
+partida completa, com coleta e depósito, em `partida.py`. Campos sorteados em lote e
+salvos em disco (`campos.py`) são recriados com `lixos` e `lixeiras`.
+
+Com um `ModeloRuido` (`ruido.py`), as leituras dos sensores laterais e das cores dos
+blocos e das lixeiras passam a errar. O robô simulado confere a cor do bloco como o
+`RoboSeguidorDeLinha.pegar_bloco`, e um bloco levado à lixeira errada conta em
+`depositos_errados`.
+"""
+
 import random
 from enum import Enum
 from pathlib import Path
+from typing import Sequence
 
-import matplotlib.image as mpimg
 import networkx as nx
-from matplotlib import pyplot as plt
-from matplotlib.offsetbox import AnnotationBbox, OffsetImage
-from scipy.ndimage import rotate
+from libs.relogio import RelogioVirtual
+from settings import VELOCIDADE_BASE_SEGUIDOR, VELOCIDADE_PADRAO
+from src.definicao_cores import Cores
 
 from ..interface_atuador import InterfaceAtuador
+from .area_verde import AreaVerdeSimulada
+from .modelo_tempo import ModeloTempo
+from .ruido import ModeloRuido
+
+
+class FimDoEpisodio(Exception):
+    """Lançada quando a simulação passa do tempo ou da quantidade de ações permitidas."""
+
+
+class TelaSimulada:
+    """Substitui a `TelaTeclado` do robô, sem mostrar nada."""
 
+    def escreve_posicao(self, posicao: tuple[int, int]):
+        pass
+
+    def escreve_cor(self, cor: Cores):
+        pass
 
-class Simulador(InterfaceAtuador):
+
+class Simulador(AreaVerdeSimulada, InterfaceAtuador):
     class OpçõesLixos(Enum):
         AZUL = {'cor': 'blue'}
         VERMELHO = {'cor': 'red'}
@@ -32,9 +75,29 @@ class Simulador(InterfaceAtuador):
         ESQUERDA = 3
         DESCONHECIDA = 4
 
-    def __init__(self, qtd_blocos=21, seed=None, altura=5, largura=6):
+    class ModoMotor:
+        VELOCIDADE = 0
+        POTENCIA = 1
+
+    def __init__(
+        self,
+        qtd_blocos=21,
+        seed=None,
+        altura=5,
+        largura=6,
+        renderizar=True,
+        tempo_limite: float | None = None,
+        limite_acoes: int | None = None,
+        modelo_tempo: ModeloTempo | None = None,
+        lixeiras: list[Cores] | None = None,
+        lixos: Sequence[int] | None = None,
+        relogio: RelogioVirtual | None = None,
+        ruido: ModeloRuido | None = None,
+    ):
         self.altura = altura
         self.largura = largura
+        if lixos is not None:
+            qtd_blocos = sum(codigo != Cores.VAZIO.value for codigo in lixos)
         self.qtd_blocos = qtd_blocos
         self.grafo: nx.Graph = nx.grid_2d_graph(altura, largura)
         self.imagem_robo = Path(__file__).parent / 'robo.jpg'
@@ -56,33 +119,78 @@ class Simulador(InterfaceAtuador):
         opções = list(self.OpçõesLixos)
         opções.remove(self.OpçõesLixos.VAZIO)
 
+        # Campo já sorteado, com os códigos `Cores` na ordem das arestas (ver campos.py)
+        if lixos is not None:
+            for (u, v), codigo in zip(self.grafo.edges, lixos, strict=True):
+                self.grafo[u][v]['lixo'] = self.OpçõesLixos[Cores(codigo).name]
+        else:
+            self._sortear_lixos(opções)
+
+        # Ordem das lixeiras como em EstrategiaAreaVerde.posicoes_lixeiras: a de índice i
+        # fica alinhada com a linha altura - 1 - i do mapa
+        if lixeiras is None:
+            cores = [Cores[lixo.name] for lixo in opções if lixo != self.OpçõesLixos.BRANCO]
+            lixeiras = random.sample(cores, self.QTD_LIXEIRAS)
+        self.lixeiras = lixeiras
+        # Cores das lixeiras como o robô as leu em analisar_lixeiras
+        self.lixeiras_lidas: list[Cores] | None = None
+
+        self.tela_teclado = TelaSimulada()
+        self.tempo_limite = tempo_limite
+        self.limite_acoes = limite_acoes
+        self.movimentos = 0
+        self.giros = 0
+        self.blocos_pegos = 0
+        self.blocos_depositados = 0
+        self.depositos_errados = 0
+        self.acoes = 0
+        self.modelo_tempo = modelo_tempo or ModeloTempo()
+        self.relogio = relogio or RelogioVirtual()
+        self.ruido = ruido or ModeloRuido()
+        # Cores que o sensor da garra pode confundir, e a cor de verdade do bloco na garra
+        self.cores_blocos = [Cores[lixo.name] for lixo in opções]
+        self.cor_carregada = None
+        # Quanto os sensores de linha estão além da última encruzilhada, em mm
+        self.afastamento = 0.0
+        # Na área verde (coluna -1), quanto o robô está além da borda, em direção às lixeiras
+        self.profundidade = 0.0
+
+        self.renderizar = renderizar
+        self._figura = None
+        if renderizar:
+            from matplotlib import pyplot as plt  # noqa: PLC0415
+
+            plt.ion()
+
+    def _sortear_lixos(self, opções: list):
+        """Sorteia os blocos em pares espelhados pelo centro do campo."""
         arestas = list(self.grafo.edges)
 
-        if not self._é_par(qtd_blocos):
+        if not self._é_par(self.qtd_blocos):
             aresta_central = (
-                ((altura - 1) // 2, (largura - 1) // 2),
-                (altura // 2, largura // 2),
+                ((self.altura - 1) // 2, (self.largura - 1) // 2),
+                (self.altura // 2, self.largura // 2),
             )
             self.grafo[aresta_central[0]][aresta_central[1]]['lixo'] = random.choice(opções)
             arestas.remove(aresta_central)
 
-        elif self._é_par(qtd_blocos) and not self._é_par(len(self.grafo.edges)):
+        elif self._é_par(self.qtd_blocos) and not self._é_par(len(self.grafo.edges)):
             aresta_central = (
-                ((altura - 1) // 2, (largura - 1) // 2),
-                (altura // 2, largura // 2),
+                ((self.altura - 1) // 2, (self.largura - 1) // 2),
+                (self.altura // 2, self.largura // 2),
             )
             arestas.remove(aresta_central)
 
-        for _ in range(qtd_blocos // 2):
+        for _ in range(self.qtd_blocos // 2):
             selecionada = random.choice(arestas)
             u_selecionada, v_selecionada = selecionada
             u_espelho = (
-                abs(altura - u_selecionada[0] - 1),
-                abs(largura - u_selecionada[1] - 1),
+                abs(self.altura - u_selecionada[0] - 1),
+                abs(self.largura - u_selecionada[1] - 1),
             )
             v_espelho = (
-                abs(altura - v_selecionada[0] - 1),
-                abs(largura - v_selecionada[1] - 1),
+                abs(self.altura - v_selecionada[0] - 1),
+                abs(self.largura - v_selecionada[1] - 1),
             )
 
             lixo_selecionado = random.choice(opções)
@@ -92,44 +200,82 @@ class Simulador(InterfaceAtuador):
             arestas.remove(selecionada)
             arestas.remove((v_espelho, u_espelho))
 
-        plt.ion()
-
     @staticmethod
     def _é_par(numero: int | float) -> bool:
         return numero % 2 == 0
 
-    def print(self):
-        plt.clf()
+    def _iniciar_desenho(self):
+        """Desenha o grafo uma vez e prepara as imagens do robô em cada direção."""
+        import matplotlib.image as mpimg  # noqa: PLC0415
+        from matplotlib import pyplot as plt  # noqa: PLC0415
+        from matplotlib.offsetbox import OffsetImage  # noqa: PLC0415
+        from scipy.ndimage import rotate  # noqa: PLC0415
+
+        self._figura = plt.gcf()
+        self._figura.clf()
+        eixos = self._figura.gca()
+        eixos.set_axis_off()
 
         pos = {(i, j): (j, -i) for i in range(self.altura) for j in range(self.largura)}
-        cores_arestas = [self.grafo[u][v]['lixo']['cor'] for u, v in self.grafo.edges]
-
-        nx.draw(
-            self.grafo,
-            pos=pos,
-            with_labels=True,
-            node_size=500,
-            node_color='lightblue',
-            edge_color=cores_arestas,
-            width=5,
-            font_size=8,
-            font_color='black',
+        nx.draw_networkx_nodes(self.grafo, pos, ax=eixos, node_size=500, node_color='lightblue')
+        nx.draw_networkx_labels(self.grafo, pos, ax=eixos, font_size=8, font_color='black')
+        self._ordem_arestas = list(self.grafo.edges)
+        self._desenho_arestas = nx.draw_networkx_edges(
+            self.grafo, pos, ax=eixos, edgelist=self._ordem_arestas, width=5
         )
+        self._cores_arestas = None
+
+        # Índice pela direção (DESCONHECIDA desenha como CIMA)
         img = mpimg.imread(self.imagem_robo)
-        print(f'Posição atual do robô: {self.pos_atual}, Direção: {self.direcao}')
-        img_rotated = rotate(img, angle=self.direcao * -90, reshape=True)
-        imagebox = OffsetImage(img_rotated, zoom=0.6)
-        ab = AnnotationBbox(imagebox, (self.pos_atual[1], -self.pos_atual[0]), frameon=False)
+        imagens = [
+            OffsetImage(rotate(img, angle=direcao * -90, reshape=True), zoom=0.6) for direcao in range(4)
+        ]
+        self._imagens_robo = [*imagens, imagens[0]]
+        self._desenho_robo = None
 
-        plt.gca().add_artist(ab)
+        # Só o robô é redesenhado a cada movimento; o resto fica em um fundo guardado,
+        # refeito quando a janela é redesenhada ou a cor de alguma aresta muda
+        self._figura.canvas.mpl_connect('draw_event', self._guardar_fundo)
 
-        plt.draw()
+    def _guardar_fundo(self, _evento=None):
+        self._fundo = self._figura.canvas.copy_from_bbox(self._figura.bbox)
 
+    def print(self):
+        if not self.renderizar:
+            return
+
+        from matplotlib import pyplot as plt  # noqa: PLC0415
+        from matplotlib.offsetbox import AnnotationBbox  # noqa: PLC0415
+
+        if self._figura is None or not plt.fignum_exists(self._figura.number):
+            self._iniciar_desenho()
+
+        print(f'Posição atual do robô: {self.pos_atual}, Direção: {self.direcao}')
+        cores_arestas = [self.grafo[u][v]['lixo']['cor'] for u, v in self._ordem_arestas]
+        if cores_arestas != self._cores_arestas:
+            self._cores_arestas = cores_arestas
+            self._desenho_arestas.set_color(cores_arestas)
+            self._figura.canvas.draw()
+
+        if self._desenho_robo is not None:
+            self._desenho_robo.remove()
+        self._desenho_robo = AnnotationBbox(
+            self._imagens_robo[self.direcao], (self.pos_atual[1], -self.pos_atual[0]), frameon=False
+        )
+        self._desenho_robo.set_animated(True)
+        self._figura.gca().add_artist(self._desenho_robo)
+
+        canvas = self._figura.canvas
+        canvas.restore_region(self._fundo)
+        self._figura.draw_artist(self._desenho_robo)
+        canvas.blit(self._figura.bbox)
+        canvas.flush_events()
         plt.show(block=False)
 
     def ir_para_0_0(self):
         self.pos_anterior = (0, -1)
         self.pos_atual = (0, 0)
+        self.afastamento = self.profundidade = 0.0
         self.print()
 
     def calcular_direcao(self, pos_anterior: tuple[int, int], pos_atual: tuple[int, int]):
@@ -192,11 +338,35 @@ class Simulador(InterfaceAtuador):
             except KeyError:
                 sensores.append(1000)
 
-        return sensores
+        return [self.ruido.distancia(valor) for valor in sensores]
 
-    def ande_certa_distancia(self, distancia: int, velocidade: int): ...
+    @property
+    def blocos_restantes(self) -> int:
+        """Quantidade de blocos no campo que têm lixeira da sua cor, entre as lixeiras lidas pelo robô."""
+        lixeiras = self.lixeiras_lidas or self.lixeiras
+        return sum(Cores[lixo.name] in lixeiras for _, _, lixo in self.grafo.edges.data('lixo'))
 
-    def gire_graus(self, graus: int, velocidade: int):
+    @property
+    def tempo(self) -> float:
+        """Segundos simulados desde o início."""
+        return self.relogio.agora()
+
+    def _gastar(self, segundos: float):
+        """Conta uma ação e seu tempo, encerrando o episódio se algum limite for ultrapassado."""
+        self.acoes += 1
+        self.relogio.avancar(segundos)
+        if self.tempo_limite is not None and self.tempo > self.tempo_limite:
+            raise FimDoEpisodio(f'Tempo esgotado: {self.tempo:.1f} s')
+        if self.limite_acoes is not None and self.acoes > self.limite_acoes:
+            raise FimDoEpisodio(f'Limite de ações atingido: {self.acoes}')
+
+    def ande_certa_distancia(self, distancia: int, *, velocidade: int = VELOCIDADE_PADRAO):
+        self.afastamento += distancia if velocidade >= 0 else -distancia
+        self._gastar(self.modelo_tempo.ande_certa_distancia(distancia, velocidade))
+
+    def _girar(self, graus: int, segundos: float):
+        if self.na_area_verde:
+            self._assentar_area_verde()
         no_frente, no_direita, no_atras, no_esquerda = self.nos_visinhos
         if graus == 90:
             self.pos_anterior = no_esquerda
@@ -204,31 +374,105 @@ class Simulador(InterfaceAtuador):
             self.pos_anterior = no_direita
         if graus in {-180, 180}:
             self.pos_anterior = no_frente
+
+        if graus % 360:
+            self.giros += 1
+        self._gastar(segundos)
         self.print()
 
-    def seguir_ate_encruzilhada(self, velocidade: int):
+    def gire_graus(self, graus: int, *, velocidade: int = VELOCIDADE_PADRAO):
+        self._girar(graus, self.modelo_tempo.gire_graus(graus, velocidade))
+
+    def gire_graus_giroscopio(self, graus: int, *, velocidade: int = VELOCIDADE_PADRAO):
+        self._girar(graus, self.modelo_tempo.gire_graus_giroscopio(graus, velocidade))
+
+    def seguir_ate_encruzilhada(
+        self,
+        modo: int = ModoMotor.POTENCIA,
+        velocidade: int = VELOCIDADE_BASE_SEGUIDOR,
+        tempo_minimo: float = 0,
+        valor_encruzilhada: int = 0,
+        com_cubo: bool = False,
+    ) -> bool:
         no_frente, no_direita, no_atras, no_esquerda = self.nos_visinhos
+        if self.na_area_verde and (self.direcao != self.Direcoes.DIREITA or self.profundidade):
+            raise RuntimeError('Não há linha para seguir dentro da área verde')
+
+        distancia = max(0.0, self._comprimento(self.pos_atual, no_frente) - self.afastamento)
         self.pos_anterior, self.pos_atual = self.pos_atual, no_frente
+        self.movimentos += 1
+        self.afastamento = 0.0
+        self._gastar(self.modelo_tempo.seguir_ate_encruzilhada(distancia, velocidade))
         self.print()
+        return True
 
-    def voltar_encruzilhada(self):
-        pass
+    def voltar_encruzilhada(self, *, velocidade: int = VELOCIDADE_PADRAO):
+        distancia = max(0.0, self.afastamento)
+        self.afastamento = 0.0
+        self._gastar(self.modelo_tempo.voltar_encruzilhada(distancia, velocidade))
 
-    def pegar_bloco(self) -> bool:
+    def pegar_bloco(self, distancia: int = 0, posicoes_lixeiras: list | None = None) -> Cores | None:
+        """Pega o bloco à frente e retorna sua cor, ou None se não houver bloco.
+
+        O bloco branco, e o de cor sem lixeira, não é levado: o robô o devolve à aresta.
+        """
         no_frente, no_direita, no_atras, no_esquerda = self.nos_visinhos
-        pegou = False
+        lixo = self.OpçõesLixos.VAZIO
         if self.grafo.has_edge(self.pos_atual, no_frente):
+            lixo = self.grafo[self.pos_atual][no_frente]['lixo']
+
+        if posicoes_lixeiras is None:
+            posicoes_lixeiras = self.lixeiras
+        if lixo == self.OpçõesLixos.VAZIO:
+            segundos, self.afastamento = self.modelo_tempo.pegar_bloco(self.afastamento, distancia, False)
+            self._gastar(segundos)
+            return None
+
+        cor_real = Cores[lixo.name]
+        cor, releu, conferiu = self._ler_cor_bloco(cor_real, posicoes_lixeiras)
+        valido = conferiu and self._cor_valida(cor, posicoes_lixeiras)
+        segundos, self.afastamento = self.modelo_tempo.pegar_bloco(self.afastamento, distancia, valido)
+        # Caminhos que só acontecem com ruído: a releitura antes de levantar um bloco que
+        # fica, e o bloco levantado que a conferência manda soltar
+        if valido and releu:
+            segundos += self.modelo_tempo.TEMPO_SEGUNDA_LEITURA
+        elif conferiu and not valido:
+            segundos += self.modelo_tempo.TEMPO_SUBIR_E_CONFERIR
+        self._gastar(segundos)
+        if valido:
             self.grafo[self.pos_atual][no_frente]['lixo'] = self.OpçõesLixos.VAZIO
-            pegou = True
+            self.blocos_pegos += 1
+            self.cor_carregada = cor_real
 
         self.print()
-        return pegou
+        return cor
 
-    def seguir_linha(self):
+    @staticmethod
+    def _cor_valida(cor: Cores | None, posicoes_lixeiras: list) -> bool:
+        return cor in posicoes_lixeiras and cor != Cores.BRANCO
+
+    def _ler_cor_bloco(self, cor_real: Cores, posicoes_lixeiras: list) -> tuple[Cores, bool, bool]:
+        """Leituras da cor do bloco na garra, como em `RoboSeguidorDeLinha.pegar_bloco`.
+
+        Retorna a última cor lida, se ela foi relida antes de levantar a garra e se o
+        bloco foi levantado para a conferência.
+        """
+        cor = self.ruido.cor(cor_real, self.cores_blocos)
+        releu = not self._cor_valida(cor, posicoes_lixeiras)
+        if releu:
+            cor = self.ruido.cor(cor_real, self.cores_blocos)
+        if not self._cor_valida(cor, posicoes_lixeiras):
+            return cor, releu, False
+        return self.ruido.cor(cor_real, self.cores_blocos), releu, True
+
+    def seguir_linha(self, *, velocidade: int = VELOCIDADE_PADRAO, modo: int = ModoMotor.VELOCIDADE):
         pass
 
     def pare(self):
         pass
 
+    def pare_suave(self):
+        pass
+
     def escreve_posicao(self, posicao: tuple[int, int]):
         pass
@@ -0,0 +1,217 @@
+"""Área verde e lixeiras do `Simulador`.
+
+A área verde fica à esquerda da coluna 0 do mapa e, do outro lado dela, as lixeiras
+ficam em fila na linha amarela, cada uma alinhada com uma linha do mapa. No
+simulador a borda da área verde na linha `i` é o nó `(i, -1)`. Dentro da área verde
+não há encruzilhadas: o robô guarda a profundidade em que está e, ao girar depois de
+andar para cima ou para baixo, passa para a linha mais próxima.
+
+As cores do piso são representadas por um valor HSV de cada região, avaliado com as
+funções de `DefinicaoCoresLinha` que a estratégia passa para o robô.
+
+As cores das lixeiras passam pelo `ModeloRuido` do simulador. O depósito usa as cores
+lidas, como a estratégia faz, e a lixeira de verdade decide se o bloco foi para a certa.
+"""
+
+from typing import Callable
+
+from settings import VELOCIDADE_BAIXA, VELOCIDADE_MAXIMA, VELOCIDADE_PADRAO
+from src.definicao_cores import Cores, DefinicaoCoresLinha, ValorAlinhamentoSeguidor
+
+
+class AreaVerdeSimulada:
+    """Movimentos na área verde, leitura das lixeiras e depósito dos blocos no `Simulador`."""
+
+    QTD_LIXEIRAS = 5
+
+    # Geometria da área verde, em mm. A área verde fica à esquerda da coluna 0 e as
+    # lixeiras ficam na linha amarela, do outro lado dela
+    DISTANCIA_AREA_VERDE = 150  # Da encruzilhada da coluna 0 até a borda da área verde
+    LARGURA_AREA_VERDE = 250  # Da borda da área verde até a linha amarela das lixeiras
+
+    # Cor do piso (HSV) vista pelos sensores de linha, avaliada com as funções de DefinicaoCoresLinha
+    HSV_AREA_VERDE = (45, 40, 40)
+    HSV_LINHA_AMARELA = (18, 60, 90)
+
+    @property
+    def na_area_verde(self) -> bool:
+        return self.pos_atual[1] < 0
+
+    def _comprimento(self, u: tuple[int, int], v: tuple[int, int]) -> float:
+        """Distância entre duas encruzilhadas vizinhas; a coluna -1 é a borda da área verde."""
+        if u[1] < 0 or v[1] < 0:
+            return self.DISTANCIA_AREA_VERDE
+        return self.modelo_tempo.comprimento_aresta
+
+    def _assentar_area_verde(self):
+        """Converte o que o robô andou na área verde em linha e profundidade antes de um giro.
+
+        Andando para cima ou para baixo o robô passa para a linha mais próxima (a área
+        verde não tem encruzilhadas); andando para os lados muda a profundidade.
+        """
+        direcao = self.direcao
+        if direcao in (self.Direcoes.CIMA, self.Direcoes.BAIXO):
+            sentido = 1 if direcao == self.Direcoes.BAIXO else -1
+            linhas = round(self.afastamento / self.modelo_tempo.comprimento_aresta)
+            linha = min(max(self.pos_atual[0] + sentido * linhas, 0), self.altura - 1)
+            self.pos_anterior, self.pos_atual = (linha - sentido, -1), (linha, -1)
+        else:
+            sentido = 1 if direcao == self.Direcoes.ESQUERDA else -1
+            self.profundidade = max(0.0, self.profundidade + sentido * self.afastamento)
+        self.afastamento = 0.0
+
+    def _ir_ate_cor(self, funcao_cor: Callable[[tuple[int, int, int]], bool], velocidade: int):
+        """Anda para a esquerda pela linha até o piso ter a cor procurada.
+
+        Na linha de cada encruzilhada da coluna 0, indo para a esquerda, o robô encontra
+        a borda da área verde e depois a linha amarela das lixeiras.
+        """
+        if self.direcao != self.Direcoes.ESQUERDA:
+            raise RuntimeError('Só há cores no piso à esquerda do mapa')
+
+        # Quanto falta até a borda da área verde (negativo se o robô já passou dela)
+        if self.na_area_verde:
+            ate_borda = -(self.profundidade + self.afastamento)
+        else:
+            ate_borda = (
+                self.pos_atual[1] * self.modelo_tempo.comprimento_aresta
+                + self.DISTANCIA_AREA_VERDE
+                - self.afastamento
+            )
+
+        if funcao_cor(self.HSV_AREA_VERDE):
+            distancia = max(0.0, ate_borda)
+        elif funcao_cor(self.HSV_LINHA_AMARELA):
+            distancia = max(0.0, ate_borda + self.LARGURA_AREA_VERDE)
+        else:
+            raise RuntimeError('Cor procurada não existe no caminho do robô')
+
+        linha = self.pos_atual[0]
+        self.pos_anterior, self.pos_atual = (linha, 0), (linha, -1)
+        self.profundidade = distancia - ate_borda
+        self.afastamento = 0.0
+        self._gastar(self.modelo_tempo.ande_ate_cor(distancia, velocidade))
+        self.print()
+
+    def seguir_linha_ate_cor(
+        self,
+        funcao_cor: Callable[[tuple[int, int, int]], bool],
+        *,
+        velocidade: int = VELOCIDADE_PADRAO,
+        modo: int | None = None,
+    ):
+        self._ir_ate_cor(funcao_cor, velocidade)
+
+    def ande_ate_cor(
+        self, funcao_cor: Callable[[tuple[int, int, int]], bool], *, velocidade: int = VELOCIDADE_PADRAO
+    ):
+        self._ir_ate_cor(funcao_cor, velocidade)
+
+    def ande_ate_deixar_de_ver_cor(
+        self, funcao_cor: Callable[[tuple[int, int, int]], bool], *, velocidade: int = VELOCIDADE_PADRAO
+    ):
+        """Sai da área verde pela direita e para na borda, com a linha da encruzilhada à frente."""
+        if not (self.na_area_verde and funcao_cor(self.HSV_AREA_VERDE)):
+            return
+        if self.direcao != self.Direcoes.DIREITA:
+            raise RuntimeError('O robô só sai da área verde andando para a direita')
+
+        distancia = max(0.0, self.profundidade - self.afastamento)
+        self.profundidade = self.afastamento = 0.0
+        self._gastar(self.modelo_tempo.ande_ate_cor(distancia, velocidade))
+
+    def encontrar_linha_preta(self, *, velocidade: int = VELOCIDADE_PADRAO, valor: int = 70):
+        self._gastar(self.modelo_tempo.encontrar_linha_preta(velocidade))
+
+    def alinhe_entre_linhas(
+        self,
+        dados_alinhamento: tuple[int, int] = ValorAlinhamentoSeguidor.VERDE_AMARELO,
+        tolerancia: int = 5,
+        *,
+        velocidade: int = VELOCIDADE_PADRAO,
+    ):
+        self._gastar(self.modelo_tempo.alinhe_entre_linhas(velocidade))
+
+    def analisar_lixeiras(self) -> list[Cores]:
+        """Lê a cor de todas as lixeiras e vai para (0, 0). Retorna as cores lidas em ordem.
+
+        Corresponde ao início de `EstrategiaAreaVerde.iniciar`: atravessa a área verde até
+        a linha amarela, vai até o fim das lixeiras, lê cada uma parando ao lado dela e
+        volta ao mapa pela linha 0. Como em `EstrategiaAreaVerde.analisar_lixeiras`, uma
+        cor que já foi lida é relida 10 mm à frente.
+        """
+        modelo = self.modelo_tempo
+        comprimento = modelo.comprimento_aresta
+        segundos = (
+            modelo.ande_ate_cor(self.LARGURA_AREA_VERDE, VELOCIDADE_MAXIMA)
+            + modelo.alinhe_entre_linhas(VELOCIDADE_BAIXA)
+            + modelo.gire_graus(90, VELOCIDADE_MAXIMA)
+            + modelo.ande_ate_cor(comprimento * self.QTD_LIXEIRAS / 2, VELOCIDADE_MAXIMA)
+            + modelo.gire_graus_giroscopio(180, VELOCIDADE_MAXIMA)
+            # Em cada lixeira o robô para ao lado dela e avança 70 mm para ler a cor
+            + self.QTD_LIXEIRAS * (modelo.mover(comprimento, VELOCIDADE_PADRAO) + modelo.pare_suave())
+            # retornar_para_0_0 com giro_especial
+            + modelo.gire_graus_giroscopio(-15, VELOCIDADE_BAIXA)
+            + modelo.ande_certa_distancia(125, VELOCIDADE_PADRAO)
+            + modelo.gire_graus_giroscopio(107, VELOCIDADE_PADRAO)
+            + modelo.ande_ate_cor(self.LARGURA_AREA_VERDE, VELOCIDADE_MAXIMA)
+            + modelo.ande_certa_distancia(30, VELOCIDADE_PADRAO)
+            + modelo.encontrar_linha_preta(VELOCIDADE_PADRAO)
+            + modelo.seguir_ate_encruzilhada(self.DISTANCIA_AREA_VERDE - 30, VELOCIDADE_PADRAO)
+        )
+        opcoes = [cor for cor in self.cores_blocos if cor != Cores.BRANCO]
+        self.lixeiras_lidas = []
+        for lixeira in self.lixeiras:
+            cor = self.ruido.cor(lixeira, opcoes)
+            if cor in self.lixeiras_lidas:
+                segundos += modelo.ande_certa_distancia(10, VELOCIDADE_BAIXA)
+                cor = self.ruido.cor(lixeira, opcoes)
+            self.lixeiras_lidas.append(cor)
+
+        self._gastar(segundos)
+        self.ir_para_0_0()
+        return list(self.lixeiras_lidas)
+
+    def depositar_bloco(self, cor: Cores):
+        """Leva o bloco pego até a lixeira da sua cor e volta ao mapa pela linha dessa lixeira.
+
+        Começa na encruzilhada da coluna 0 virado para a área verde, como depois de
+        `EstrategiaMapa.retornar_para_area_verde`, e segue o ciclo de
+        `EstrategiaAreaVerde.iniciar`: vai até a linha amarela, anda por ela até a
+        lixeira, deposita o bloco e volta ao mapa. Termina na coluna 0, virado para a direita.
+        A lixeira é a primeira com a `cor` entre as lidas em `analisar_lixeiras`.
+        """
+        indice_lixeira = (self.lixeiras_lidas or self.lixeiras).index(cor)
+        linha_lixeira = max(0, self.altura - 1 - indice_lixeira)
+
+        # ir_ao_amarelo
+        self.seguir_linha_ate_cor(DefinicaoCoresLinha.e_verde, velocidade=VELOCIDADE_BAIXA)
+        self.ande_ate_cor(DefinicaoCoresLinha.e_amarelo, velocidade=VELOCIDADE_MAXIMA)
+        self.alinhe_entre_linhas(velocidade=VELOCIDADE_BAIXA)
+
+        # posicionar_e_depositar_lixo: vira para o lado da lixeira e segue a linha amarela,
+        # parando em cada lixeira até chegar na certa
+        sentido = 1 if linha_lixeira <= self.pos_atual[0] else -1
+        lixeiras_no_caminho = abs(linha_lixeira - self.pos_atual[0])
+        self.ande_certa_distancia(20, velocidade=VELOCIDADE_PADRAO)
+        self.gire_graus_giroscopio(90 * sentido, velocidade=VELOCIDADE_PADRAO)
+        self.ande_certa_distancia(75, velocidade=-VELOCIDADE_PADRAO)
+        self.ande_certa_distancia(
+            75 + lixeiras_no_caminho * self.modelo_tempo.comprimento_aresta, velocidade=VELOCIDADE_MAXIMA
+        )
+        self._gastar(
+            lixeiras_no_caminho * self.modelo_tempo.pare_suave()
+            + self.modelo_tempo.ande_certa_distancia(10, VELOCIDADE_BAIXA)
+            + self.modelo_tempo.TEMPO_DEPOSITAR
+        )
+        self.blocos_depositados += 1
+        if self.cor_carregada is not None and self.lixeiras[indice_lixeira] != self.cor_carregada:
+            self.depositos_errados += 1
+        self.cor_carregada = None
+
+        # retornar_para_mapa e andar_ate_mapa
+        self.gire_graus_giroscopio(90 * sentido, velocidade=VELOCIDADE_PADRAO)
+        self.ande_ate_deixar_de_ver_cor(DefinicaoCoresLinha.e_verde, velocidade=VELOCIDADE_MAXIMA)
+        self.ande_certa_distancia(20, velocidade=VELOCIDADE_BAIXA)
+        self.encontrar_linha_preta(velocidade=VELOCIDADE_PADRAO)
+        self.seguir_ate_encruzilhada(velocidade=VELOCIDADE_BAIXA, modo=self.ModoMotor.VELOCIDADE)
@@ -0,0 +1,123 @@
+"""Geração em lote de campos espelhados para o `Simulador`.
+
+Cada campo é um registro de um array estruturado do NumPy:
+
+- `lixos`: o código `Cores` do bloco em cada aresta (`Cores.VAZIO` quando livre), na
+  ordem de `nx.grid_2d_graph(altura, largura).edges`, a mesma do grafo do `Simulador`;
+- `lixeiras`: os códigos `Cores` das lixeiras, na ordem de `Simulador.lixeiras`;
+- `altura` e `largura` da grade.
+
+Os campos seguem as regras do `Simulador`: cada bloco tem um par da mesma cor na aresta
+espelhada pelo centro e, com quantidade ímpar de blocos, a aresta central recebe o
+bloco sem par. Todos os campos são sorteados de uma vez, com operações sobre arrays.
+
+O corpus é salvo como um `.npy` e aberto com `np.load(mmap_mode='r')`, então a avaliação
+lê só os registros que usa, sem criar um `Simulador` por campo até a hora de jogar.
+"""
+
+from functools import cache
+
+import networkx as nx
+import numpy as np
+from src.definicao_cores import Cores
+
+from . import Simulador
+
+# Cores sorteadas para os blocos, na ordem de Simulador.OpçõesLixos
+CORES_BLOCOS = np.array(
+    [Cores[lixo.name].value for lixo in Simulador.OpçõesLixos if lixo != Simulador.OpçõesLixos.VAZIO],
+    dtype=np.uint8,
+)
+CORES_LIXEIRAS = CORES_BLOCOS[CORES_BLOCOS != Cores.BRANCO.value]
+
+
+def tipo_campo(altura: int, largura: int) -> np.dtype:
+    """Tipo do registro de um campo com a grade `altura` x `largura`."""
+    qtd_arestas = altura * (largura - 1) + (altura - 1) * largura
+    return np.dtype([
+        ('lixos', np.uint8, (qtd_arestas,)),
+        ('lixeiras', np.uint8, (Simulador.QTD_LIXEIRAS,)),
+        ('altura', np.uint8),
+        ('largura', np.uint8),
+    ])
+
+
+@cache
+def arestas_grade(altura: int, largura: int) -> tuple:
+    """Arestas da grade na ordem do grafo do `Simulador`."""
+    return tuple(nx.grid_2d_graph(altura, largura).edges)
+
+
+@cache
+def _pares_espelhados(altura: int, largura: int) -> tuple[np.ndarray, np.ndarray, int | None]:
+    """Índices das arestas de cada par espelhado e o índice da aresta central, se houver."""
+    arestas = arestas_grade(altura, largura)
+    indices = {aresta: indice for indice, aresta in enumerate(arestas)}
+    primeiras, espelhos = [], []
+    central = None
+    for indice, (u, v) in enumerate(arestas):
+        u_espelho = (altura - 1 - u[0], largura - 1 - u[1])
+        v_espelho = (altura - 1 - v[0], largura - 1 - v[1])
+        indice_espelho = indices[v_espelho, u_espelho]
+        if indice_espelho == indice:
+            central = indice
+        elif indice < indice_espelho:
+            primeiras.append(indice)
+            espelhos.append(indice_espelho)
+    return np.array(primeiras), np.array(espelhos), central
+
+
+def gerar_campos(
+    qtd_campos: int, qtd_blocos: int = 21, altura: int = 5, largura: int = 6, seed: int | None = None
+) -> np.ndarray:
+    """Sorteia `qtd_campos` campos espelhados e retorna o array de registros."""
+    primeiras, espelhos, central = _pares_espelhados(altura, largura)
+    if central is None and qtd_blocos % 2:
+        raise ValueError(
+            'Não é possível gerar um mapa espelhado com um número ímpar de blocos com quantidade par de arestas.'
+        )
+    qtd_pares = qtd_blocos // 2
+    if qtd_pares > len(primeiras):
+        raise ValueError(f'A grade {altura}x{largura} não tem arestas para {qtd_blocos} blocos.')
+
+    gerador = np.random.default_rng(seed)
+    campos = np.zeros(qtd_campos, dtype=tipo_campo(altura, largura))
+    campos['altura'] = altura
+    campos['largura'] = largura
+
+    lixos = np.full((qtd_campos, len(arestas_grade(altura, largura))), Cores.VAZIO.value, dtype=np.uint8)
+    linhas = np.arange(qtd_campos)[:, None]
+    if qtd_pares:
+        # Os qtd_pares menores de uma permutação aleatória dos pares, sem repetição
+        sorteio = gerador.random((qtd_campos, len(primeiras)))
+        pares = np.argpartition(sorteio, qtd_pares - 1, axis=1)[:, :qtd_pares]
+        cores = gerador.choice(CORES_BLOCOS, size=(qtd_campos, qtd_pares))
+        lixos[linhas, primeiras[pares]] = cores
+        lixos[linhas, espelhos[pares]] = cores
+    if qtd_blocos % 2:
+        lixos[:, central] = gerador.choice(CORES_BLOCOS, size=qtd_campos)
+    campos['lixos'] = lixos
+
+    ordem = np.argsort(gerador.random((qtd_campos, len(CORES_LIXEIRAS))), axis=1)
+    campos['lixeiras'] = CORES_LIXEIRAS[ordem[:, : Simulador.QTD_LIXEIRAS]]
+    return campos
+
+
+def salvar_campos(caminho: str, campos: np.ndarray):
+    np.save(caminho, campos, allow_pickle=False)
+
+
+def carregar_campos(caminho: str) -> np.ndarray:
+    """Abre o corpus mapeado em memória, sem ler os campos do disco."""
+    return np.load(caminho, mmap_mode='r', allow_pickle=False)
+
+
+def simulador_do_campo(campo: np.void, **kwargs) -> Simulador:
+    """Cria o `Simulador` com os blocos e as lixeiras de um registro do corpus."""
+    return Simulador(
+        altura=int(campo['altura']),
+        largura=int(campo['largura']),
+        lixos=campo['lixos'].tolist(),
+        lixeiras=[Cores(codigo) for codigo in campo['lixeiras'].tolist()],
+        **kwargs,
+    )
@@ -0,0 +1,155 @@
+"""Modelo do tempo físico das ações do robô, usado pelo `Simulador`.
+
+Cada método estima quantos segundos a ação correspondente do `Robo` /
+`RoboSeguidorDeLinha` leva no robô real. A estimativa soma três partes:
+
+- o movimento em si: a distância (ou o giro) é convertida em graus do motor com as
+  mesmas constantes do `Robo` (`DISTANCIA_PARA_GRAUS` e `GRAUS_PARA_GRAUS_ANGULAR_*`)
+  e dividida pela velocidade dos motores em graus por segundo;
+- as esperas fixas dos comandos da `Motores` (0,05 s em `move_motores` e 0,025 s em
+  `velocidade_motores`);
+- as esperas da garra e do `pegar_bloco`: os movimentos de servo com `tempo` e os
+  `sleep` de cada sequência.
+
+A parada com `pare_suave` ao chegar em cada encruzilhada usa `CUSTO_PARADA`.
+"""
+
+from settings import (
+    COMPRIMENTO_ARESTA,
+    CUSTO_PARADA,
+    DISTANCIA_PARA_GRAUS,
+    GRAUS_MOTOR_POR_VELOCIDADE,
+    GRAUS_PARA_GRAUS_ANGULAR_DIREITA,
+    GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA,
+    VELOCIDADE_BAIXA,
+    VELOCIDADE_BASE_SEGUIDOR,
+    VELOCIDADE_MAXIMA,
+    VELOCIDADE_PADRAO,
+)
+
+# Esperas dos comandos em libs/motores.py
+TEMPO_COMANDO_ANGULO = 0.05  # move_motores (também usado por pare)
+TEMPO_COMANDO_VELOCIDADE = 0.025  # velocidade_motores (também usado por pare_suave)
+
+# O giro com giroscópio reduz a velocidade a um terço nos últimos 30% do ângulo
+FRACAO_GIRO_LENTO = 0.3
+
+
+class ModeloTempo:
+    """Converte as ações do robô em segundos, a partir das constantes do robô real."""
+
+    # Sequências da garra: soma dos `tempo` dos servos e dos `sleep`
+    TEMPO_GARRA_PEGAR = 0.2 + 1.0  # Garra.pegar_bloco e sleep(1) antes de ler a cor
+    TEMPO_SEGUNDA_LEITURA = 1.0  # sleep(1) antes de reler uma cor que não é de lixeira
+    TEMPO_SUBIR_E_CONFERIR = 0.5  # Garra.subir e sleep(0.5) antes da segunda leitura
+    TEMPO_SOLTAR_BRANCO = 0.2 + 0.2  # Garra.abrir e Garra.subir ao devolver o bloco
+    TEMPO_DEPOSITAR = 0.2 + 0.2 + 0.5 + 0.2 + 0.5  # Garra.depositar_bloco
+
+    def __init__(
+        self,
+        *,
+        graus_motor_por_velocidade: float = GRAUS_MOTOR_POR_VELOCIDADE,
+        comprimento_aresta: float = COMPRIMENTO_ARESTA,
+        tempo_parada: float = CUSTO_PARADA,
+    ):
+        self.graus_motor_por_velocidade = graus_motor_por_velocidade
+        self.comprimento_aresta = comprimento_aresta
+        self.tempo_parada = tempo_parada
+
+    def _tempo_graus_motor(self, graus_motor: float, velocidade: float) -> float:
+        if not graus_motor:
+            return 0.0
+        # Os motores saturam em ±120 (Motores.velocidade_motores)
+        velocidade = min(abs(velocidade), 120)
+        if not velocidade:
+            return float('inf')
+        return abs(graus_motor) / (velocidade * self.graus_motor_por_velocidade)
+
+    def mover(self, distancia: float, velocidade: float) -> float:
+        """Tempo do deslocamento de `distancia` mm, sem as esperas dos comandos."""
+        return self._tempo_graus_motor(distancia * DISTANCIA_PARA_GRAUS, velocidade)
+
+    def ande_certa_distancia(self, distancia: float, velocidade: float) -> float:
+        # pare() antes e depois do deslocamento
+        return 2 * TEMPO_COMANDO_ANGULO + self.mover(distancia, velocidade)
+
+    def gire_graus(self, graus: float, velocidade: float) -> float:
+        if not graus:
+            return 0.0
+        fator = GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA if graus < 0 else GRAUS_PARA_GRAUS_ANGULAR_DIREITA
+        # move_motores para girar e pare() no fim
+        return 2 * TEMPO_COMANDO_ANGULO + self._tempo_graus_motor(graus * fator, velocidade)
+
+    def gire_graus_giroscopio(self, graus: float, velocidade: float) -> float:
+        if not graus:
+            return 0.0
+        fator = GRAUS_PARA_GRAUS_ANGULAR_ESQUERDA if graus < 0 else GRAUS_PARA_GRAUS_ANGULAR_DIREITA
+        graus_motor = graus * fator
+        return (
+            TEMPO_COMANDO_ANGULO
+            + self._tempo_graus_motor(graus_motor * (1 - FRACAO_GIRO_LENTO), velocidade)
+            + self._tempo_graus_motor(graus_motor * FRACAO_GIRO_LENTO, abs(velocidade) // 3)
+        )
+
+    def pare_suave(self) -> float:
+        return TEMPO_COMANDO_VELOCIDADE + self.tempo_parada
+
+    def seguir_ate_encruzilhada(self, distancia: float, velocidade: float) -> float:
+        """Segue a linha por `distancia` mm e para com `pare_suave` na encruzilhada."""
+        return self.mover(distancia, velocidade) + self.pare_suave()
+
+    def voltar_encruzilhada(self, distancia: float, velocidade: float) -> float:
+        """Dá ré por `distancia` mm até os sensores voltarem à encruzilhada e para."""
+        return self.mover(distancia, velocidade) + TEMPO_COMANDO_ANGULO
+
+    def ande_ate_cor(self, distancia: float, velocidade: float) -> float:
+        """Anda (ou segue a linha) por `distancia` mm até os sensores verem uma cor e para."""
+        return self.mover(distancia, velocidade) + TEMPO_COMANDO_ANGULO
+
+    def encontrar_linha_preta(self, velocidade: float) -> float:
+        """Zigue-zague de `Robo.encontrar_linha_preta`: 15° para um lado e a linha achada na volta."""
+        return self.gire_graus(15, velocidade) + self.gire_graus(-30, velocidade)
+
+    def alinhe_entre_linhas(self, velocidade: float) -> float:
+        """Ajuste de cada lado em `Robo.alinhe_entre_linhas`, estimado em 10 mm por roda."""
+        return 2 * self.mover(10, velocidade) + TEMPO_COMANDO_ANGULO
+
+    def pegar_bloco(self, afastamento: float, distancia: float, valido: bool) -> tuple[float, float]:
+        """Tempo da sequência de `RoboSeguidorDeLinha.pegar_bloco` e o afastamento final.
+
+        `afastamento` é quanto os sensores estão além da encruzilhada, em mm. Um bloco
+        `valido` é levantado e conferido; os outros (e a garra vazia) são relidos e soltos.
+        """
+        segundos = (
+            self.voltar_encruzilhada(max(afastamento, 0), VELOCIDADE_BAIXA)
+            + self.ande_certa_distancia(20, VELOCIDADE_BAIXA)
+            + self.mover(70, VELOCIDADE_BAIXA // 2)
+            + self.voltar_encruzilhada(20 + 70, VELOCIDADE_BAIXA)
+            + self.gire_graus(5, 5)
+            + self.ande_certa_distancia(distancia, VELOCIDADE_BAIXA)
+            + self.TEMPO_GARRA_PEGAR
+        )
+        if valido:
+            return segundos + self.TEMPO_SUBIR_E_CONFERIR, distancia
+
+        segundos += (
+            self.TEMPO_SEGUNDA_LEITURA
+            + self.TEMPO_SOLTAR_BRANCO
+            + self.ande_certa_distancia(10, VELOCIDADE_BAIXA)
+        )
+        return segundos, distancia - 10
+
+    def custos_planejador(self) -> dict[str, float]:
+        """Custos para o `PlanejadorDirecional` com os tempos previstos pelo modelo.
+
+        Correspondem ao que a `EstrategiaMapa` faz a cada nó: `rotacionar_para_no` gira com
+        VELOCIDADE_MAXIMA depois de um `ande_certa_distancia(0)` e `seguir_ate_encruzilhada`
+        segue a aresta em VELOCIDADE_BASE_SEGUIDOR.
+        """
+        giro = self.ande_certa_distancia(0, VELOCIDADE_PADRAO)
+        return {
+            'custo_aresta': self.mover(self.comprimento_aresta, VELOCIDADE_BASE_SEGUIDOR),
+            'custo_parada': self.pare_suave(),
+            'custo_giro_90': giro + self.gire_graus(90, VELOCIDADE_MAXIMA),
+            'custo_giro_180': giro + self.gire_graus(180, VELOCIDADE_MAXIMA),
+        }
@@ -0,0 +1,25 @@
+"""Partida completa no `Simulador`.
+
+Repete o ciclo de `EstrategiaAreaVerde.iniciar` com as ações da área verde do
+simulador: lê as lixeiras, e então a `EstrategiaMapa` coleta um bloco, o simulador o
+deposita na lixeira e a estratégia continua a partir da linha em que o robô voltou.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.estrategias.estrategia_mapa import EstrategiaMapa
+
+    from . import Simulador
+
+
+def jogar_partida(robo: Simulador, estrategia: EstrategiaMapa):
+    """Joga até não sobrar bloco com lixeira no campo ou um limite do simulador acabar a partida."""
+    estrategia.posicoes_lixeiras = robo.analisar_lixeiras()
+    while robo.blocos_restantes:
+        estrategia.pos_anterior, estrategia.pos_atual = robo.pos_anterior, robo.pos_atual
+        cor, _ = estrategia.iniciar()
+        robo.depositar_bloco(cor)
+        estrategia.posicoes_lixeiras_depositadas[cor] += 1
@@ -0,0 +1,60 @@
+"""Ruído e falhas dos sensores do `Simulador`.
+
+Sem ruído (o padrão) o simulador lê as distâncias exatas de 200, 500 e 1000 mm e a cor
+certa de cada bloco e lixeira. O `ModeloRuido` estraga essas leituras como acontece
+no robô:
+
+- distância dos VL53: com probabilidade `falha_distancia` a leitura falha e volta
+  VALOR_FALHA_VL53, o valor fora de alcance do sensor; com probabilidade `falso_perto`
+  um reflexo dá uma leitura perto (entre DISTANCIA_FALSO_PERTO mm) mesmo sem bloco; nas
+  outras, a distância ganha um ruído gaussiano de `desvio_distancia` mm;
+- cor do bloco na garra e das lixeiras: com probabilidade `erro_cor` a cor lida é
+  outra, sorteada entre as que o sensor poderia ter visto.
+
+O ruído tem o seu próprio gerador, separado do `random` que sorteia o campo, então a
+mesma seed do simulador gera o mesmo campo com e sem ruído.
+"""
+
+import random
+from typing import Sequence
+
+from src.definicao_cores import Cores
+
+VALOR_FALHA_VL53 = 8190
+DISTANCIA_FALSO_PERTO = (60, 250)
+
+
+class ModeloRuido:
+    """Sorteia as leituras com ruído dos sensores a partir das leituras exatas do simulador."""
+
+    def __init__(
+        self,
+        *,
+        desvio_distancia: float = 0.0,
+        falha_distancia: float = 0.0,
+        falso_perto: float = 0.0,
+        erro_cor: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.desvio_distancia = desvio_distancia
+        self.falha_distancia = falha_distancia
+        self.falso_perto = falso_perto
+        self.erro_cor = erro_cor
+        self._aleatorio = random.Random(seed)
+
+    def distancia(self, valor: int) -> int:
+        """Leitura de um VL53 que deveria medir `valor` mm."""
+        sorteio = self._aleatorio.random()
+        if sorteio < self.falha_distancia:
+            return VALOR_FALHA_VL53
+        if sorteio < self.falha_distancia + self.falso_perto:
+            return self._aleatorio.randint(*DISTANCIA_FALSO_PERTO)
+        if self.desvio_distancia:
+            return max(0, round(self._aleatorio.gauss(valor, self.desvio_distancia)))
+        return valor
+
+    def cor(self, cor: Cores, opcoes: Sequence[Cores]) -> Cores:
+        """Cor lida de um objeto da `cor`, trocada por outra das `opcoes` quando o sensor erra."""
+        if self._aleatorio.random() >= self.erro_cor:
+            return cor
+        return self._aleatorio.choice([opcao for opcao in opcoes if opcao != cor])
@@ -0,0 +1,31 @@
+"""Emuladores do firmware das placas seriais do robô em pseudo-terminais.
+
+Cada emulador abre um pseudo-terminal e responde no protocolo da placa (`placas.py`),
+com latência, jitter e perda de bytes configuráveis (`base.py`). Os drivers de `libs`
+abrem o `caminho` do emulador no lugar da porta da placa, então a vazão, a frequência
+dos laços e o tratamento de falhas dos drivers de verdade podem ser medidos em
+qualquer Linux, sem o brick:
+
+    with EmuladorGiroscopio(latencia=0.002) as emulador:
+        giroscopio = Giroscopio(emulador.caminho)
+"""
+
+from .base import EmuladorSerial
+from .placas import (
+    EmuladorCorReflexao,
+    EmuladorGiroscopio,
+    EmuladorModo,
+    EmuladorMotores,
+    EmuladorMuxTCS34725,
+    EmuladorMuxVl53l0x,
+)
+
+__all__ = [
+    'EmuladorCorReflexao',
+    'EmuladorGiroscopio',
+    'EmuladorModo',
+    'EmuladorMotores',
+    'EmuladorMuxTCS34725',
+    'EmuladorMuxVl53l0x',
+    'EmuladorSerial',
+]
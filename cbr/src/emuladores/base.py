@@ -0,0 +1,145 @@
+"""Base dos emuladores das placas seriais sobre um pseudo-terminal.
+
+O `EmuladorSerial` abre um par de pseudo-terminais: o driver abre o lado escravo pelo
+`caminho`, como abriria a porta da placa, e o emulador atende no lado mestre numa
+thread. Cada requisição completa recebe a resposta do protocolo da placa depois da
+`latencia` (mais ou menos um sorteio uniforme de até `jitter` segundos), e cada byte da
+resposta se perde com probabilidade `perda`. As respostas atrasadas ficam numa fila e
+saem na ordem das requisições, sem impedir o emulador de receber as seguintes. Os
+parâmetros podem mudar com o emulador rodando, e os contadores (`requisicoes`,
+`respostas`, `bytes_perdidos`) medem o que o driver de fato trocou com a placa.
+"""
+
+import os
+import random
+import select
+import threading
+import time
+import tty
+from abc import ABC, abstractmethod
+from collections import deque
+
+
+class EmuladorSerial(ABC):
+    """Placa serial de requisição e resposta emulada num pseudo-terminal."""
+
+    # Intervalo máximo entre verificações de parada da thread
+    INTERVALO_ESPERA = 0.05
+
+    def __init__(
+        self, latencia: float = 0.0, jitter: float = 0.0, perda: float = 0.0, seed: int | None = None
+    ):
+        self.latencia = latencia
+        self.jitter = jitter
+        self.perda = perda
+        self._aleatorio = random.Random(seed)
+
+        self.requisicoes = 0
+        self.respostas = 0
+        self.bytes_perdidos = 0
+
+        self._mestre, self._escravo = os.openpty()
+        # Sem eco nem tradução de fim de linha: os bytes passam como numa serial
+        tty.setraw(self._escravo)
+        self.caminho = os.ttyname(self._escravo)
+        self._buffer = bytearray()
+        # (instante de envio, bytes) das respostas ainda não enviadas
+        self._fila = deque()
+        self._ativo = False
+        self._thread = None
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, *_):
+        self.parar()
+
+    def iniciar(self):
+        """Começa a atender as requisições numa thread."""
+        if not self._ativo:
+            self._ativo = True
+            self._thread = threading.Thread(target=self._atender, daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        """Para a thread e fecha o pseudo-terminal."""
+        self._ativo = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for descritor in (self._mestre, self._escravo):
+            os.close(descritor)
+
+    def zerar_contadores(self):
+        self.requisicoes = self.respostas = self.bytes_perdidos = 0
+
+    # ================================================================
+    # Protocolo, definido por cada placa
+    # ================================================================
+
+    @abstractmethod
+    def tamanho_requisicao(self, primeiro_byte: int) -> int | None:
+        """Tamanho da requisição que começa com `primeiro_byte`, ou None se o byte não começa uma."""
+
+    @abstractmethod
+    def responder(self, requisicao: bytes) -> bytes:
+        """Resposta da placa para uma requisição completa; vazia se a placa não responde."""
+
+    # ================================================================
+    # Atendimento
+    # ================================================================
+
+    def _atender(self):
+        while self._ativo:
+            espera = self.INTERVALO_ESPERA
+            if self._fila:
+                espera = min(espera, max(self._fila[0][0] - time.monotonic(), 0))
+            prontos, _, _ = select.select([self._mestre], [], [], espera)
+            self._enviar_vencidas()
+            if not prontos:
+                continue
+            try:
+                self._buffer += os.read(self._mestre, 1024)
+            except OSError:
+                # O driver fechou a porta; o emulador continua esperando outro
+                time.sleep(self.INTERVALO_ESPERA)
+                continue
+            for requisicao in self._requisicoes_completas():
+                self.requisicoes += 1
+                resposta = self.responder(requisicao)
+                if resposta:
+                    self._agendar(resposta)
+                    self._enviar_vencidas()
+
+    def _requisicoes_completas(self):
+        """Retira do buffer as requisições completas, descartando bytes que não começam uma."""
+        while self._buffer:
+            tamanho = self.tamanho_requisicao(self._buffer[0])
+            if tamanho is None:
+                del self._buffer[0]
+                continue
+            if len(self._buffer) < tamanho:
+                return
+            requisicao = bytes(self._buffer[:tamanho])
+            del self._buffer[:tamanho]
+            yield requisicao
+
+    def _agendar(self, resposta: bytes):
+        atraso = max(self.latencia + self._aleatorio.uniform(-self.jitter, self.jitter), 0)
+        instante = time.monotonic() + atraso
+        # Com jitter, uma resposta não passa na frente da anterior
+        if self._fila:
+            instante = max(instante, self._fila[-1][0])
+        self._fila.append((instante, resposta))
+
+    def _enviar_vencidas(self):
+        agora = time.monotonic()
+        while self._fila and self._fila[0][0] <= agora:
+            _, resposta = self._fila.popleft()
+            if self.perda > 0:
+                mantidos = bytes(byte for byte in resposta if self._aleatorio.random() >= self.perda)
+                self.bytes_perdidos += len(resposta) - len(mantidos)
+                resposta = mantidos
+            os.write(self._mestre, resposta)
+            self.respostas += 1
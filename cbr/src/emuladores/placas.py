@@ -0,0 +1,193 @@
+"""Protocolos das placas seriais do robô, para os emuladores de pseudo-terminal.
+
+- `EmuladorMotores` (`libs.motores.Motores`): quadros de 10 bytes 0xFC (velocidade),
+  0xFA (potência) e 0xFB (estado), respondidos com 0xFC (ou 0xFB, ao estado), os ângulos
+  absolutos dos motores 1 e 2 (int32 big-endian) e o byte de estado; 0xFD (servos),
+  respondido com 0xFD; e 0xFE (PID), sem resposta. Os encoders andam com o tempo real, a
+  GRAUS_MOTOR_POR_VELOCIDADE graus/s por unidade, e param ao completar um movimento
+  por ângulo;
+- as placas de modo, em que cada requisição é o byte do modo:
+  `EmuladorGiroscopio` (`Giroscopio`, 8 bytes com os ângulos x, y e z em int16),
+  `EmuladorCorReflexao` (`CorReflexao`, os 32 bytes da `lista`),
+  `EmuladorMuxVl53l0x` (`PlacaMuxVl53l0x`, 4 distâncias e 4 botões em int16) e
+  `EmuladorMuxTCS34725` (`PlacaMuxTCS34725`, RGBC de 4 sensores em int16).
+  Os modos de calibração respondem depois de `tempo_calibracao` segundos.
+
+Os valores lidos pelas placas de modo são atributos do emulador, que o teste ou o
+benchmark muda à vontade.
+"""
+
+import struct
+import time
+from abc import abstractmethod
+
+from settings import GRAUS_MOTOR_POR_VELOCIDADE
+
+from .base import EmuladorSerial
+
+ESTADO_MOTORES = struct.Struct('>BiiB')
+VELOCIDADE_MOTOR = struct.Struct('b')
+ANGULO_MOVIMENTO = struct.Struct('>H')
+ANGULOS_GIROSCOPIO = struct.Struct('>hhhxx')
+LEITURAS_VL53 = struct.Struct('>4h4h')
+LEITURAS_TCS = struct.Struct('>16h')
+
+
+class EmuladorMotores(EmuladorSerial):
+    VELOCIDADE = 0xFC
+    ESTADO = 0xFB
+    POTENCIA = 0xFA
+    SERVOS = 0xFD
+    PID = 0xFE
+    TAMANHOS = {VELOCIDADE: 10, ESTADO: 10, POTENCIA: 10, SERVOS: 10, PID: 7}
+
+    PARADO = 0
+    GIRANDO_NORMAL = 1
+    GIRANDO_INVERTIDO = 2
+
+    def __init__(self, graus_por_velocidade: float = GRAUS_MOTOR_POR_VELOCIDADE, **kwargs):
+        super().__init__(**kwargs)
+        self.graus_por_velocidade = graus_por_velocidade
+        # Motores 1 e 2, os que têm encoder
+        self.velocidades = [0, 0]
+        self.angulos = [0.0, 0.0]
+        # Graus que faltam num movimento por ângulo, ou None girando sem limite
+        self.restantes = [None, None]
+        self.servos = [200] * 6
+        self.modo_freio = 0
+        self.pid = (0, 0, 0)
+        self._ultima_atualizacao = time.monotonic()
+
+    def tamanho_requisicao(self, primeiro_byte: int) -> int | None:
+        return self.TAMANHOS.get(primeiro_byte)
+
+    def responder(self, requisicao: bytes) -> bytes:
+        self._mover_encoders()
+        comando = requisicao[0]
+        if comando in {self.VELOCIDADE, self.POTENCIA}:
+            for indice in range(2):
+                self.velocidades[indice] = VELOCIDADE_MOTOR.unpack_from(requisicao, 1 + indice)[0]
+                angulo = ANGULO_MOVIMENTO.unpack_from(requisicao, 5 + 2 * indice)[0]
+                self.restantes[indice] = angulo if angulo and self.velocidades[indice] else None
+            self.modo_freio = requisicao[9]
+        elif comando == self.SERVOS:
+            self.servos = list(requisicao[1:7])
+            return bytes([self.SERVOS])
+        elif comando == self.PID:
+            self.pid = struct.unpack('>HHH', requisicao[1:7])
+            return b''
+        resposta = self.ESTADO if comando == self.ESTADO else self.VELOCIDADE
+        return ESTADO_MOTORES.pack(resposta, round(self.angulos[0]), round(self.angulos[1]), self.estado())
+
+    def estado(self) -> int:
+        estado = 0
+        for indice, velocidade in enumerate(self.velocidades):
+            if velocidade:
+                estado |= (self.GIRANDO_NORMAL if velocidade > 0 else self.GIRANDO_INVERTIDO) << (2 * indice)
+        return estado
+
+    def _mover_encoders(self):
+        agora = time.monotonic()
+        intervalo = agora - self._ultima_atualizacao
+        self._ultima_atualizacao = agora
+        for indice, velocidade in enumerate(self.velocidades):
+            graus = velocidade * self.graus_por_velocidade * intervalo
+            restante = self.restantes[indice]
+            if restante is not None and abs(graus) >= restante:
+                graus = restante if graus > 0 else -restante
+                self.velocidades[indice] = 0
+                self.restantes[indice] = None
+            elif restante is not None:
+                self.restantes[indice] = restante - abs(graus)
+            self.angulos[indice] += graus
+
+
+class EmuladorModo(EmuladorSerial):
+    """Placa em que cada requisição é um byte com o modo de leitura."""
+
+    def __init__(self, tempo_calibracao: float = 0.1, **kwargs):
+        super().__init__(**kwargs)
+        self.tempo_calibracao = tempo_calibracao
+
+    def tamanho_requisicao(self, primeiro_byte: int) -> int | None:
+        return 1
+
+    def responder(self, requisicao: bytes) -> bytes:
+        return self.resposta(requisicao[0])
+
+    @abstractmethod
+    def resposta(self, modo: int) -> bytes:
+        """Resposta da placa à requisição do `modo`."""
+
+
+class EmuladorGiroscopio(EmuladorModo):
+    GYRO = 0
+    GYRO2 = 1
+    GYRO_CAL = 2
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Ângulos em graus, com o sinal da placa: o driver inverte o z
+        self.angulo_x = 0
+        self.angulo_y = 0
+        self.angulo_z = 0
+        self._zero_z = 0
+        self._modo = self.GYRO
+
+    def resposta(self, modo: int) -> bytes:
+        if modo == self.GYRO_CAL:
+            time.sleep(self.tempo_calibracao)
+            return b'\x01'
+        if modo not in {self.GYRO, self.GYRO2}:
+            return b''
+        # A troca entre GYRO e GYRO2 zera o z; é assim que o driver faz o reseta_z
+        if modo != self._modo:
+            self._modo = modo
+            self._zero_z = self.angulo_z
+        return ANGULOS_GIROSCOPIO.pack(self.angulo_x, self.angulo_y, self.angulo_z - self._zero_z)
+
+
+class EmuladorCorReflexao(EmuladorModo):
+    MODO_CALIBRA_BRANCO = 3
+    MODO_CALIBRA_PRETO = 4
+    MODOS_LEITURA = range(6)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Reflexão, RGBC, HSV e posição, como a lista do driver
+        self.lista = [100, 100, 100, 100] + [0] * 28
+
+    def resposta(self, modo: int) -> bytes:
+        if modo in {self.MODO_CALIBRA_BRANCO, self.MODO_CALIBRA_PRETO}:
+            time.sleep(self.tempo_calibracao)
+        if modo in self.MODOS_LEITURA:
+            return bytes(self.lista)
+        return bytes([modo])
+
+
+class EmuladorMuxVl53l0x(EmuladorModo):
+    DISTANCIA_4_PORTAS = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.distancias = [8190] * 4
+        self.botoes = [0] * 4
+
+    def resposta(self, modo: int) -> bytes:
+        if modo != self.DISTANCIA_4_PORTAS:
+            return b''
+        return LEITURAS_VL53.pack(*self.distancias, *self.botoes)
+
+
+class EmuladorMuxTCS34725(EmuladorModo):
+    MODOS_LEITURA = range(4)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # (r, g, b, c) de cada um dos 4 sensores
+        self.leituras = [(0, 0, 0, 0)] * 4
+
+    def resposta(self, modo: int) -> bytes:
+        if modo not in self.MODOS_LEITURA:
+            return b''
+        return LEITURAS_TCS.pack(*(valor for leitura in self.leituras for valor in leitura))
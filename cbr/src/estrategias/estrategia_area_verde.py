@@ -9,8 +9,6 @@ A estratégia coordena o comportamento do robô para cumprir a tarefa de coleta
 e descarte seletivo de blocos nas lixeiras correspondentes.
 """
 
-from time import sleep, time
-
 from libs.vl53 import VL53L0X
 from settings import DEPOSITAR_DE_FRENTE, VELOCIDADE_BAIXA, VELOCIDADE_MAXIMA, VELOCIDADE_PADRAO
 from src.atuadores.robo.seguidor_linha import DirecaoSeguirLinhaSimples, RoboSeguidorDeLinha
@@ -29,8 +27,8 @@ class EstrategiaAreaVerde(EstrategiaMapa):
     mantendo controle sobre os blocos coletados e as posições das lixeiras.
     """
 
-    def __init__(self, robo, mapa):
-        super().__init__(robo, mapa)
+    def __init__(self, robo, mapa, planejador=None):
+        super().__init__(robo, mapa, planejador)
 
     def iniciar(self):
         """Inicia a execução da estratégia para a área verde.
@@ -233,7 +231,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
                 return False, False
 
             if compara(sensor_distancia.valor_distancia_thread, DISTANCIA_MAXIMA_LIXEIRA):
-                tempo_desde_ultimo_cubo_lido = time() - tempo_ultima_lixeira_lido
+                tempo_desde_ultimo_cubo_lido = self.relogio.agora() - tempo_ultima_lixeira_lido
                 if (
                     not lixeira_detectada and tempo_desde_ultimo_cubo_lido > TEMPO_MIN_ENTRE_LIXEIRAS
                 ) or not entrou:
@@ -264,7 +262,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
 
                     sensor_distancia.iniciar_thread()
 
-                tempo_ultima_lixeira_lido = time()
+                tempo_ultima_lixeira_lido = self.relogio.agora()
             else:
                 lixeira_detectada = False
 
@@ -402,7 +400,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
             self.posicoes_lixeiras.append(cor)
             self.robo.tela_teclado.escreve_cor(cor)
 
-            tempo_ultimo_cubo_lido = time()
+            tempo_ultimo_cubo_lido = self.relogio.agora()
 
         print('Posição Lixeiras final:', self.posicoes_lixeiras)
 
@@ -493,7 +491,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
             distancia=300,
         )
         if not encontrou_vermelho:
-            sleep(0.1)
+            self.relogio.dormir(0.1)
             self.robo.seguir_linha_simples_distancia(
                 90,
                 velocidade=VELOCIDADE_PADRAO,
@@ -502,7 +500,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
                 modo=self.robo.ModoMotor.VELOCIDADE,  # aaa
             )
 
-        sleep(0.1)
+        self.relogio.dormir(0.1)
 
         self.robo.gire_graus_giroscopio(180, velocidade=VELOCIDADE_MAXIMA)
 
@@ -635,7 +633,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
             graus = 107
         else:
             self.robo.ande_certa_distancia(105, velocidade=-velocidade)
-        sleep(0.2)
+        self.relogio.dormir(0.2)
         self.robo.gire_graus_giroscopio(graus * direcao, velocidade=velocidade)
 
         # AS VEZES NAO ACHAVA O AZUL, ENTAO TIREI ESSA PARTE
@@ -644,7 +642,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
         self.robo.ande_certa_distancia(30, velocidade=velocidade)
         self.robo.encontrar_linha_preta(velocidade=velocidade)
         self.robo.pare()
-        sleep(0.1)
+        self.relogio.dormir(0.1)
 
         self.robo.seguir_ate_encruzilhada(velocidade=velocidade, modo=self.robo.ModoMotor.VELOCIDADE)
 
@@ -675,7 +673,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
         dados = mapa_posicoes.get(posicao_atual, {'anterior': (0, -1), 'atual': (0, 0)})
 
         self.robo.ande_ate_deixar_de_ver_cor(DefinicaoCoresLinha.e_verde, velocidade=VELOCIDADE_MAXIMA)
-        sleep(0.1)
+        self.relogio.dormir(0.1)
         self.robo.ande_certa_distancia(20, velocidade=VELOCIDADE_BAIXA)
         self.robo.encontrar_linha_preta(velocidade=VELOCIDADE_PADRAO)
 
@@ -720,7 +718,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
             parar_suave=False,
         )
 
-        sleep(0.1)
+        self.relogio.dormir(0.1)
 
         if not fim_lixeira:
             if not viu_vermelho:
@@ -735,7 +733,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
             return
 
         self.robo.ande_certa_distancia(distancia_adicional, velocidade=-velocidade)
-        sleep(0.1)
+        self.relogio.dormir(0.1)
         self.robo.gire_graus_giroscopio(90, velocidade=VELOCIDADE_PADRAO)
 
         self.andar_ate_mapa(cor_bloco_pego=cor_bloco_pego, velocidade=VELOCIDADE_MAXIMA)
@@ -757,7 +755,7 @@ class EstrategiaAreaVerde(EstrategiaMapa):
                 self.robo.pare()
                 confirmado = True
                 for i in range(QUANTIDADE_CONFIRMACOES):
-                    sleep(0.05)
+                    self.relogio.dormir(0.05)
                     distancia_conf = sensor.read_range_single_millimeters()
                     print(f'[recuar_ate_fim_lixeira] Confirmação {i + 1}: {distancia_conf} mm')
                     if distancia_conf < DISTANCIA_SEM_LIXEIRA:
@@ -768,6 +766,6 @@ class EstrategiaAreaVerde(EstrategiaMapa):
                     print('[recuar_ate_fim_lixeira] Fim da lixeira confirmado.')
                     break
             # Pequeno delay para evitar leituras muito rápidas
-            sleep(0.02)
+            self.relogio.dormir(0.02)
         self.robo.pare()
         print('[recuar_ate_fim_lixeira] Recuo finalizado.')
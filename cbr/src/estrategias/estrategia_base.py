@@ -13,11 +13,22 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from typing import TYPE_CHECKING
 
 import settings
-from src.atuadores.robo.seguidor_linha import RoboSeguidorDeLinha
 from src.mapa import Mapa, OpçõesConhecimentoAresta
-from src.servico_web import ServicoWeb
+from src.planejadores import (
+    CacheLRU,
+    InterfacePlanejador,
+    PlanejadorColeta,
+    PlanejadorGanhoInformacao,
+    PlanejadorIncremental,
+    PlanejadorMemorizado,
+)
+
+if TYPE_CHECKING:
+    # Só para as anotações: assim as estratégias também rodam com o Simulador, sem o hardware
+    from src.atuadores.robo.seguidor_linha import RoboSeguidorDeLinha
 
 
 class EstrategiaBase(ABC):
@@ -37,6 +48,23 @@ class EstrategiaBase(ABC):
         PERTO = 1
         MEDIO = 2
 
+    class ModeloSensor:
+        """Probabilidade de bloco em cada aresta observada, por classificação da leitura.
+
+        Cada valor é (aresta até o vizinho, aresta do vizinho ao vizinho do vizinho).
+        A leitura distante é menos confiável que a próxima, por isso fica mais perto de 0.5.
+        """
+
+        PERTO = (0.85, None)
+        MEDIO = (0.2, 0.8)
+        NAO_ENCONTRADO = (0.15, 0.2)
+
+    class PoliticaExploracao:
+        """Constantes para a escolha do próximo nó desconhecido a explorar."""
+
+        MAIS_PROXIMO = 'mais_proximo'  # Nó com arestas desconhecidas mais próximo
+        GANHO_INFORMACAO = 'ganho_informacao'  # Mais arestas reveladas por segundo de trajeto
+
     class Direcoes:
         """Constantes para as possíveis direções do robô no mapa."""
 
@@ -46,10 +74,34 @@ class EstrategiaBase(ABC):
         ESQUERDA = 3
         DESCONHECIDA = 4
 
-    def __init__(self, robo: RoboSeguidorDeLinha, mapa: Mapa):
+    # Leituras dos sensores laterais em cada encruzilhada; vale a maior, que descarta os falsos perto
+    QTD_LEITURAS_SENSORES = 3
+
+    def __init__(
+        self,
+        robo: RoboSeguidorDeLinha,
+        mapa: Mapa,
+        planejador: InterfacePlanejador | None = None,
+        politica_exploracao: str = settings.POLITICA_EXPLORACAO,
+    ):
         self.robo = robo
+        # Esperas e medições de tempo usam o relógio do robô: o real no robô e o virtual no simulador
+        self.relogio = robo.relogio
         self.mapa = mapa
+        self.planejador = planejador or PlanejadorMemorizado(PlanejadorIncremental(mapa))
+        # A ordem de coleta usa os custos do mesmo planejador que traça os caminhos até os blocos
+        self.planejador_coleta = PlanejadorColeta(self.planejador, cache=CacheLRU())
+
+        match politica_exploracao:
+            case self.PoliticaExploracao.MAIS_PROXIMO:
+                self.planejador_exploracao = self.planejador
+            case self.PoliticaExploracao.GANHO_INFORMACAO:
+                # Sem memorização: o ganho depende da evidência das arestas, que não entra no estado do mapa
+                self.planejador_exploracao = PlanejadorGanhoInformacao(mapa)
+            case _:
+                raise ValueError(f'Política de exploração desconhecida: {politica_exploracao}')
 
+        self.posicoes_lixeiras = []
         self.posicoes_lixeiras_depositadas = defaultdict(int)
 
         print(f'Posições lixeira: {self.posicoes_lixeiras}')
@@ -60,6 +112,8 @@ class EstrategiaBase(ABC):
 
         # Inicia o serviço web para visualização em modo debug
         if settings.DEBUG:
+            from src.servico_web import ServicoWeb  # noqa: PLC0415
+
             ServicoWeb.estrategia = self
             ServicoWeb.iniciar()
 
@@ -95,9 +149,9 @@ class EstrategiaBase(ABC):
 
     def atualizacao_dinamica_mapa(self):
         """Atualiza o mapa com as distâncias medidas pelos sensores laterais do robô."""
-        QTD_LEITURAS = 3
-
-        distancias = zip(*[self.robo.sensores_laterais for _ in range(QTD_LEITURAS)], strict=False)
+        distancias = zip(
+            *[self.robo.sensores_laterais for _ in range(self.QTD_LEITURAS_SENSORES)], strict=False
+        )
         distancia_max_esquerda, distancia_max_frontal, distancia_max_direita = map(max, distancias)
         print(
             f'Distâncias medidas - Esquerda: {distancia_max_esquerda} mm, Frontal: {distancia_max_frontal} mm, Direita: {distancia_max_direita} mm'
@@ -119,15 +173,16 @@ class EstrategiaBase(ABC):
     ):
         """Atualiza o conhecimento do mapa com base na classificação da distância para o nó vizinho."""
 
-        def atualizar_conhecimento(no1, no2, novo_valor):
-            """Tenta atualizar o conhecimento da aresta, respeitando a regra do BLOCO_BRANCO."""
+        def observar(no1, no2, probabilidade_bloco):
+            """Funde a leitura no modelo de ocupação da aresta, respeitando a regra do BLOCO_BRANCO."""
+            if probabilidade_bloco is None:
+                return
             try:
-                if (
-                    not zerar_branco
-                    and self.mapa.grafo[no1][no2]['conhecimento'] == OpçõesConhecimentoAresta.BLOCO_BRANCO
-                ):
-                    return
-                self.mapa.grafo[no1][no2]['conhecimento'] = novo_valor
+                if self.mapa.conhecimento_aresta(no1, no2) == OpçõesConhecimentoAresta.BLOCO_BRANCO:
+                    if not zerar_branco:
+                        return
+                    self.mapa.definir_conhecimento_aresta(no1, no2, OpçõesConhecimentoAresta.DESCONHECIDA)
+                self.mapa.observar_aresta(no1, no2, probabilidade_bloco)
             except KeyError:
                 pass  # Nó ou aresta inexistente
 
@@ -137,18 +192,19 @@ class EstrategiaBase(ABC):
             no_vizinho[1] + (no_vizinho[1] - self.pos_atual[1]),
         )
 
-        # Regras de atualização por classificação
+        # Probabilidades de bloco por classificação
         match classificacao:
             case self.Distancia.PERTO:
-                atualizar_conhecimento(self.pos_atual, no_vizinho, OpçõesConhecimentoAresta.BLOCO)
-
+                perto, longe = self.ModeloSensor.PERTO
             case self.Distancia.MEDIO:
-                atualizar_conhecimento(self.pos_atual, no_vizinho, OpçõesConhecimentoAresta.VAZIO)
-                atualizar_conhecimento(no_vizinho, no_vizinho_vizinho, OpçõesConhecimentoAresta.BLOCO)
-
+                perto, longe = self.ModeloSensor.MEDIO
             case self.Distancia.NAO_ENCONTRADO:
-                atualizar_conhecimento(self.pos_atual, no_vizinho, OpçõesConhecimentoAresta.VAZIO)
-                atualizar_conhecimento(no_vizinho, no_vizinho_vizinho, OpçõesConhecimentoAresta.VAZIO)
+                perto, longe = self.ModeloSensor.NAO_ENCONTRADO
+            case _:
+                return
+
+        observar(self.pos_atual, no_vizinho, perto)
+        observar(no_vizinho, no_vizinho_vizinho, longe)
 
     # ==========================================================================
     # MÉTODOS DE NAVEGAÇÃO E PLANEJAMENTO DE CAMINHOS
@@ -159,23 +215,24 @@ class EstrategiaBase(ABC):
         return self.no_para_bloco_mais_proximo() or self.no_para_no_desconhecido_mais_proximo()
 
     def no_para_bloco_mais_proximo(self) -> tuple[int, int] | None:
-        """Encontra o próximo nó que leva ao bloco mais próximo."""
-        nos_com_bloco = self.mapa.nos_com_bloco()
-        if not nos_com_bloco:
+        """Encontra o próximo nó que leva ao bloco escolhido pelo planejador de coleta.
+
+        Com um único bloco conhecido a escolha é o bloco mais próximo. Com vários, o
+        planejador de coleta considera também as viagens seguintes até a área verde.
+        """
+        coleta = self.planejador_coleta.proxima_coleta(self.pos_atual, self.posicoes_lixeiras, self.direcao)
+        if coleta is None:
             return None
 
-        caminho = self.mapa.dijkstra_multiplos_destinos(self.pos_atual, nos_com_bloco)
+        bloco, _ = coleta
+        caminho = self.planejador.caminho_ate(self.pos_atual, bloco, self.direcao)
         print('caminho proximo_no_para_bloco_mais_proximo: ', caminho)
 
         return None if caminho is None else caminho[1]
 
     def no_para_no_desconhecido_mais_proximo(self) -> tuple[int, int] | None:
-        """Encontra o próximo nó que leva ao nó desconhecido mais próximo."""
-        nos_com_arestas_desconhecidas = self.mapa.nos_com_arestas_desconhecidas()
-        if not nos_com_arestas_desconhecidas:
-            return None
-
-        caminho = self.mapa.dijkstra_multiplos_destinos(self.pos_atual, nos_com_arestas_desconhecidas)
+        """Encontra o próximo nó que leva ao nó desconhecido escolhido pela política de exploração."""
+        caminho = self.planejador_exploracao.caminho_desconhecido_mais_proximo(self.pos_atual, self.direcao)
         print('caminho proximo_no_para_no_desconhecido_mais_proximo: ', caminho)
         return None if caminho is None else caminho[1]
 
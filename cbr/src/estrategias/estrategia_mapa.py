@@ -10,15 +10,21 @@ A estratégia coordena o comportamento do robô para mapear eficientemente o amb
 e coletar blocos para serem depositados na área verde.
 """
 
-from time import sleep
+from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import settings
 from settings import VELOCIDADE_BAIXA, VELOCIDADE_MAXIMA, VELOCIDADE_PADRAO
-from src.atuadores.robo.seguidor_linha import RoboSeguidorDeLinha
 from src.definicao_cores import Cores, DefinicaoCoresLinha
 from src.mapa import Mapa, OpçõesConhecimentoAresta
+from src.planejadores import InterfacePlanejador
 
 from .estrategia_base import EstrategiaBase
 
+if TYPE_CHECKING:
+    from src.atuadores.robo.seguidor_linha import RoboSeguidorDeLinha
+
 
 class EstrategiaMapa(EstrategiaBase):
     """Implementa a estratégia de navegação e exploração do mapa principal.
@@ -27,8 +33,17 @@ class EstrategiaMapa(EstrategiaBase):
     atualização do mapa baseada em sensores, e retorno à área verde.
     """
 
-    def __init__(self, robo: RoboSeguidorDeLinha, mapa: Mapa):
-        super().__init__(robo, mapa)
+    # Tentativas de pegar um bloco que os sensores continuam vendo à frente; None tenta até ele sumir
+    MAX_TENTATIVAS_PEGAR_BLOCO = None
+
+    def __init__(
+        self,
+        robo: RoboSeguidorDeLinha,
+        mapa: Mapa,
+        planejador: InterfacePlanejador | None = None,
+        politica_exploracao: str = settings.POLITICA_EXPLORACAO,
+    ):
+        super().__init__(robo, mapa, planejador, politica_exploracao)
 
     def iniciar(self) -> tuple[Cores, int]:
         """Inicia a execução da estratégia para o mapa principal.
@@ -65,9 +80,9 @@ class EstrategiaMapa(EstrategiaBase):
 
                 # Usado para não bugar a função para o próximo nó
                 # Ele tenta ir para o nó em que ele já está
-                if self.mapa.grafo.has_edge(self.pos_atual, self.nos_vizinhos[2]):
-                    self.mapa.grafo[self.pos_atual][self.nos_vizinhos[2]]['conhecimento'] = (
-                        OpçõesConhecimentoAresta.VAZIO
+                if self.mapa.possui_aresta(self.pos_atual, self.nos_vizinhos[2]):
+                    self.mapa.definir_conhecimento_aresta(
+                        self.pos_atual, self.nos_vizinhos[2], OpçõesConhecimentoAresta.VAZIO
                     )
                 continue
 
@@ -87,15 +102,15 @@ class EstrategiaMapa(EstrategiaBase):
             modo=self.robo.ModoMotor.VELOCIDADE,
         )
         self.robo.ande_certa_distancia(90, velocidade=VELOCIDADE_PADRAO)
-        sleep(0.1)
+        self.relogio.dormir(0.1)
         self.robo.gire_graus_giroscopio(-90, velocidade=VELOCIDADE_PADRAO)
-        sleep(0.1)
+        self.relogio.dormir(0.1)
         self.robo.ande_certa_distancia(280, velocidade=VELOCIDADE_PADRAO)
-        sleep(0.1)
+        self.relogio.dormir(0.1)
         self.robo.gire_graus_giroscopio(-90, velocidade=VELOCIDADE_PADRAO)
 
         self.robo.ande_ate_deixar_de_ver_cor(DefinicaoCoresLinha.e_verde, velocidade=VELOCIDADE_PADRAO)
-        sleep(0.1)
+        self.relogio.dormir(0.1)
         self.robo.ande_certa_distancia(20, velocidade=VELOCIDADE_BAIXA)
         self.robo.encontrar_linha_preta(velocidade=VELOCIDADE_PADRAO)
 
@@ -113,8 +128,10 @@ class EstrategiaMapa(EstrategiaBase):
         """
         cor_pega = False
         distancia = 45  # Distância inicial para tentar pegar o bloco
+        tentativas = 0
 
         while not cor_pega:
+            tentativas += 1
             cor_pega = self.robo.pegar_bloco(distancia=distancia, posicoes_lixeiras=self.posicoes_lixeiras)
             print(f'Cor pega: {cor_pega}')
 
@@ -122,17 +139,31 @@ class EstrategiaMapa(EstrategiaBase):
 
             if (cor_pega == Cores.BRANCO or cor_pega not in self.posicoes_lixeiras) and cor_pega is not None:
                 no_frente, _, _, _ = self.nos_vizinhos
-                self.mapa.grafo[self.pos_atual][no_frente]['conhecimento'] = (
-                    OpçõesConhecimentoAresta.BLOCO_BRANCO
+                self.mapa.definir_conhecimento_aresta(
+                    self.pos_atual, no_frente, OpçõesConhecimentoAresta.BLOCO_BRANCO
                 )
 
                 return Cores.BRANCO
 
             self.robo.ande_certa_distancia(20, velocidade=VELOCIDADE_PADRAO)
-            self.atualizacao_dinamica_mapa()
+            # A evidência antiga era do bloco que acabou de ser pego: só a nova leitura decide
             no_frente, _, _, _ = self.nos_vizinhos
+            self.mapa.definir_conhecimento_aresta(
+                self.pos_atual, no_frente, OpçõesConhecimentoAresta.DESCONHECIDA
+            )
+            self.atualizacao_dinamica_mapa()
 
-            if self.mapa.grafo[self.pos_atual][no_frente]['conhecimento'] == OpçõesConhecimentoAresta.BLOCO:
+            if self.mapa.conhecimento_aresta(self.pos_atual, no_frente) == OpçõesConhecimentoAresta.BLOCO:
+                if (
+                    self.MAX_TENTATIVAS_PEGAR_BLOCO is not None
+                    and tentativas >= self.MAX_TENTATIVAS_PEGAR_BLOCO
+                ):
+                    # Desiste do bloco como de um branco, para o planejador não voltar a ele
+                    print('Tentativas de pegar bloco esgotadas.')
+                    self.mapa.definir_conhecimento_aresta(
+                        self.pos_atual, no_frente, OpçõesConhecimentoAresta.BLOCO_BRANCO
+                    )
+                    return Cores.BRANCO
                 cor_pega = False
                 distancia += 5
             else:
@@ -202,7 +233,7 @@ class EstrategiaMapa(EstrategiaBase):
 
         for no in nos_possiveis:
             try:
-                if self.mapa.grafo[self.pos_atual][no]['conhecimento'] == OpçõesConhecimentoAresta.BLOCO:
+                if self.mapa.conhecimento_aresta(self.pos_atual, no) == OpçõesConhecimentoAresta.BLOCO:
                     self.robo.voltar_encruzilhada(velocidade=velocidade)
                     self.rotacionar_para_no(
                         no, girar_com_giroscopio=True, velocidade=velocidade, distancia=25
@@ -228,7 +259,13 @@ class EstrategiaMapa(EstrategiaBase):
         LEN_QUANDO_CHEGAR = 2
 
         # Navega pelo caminho mais curto até chegar próximo à área verde
-        while len(caminho := self.mapa.caminho_saida(self.pos_atual)) > LEN_QUANDO_CHEGAR:
+        while True:
+            caminho = self.caminho_para_area_verde()
+            if caminho is None:
+                print('Erro: nenhum caminho até a área verde.')
+                return
+            if len(caminho) <= LEN_QUANDO_CHEGAR:
+                break
             proximo_no = caminho[1]
             self.rotacionar_para_no(proximo_no)
             if not self.seguir_ate_encruzilhada(tempo_minimo=0.2, com_cubo=True):
@@ -240,3 +277,20 @@ class EstrategiaMapa(EstrategiaBase):
 
         # Rotaciona para ficar de frente para a entrada da área verde
         self.rotacionar_para_no((self.pos_atual[0], -1), andar_para_frente=True)
+
+    def caminho_para_area_verde(self) -> list[tuple[int, int]] | None:
+        """Caminho até a área verde, duvidando dos bloqueios do mapa enquanto não houver nenhum.
+
+        Leituras com ruído podem marcar arestas livres como BLOCO até fechar todas as
+        saídas. A cada planejamento sem caminho a evidência de todos os BLOCOs cai pela
+        metade (`Mapa.duvidar_blocos`), abrindo primeiro os menos confirmados, e os
+        sensores os conferem de novo no trajeto. Retorna None só se não restar nenhum
+        BLOCO para abrir.
+        """
+        caminho = self.planejador.caminho_saida(self.pos_atual, self.direcao)
+        while caminho is None and self.mapa.mascaras[Mapa.BLOCO]:
+            reabertas = self.mapa.duvidar_blocos()
+            print(f'Nenhum caminho até a área verde: {reabertas} bloqueios voltaram a ser desconhecidos.')
+            if reabertas:
+                caminho = self.planejador.caminho_saida(self.pos_atual, self.direcao)
+        return caminho
@@ -1,7 +1,25 @@
-from typing import Iterable
+"""Representação do mapa da arena usada pelas estratégias.
 
-import matplotlib.pyplot as plt
-import networkx as nx
+O mapa é uma grade de nós (linha, coluna) ligados por arestas horizontais e
+verticais, mais o nó especial AREA_VERDE ligado a todos os nós da coluna 0.
+O conhecimento de cada aresta é guardado como um código pequeno em arrays
+indexados pelo id do nó (id = linha * largura + coluna):
+
+- `horizontais[id]`: aresta entre o nó e o vizinho da direita
+- `verticais[id]`: aresta entre o nó e o vizinho de baixo
+- `entradas[linha]`: aresta entre a área verde e o nó (linha, 0)
+
+Assim as consultas feitas a cada encruzilhada percorrem apenas arrays e listas
+pré-calculadas, sem dicionários de grafo nem funções de peso por aresta.
+"""
+
+from array import array
+from heapq import heappop, heappush
+from itertools import count
+from math import log, tanh
+from typing import Callable, Iterable
+
+INFINITO = float('inf')
 
 
 class OpçõesConhecimentoAresta:
@@ -12,111 +30,539 @@ class OpçõesConhecimentoAresta:
     BLOCO_BRANCO = {'peso': None, 'cor': 'red'}
 
 
-class Mapa:
+class Mapa:  # noqa: PLR0904
     AREA_VERDE = (-1, -1)
 
-    def __init__(self, altura: int = 5, largura: int = 6):
+    # Códigos armazenados nos arrays, na mesma ordem de OPCOES
+    INICIO = 0
+    VAZIO = 1
+    DESCONHECIDA = 2
+    BLOCO = 3
+    BLOCO_BRANCO = 4
+    SEM_ARESTA = 255
+
+    OPCOES = (
+        OpçõesConhecimentoAresta.INICIO,
+        OpçõesConhecimentoAresta.VAZIO,
+        OpçõesConhecimentoAresta.DESCONHECIDA,
+        OpçõesConhecimentoAresta.BLOCO,
+        OpçõesConhecimentoAresta.BLOCO_BRANCO,
+    )
+    PESOS = tuple(opcao['peso'] for opcao in OPCOES)
+
+    # Modelo de ocupação das arestas (log-odds de haver bloco)
+    LIMIAR_LOG_ODDS = 1.1  # ~75%: acima vira BLOCO, abaixo do negativo vira VAZIO
+    LIMITE_LOG_ODDS = 4.0  # Satura a evidência para que o mapa ainda possa mudar de ideia
+    OBSERVACOES_SUFICIENTES = 5  # Depois disso a aresta é decidida pelo sinal da evidência
+    FATOR_SIMETRIA = 0.5  # Fração da evidência repassada à aresta espelhada
+    FATOR_DUVIDA = 0.5  # Fração da evidência dos BLOCOs mantida a cada planejamento sem saída
+
+    def __init__(self, altura: int = 5, largura: int = 6, simetria: bool = False):
         self.altura = altura
         self.largura = largura
-        self.grafo: nx.Graph = nx.grid_2d_graph(altura, largura)
-
-        for aresta in self.grafo.edges:
-            self.grafo.edges[aresta]['conhecimento'] = OpçõesConhecimentoAresta.DESCONHECIDA
-
-        self.grafo.add_node(self.AREA_VERDE)
-        for node in self.grafo.nodes:
-            if node[1] == 0:
-                self.grafo.add_edge(
-                    self.AREA_VERDE,
-                    node,
-                    conhecimento=OpçõesConhecimentoAresta.INICIO,
+        # O campo é montado com pares de blocos espelhados pelo centro: cada leitura vira
+        # uma suposição, com menos confiança, sobre a aresta espelhada ainda não observada
+        self.simetria = simetria
+        self.qtd_nos = altura * largura
+        self.id_area_verde = self.qtd_nos
+
+        self.horizontais = array('B', [self.SEM_ARESTA]) * self.qtd_nos
+        self.verticais = array('B', [self.SEM_ARESTA]) * self.qtd_nos
+        self.entradas = array('B', [self.INICIO]) * altura
+
+        for linha in range(altura):
+            for coluna in range(largura):
+                id_no = linha * largura + coluna
+                if coluna < largura - 1:
+                    self.horizontais[id_no] = self.DESCONHECIDA
+                if linha < altura - 1:
+                    self.verticais[id_no] = self.DESCONHECIDA
+
+        # Tupla (linha, coluna) de cada id, com a área verde no último id
+        self.nos = [(linha, coluna) for linha in range(altura) for coluna in range(largura)]
+        self.nos.append(self.AREA_VERDE)
+        self.ids = {no: id_no for id_no, no in enumerate(self.nos)}
+
+        # Funções chamadas com (id_u, id_v) sempre que o conhecimento de uma aresta muda
+        self.ouvintes: list[Callable[[int, int], None]] = []
+
+        self._calcular_vizinhancas()
+        self._calcular_indices()
+        self._calcular_espelhos()
+
+    def _calcular_vizinhancas(self):
+        """Pré-calcula, para cada nó, as arestas vizinhas e as arestas em linha reta a dois passos.
+
+        `vizinhos[id]` guarda tuplas (id_vizinho, array, índice) e `vizinhos_em_linha[id]`
+        guarda (array, índice) das arestas vizinho -> vizinho do vizinho na mesma direção,
+        usadas para priorizar a exploração.
+
+        Os vizinhos ficam na ordem do grafo do `MapaGrafo` (cima, baixo, esquerda, direita e
+        área verde), que decide os empates das buscas.
+        """
+        self.vizinhos = [[] for _ in range(self.qtd_nos + 1)]
+        self.vizinhos_em_linha = [[] for _ in range(self.qtd_nos + 1)]
+
+        largura = self.largura
+        for id_no in range(self.qtd_nos):
+            vizinhos = self.vizinhos[id_no]
+            if id_no >= largura and self.verticais[id_no - largura] != self.SEM_ARESTA:
+                vizinhos.append((id_no - largura, self.verticais, id_no - largura))
+            if self.verticais[id_no] != self.SEM_ARESTA:
+                vizinhos.append((id_no + largura, self.verticais, id_no))
+            if id_no % largura and self.horizontais[id_no - 1] != self.SEM_ARESTA:
+                vizinhos.append((id_no - 1, self.horizontais, id_no - 1))
+            if self.horizontais[id_no] != self.SEM_ARESTA:
+                vizinhos.append((id_no + 1, self.horizontais, id_no))
+
+        for linha in range(self.altura):
+            id_no = linha * largura
+            self.vizinhos[id_no].append((self.id_area_verde, self.entradas, linha))
+            self.vizinhos[self.id_area_verde].append((id_no, self.entradas, linha))
+
+        for id_no in range(self.qtd_nos):
+            linha, coluna = self.nos[id_no]
+            for delta_linha, delta_coluna in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+                vizinho = (linha + delta_linha, coluna + delta_coluna)
+                vizinho_vizinho = (linha + 2 * delta_linha, coluna + 2 * delta_coluna)
+                if self.possui_aresta(self.nos[id_no], vizinho) and self.possui_aresta(
+                    vizinho, vizinho_vizinho
+                ):
+                    self.vizinhos_em_linha[id_no].append(self._aresta(vizinho, vizinho_vizinho))
+
+    def _calcular_indices(self):
+        """Monta os índices de arestas desconhecidas e com bloco, mantidos a cada escrita.
+
+        - `qtd_desconhecidas[id]` / `qtd_blocos[id]`: arestas da grade do nó em cada estado
+        - `ids_desconhecidos` / `ids_com_bloco`: nós com pelo menos uma dessas arestas
+        - `arestas_bloco`: pares (id_u, id_v) das arestas com bloco
+        - `prioridades[id]`: valor de `prioridade_desconhecido` para cada nó
+        - `dependentes[id(array)][índice]`: nós cuja prioridade conta a aresta
+        - `mascaras[código]`: bitboard com um bit por aresta em cada estado (ver `estado`)
+        """
+        tamanho = self.qtd_nos + 1
+        self.qtd_desconhecidas = [0] * tamanho
+        self.qtd_blocos = [0] * tamanho
+        self.prioridades = [0] * tamanho
+        self.ids_desconhecidos = set()
+        self.ids_com_bloco = set()
+        self.arestas_bloco = set()
+
+        # Bit de cada aresta: horizontais, depois verticais e por fim as entradas da área verde
+        self.deslocamentos = {
+            id(self.horizontais): 0,
+            id(self.verticais): self.qtd_nos,
+            id(self.entradas): 2 * self.qtd_nos,
+        }
+        self.mascaras = [0] * len(self.OPCOES)
+
+        # Evidência acumulada por aresta, no mesmo índice dos bits
+        qtd_arestas = 2 * self.qtd_nos + self.altura
+        self.log_odds = array('d', [0.0]) * qtd_arestas
+        self.observacoes = array('H', [0]) * qtd_arestas
+        # Arestas cujo estado veio só da aresta espelhada e pares que deixaram de ser simétricos
+        self.espelhadas = array('B', [0]) * qtd_arestas
+        self.assimetricas = array('B', [0]) * qtd_arestas
+
+        self.dependentes = {
+            id(tabela): [[] for _ in tabela] for tabela in (self.horizontais, self.verticais, self.entradas)
+        }
+        for id_no in range(tamanho):
+            for _, tabela, indice in self.vizinhos[id_no]:
+                self.dependentes[id(tabela)][indice].append(id_no)
+            for tabela, indice in self.vizinhos_em_linha[id_no]:
+                self.dependentes[id(tabela)][indice].append(id_no)
+
+        for tabela, passo in ((self.horizontais, 1), (self.verticais, self.largura)):
+            for indice, codigo in enumerate(tabela):
+                self._indexar(tabela, indice, indice, indice + passo, codigo, 1)
+        for linha, codigo in enumerate(self.entradas):
+            self._indexar(self.entradas, linha, linha * self.largura, self.id_area_verde, codigo, 1)
+
+    def _calcular_espelhos(self):
+        """Pré-calcula a aresta espelhada pelo centro do campo de cada aresta da grade.
+
+        O nó (linha, coluna) é espelhado em (altura - 1 - linha, largura - 1 - coluna), que
+        em ids é `qtd_nos - 1 - id`. `espelhos[bit]` é o bit da aresta espelhada (-1 para
+        as entradas da área verde, que não têm espelho) e `arestas_por_bit[bit]` guarda
+        (array, índice, id_u, id_v) para escrever nela.
+        """
+        qtd_arestas = len(self.log_odds)
+        self.espelhos = array('i', [-1]) * qtd_arestas
+        self.arestas_por_bit: list[tuple[array, int, int, int] | None] = [None] * qtd_arestas
+
+        ultimo = self.qtd_nos - 1
+        for tabela, passo in ((self.horizontais, 1), (self.verticais, self.largura)):
+            deslocamento = self.deslocamentos[id(tabela)]
+            for indice, codigo in enumerate(tabela):
+                if codigo == self.SEM_ARESTA:
+                    continue
+                self.arestas_por_bit[deslocamento + indice] = (tabela, indice, indice, indice + passo)
+                self.espelhos[deslocamento + indice] = deslocamento + ultimo - passo - indice
+        for linha in range(self.altura):
+            self.arestas_por_bit[self.deslocamentos[id(self.entradas)] + linha] = (
+                self.entradas,
+                linha,
+                linha * self.largura,
+                self.id_area_verde,
+            )
+
+    def _indexar(self, tabela: array, indice: int, id_u: int, id_v: int, codigo: int, delta: int):
+        """Soma (delta=1) ou retira (delta=-1) a aresta com o código dado dos índices."""
+        if codigo == self.SEM_ARESTA:
+            return
+
+        bit = 1 << (self.deslocamentos[id(tabela)] + indice)
+        if delta > 0:
+            self.mascaras[codigo] |= bit
+        else:
+            self.mascaras[codigo] &= ~bit
+
+        if codigo == self.DESCONHECIDA:
+            for id_no in self.dependentes[id(tabela)][indice]:
+                self.prioridades[id_no] += delta
+            if tabela is self.entradas:
+                return
+            for id_no in (id_u, id_v):
+                self.qtd_desconhecidas[id_no] += delta
+                if self.qtd_desconhecidas[id_no]:
+                    self.ids_desconhecidos.add(id_no)
+                else:
+                    self.ids_desconhecidos.discard(id_no)
+
+        elif codigo == self.BLOCO and tabela is not self.entradas:
+            if delta > 0:
+                self.arestas_bloco.add((id_u, id_v))
+            else:
+                self.arestas_bloco.discard((id_u, id_v))
+            for id_no in (id_u, id_v):
+                self.qtd_blocos[id_no] += delta
+                if self.qtd_blocos[id_no]:
+                    self.ids_com_bloco.add(id_no)
+                else:
+                    self.ids_com_bloco.discard(id_no)
+
+    # ==========================================================================
+    # ACESSO ÀS ARESTAS
+    # ==========================================================================
+
+    def id_no(self, no: tuple[int, int]) -> int:
+        """Converte um nó (linha, coluna) no seu id. Lança KeyError se o nó não existir."""
+        return self.ids[no]
+
+    def _aresta(self, u: tuple[int, int], v: tuple[int, int]) -> tuple[array, int]:
+        """Retorna o array e o índice onde a aresta (u, v) é armazenada."""
+        if u == self.AREA_VERDE:
+            u, v = v, u
+        if v == self.AREA_VERDE:
+            if u[1] == 0 and 0 <= u[0] < self.altura:
+                return self.entradas, u[0]
+            raise KeyError((u, v))
+
+        id_u, id_v = self.id_no(u), self.id_no(v)
+        if id_u > id_v:
+            id_u, id_v = id_v, id_u
+
+        if id_v - id_u == 1 and self.horizontais[id_u] != self.SEM_ARESTA:
+            return self.horizontais, id_u
+        if id_v - id_u == self.largura:
+            return self.verticais, id_u
+        raise KeyError((u, v))
+
+    def possui_aresta(self, u: tuple[int, int], v: tuple[int, int]) -> bool:
+        """Indica se existe uma aresta entre os nós u e v."""
+        try:
+            self._aresta(u, v)
+        except KeyError:
+            return False
+        return True
+
+    def conhecimento_aresta(self, u: tuple[int, int], v: tuple[int, int]) -> dict:
+        """Retorna o conhecimento da aresta (u, v). Lança KeyError se a aresta não existir."""
+        tabela, indice = self._aresta(u, v)
+        return self.OPCOES[tabela[indice]]
+
+    def definir_conhecimento_aresta(self, u: tuple[int, int], v: tuple[int, int], conhecimento: dict):
+        """Define o conhecimento da aresta (u, v). Lança KeyError se a aresta não existir."""
+        tabela, indice = self._aresta(u, v)
+        id_u, id_v = sorted((self.ids[u], self.ids[v]))
+        codigo = self.OPCOES.index(conhecimento)
+        if tabela[indice] == self.BLOCO and codigo != self.BLOCO:
+            # O bloco foi retirado do campo: a aresta espelhada não segue mais esta
+            bit = self.deslocamentos[id(tabela)] + indice
+            self.assimetricas[bit] = 1
+            if self.espelhos[bit] >= 0:
+                self.assimetricas[self.espelhos[bit]] = 1
+        self._esquecer_evidencia(tabela, indice)
+        self._definir_codigo(tabela, indice, id_u, id_v, codigo)
+
+    def observar_aresta(self, u: tuple[int, int], v: tuple[int, int], probabilidade_bloco: float) -> dict:
+        """Funde uma leitura de sensor no modelo de ocupação da aresta e retorna o novo conhecimento.
+
+        A leitura é somada em log-odds à evidência da aresta. O conhecimento só muda
+        quando a evidência cruza o limiar do estado oposto (histerese), então uma
+        leitura isolada com ruído não desfaz um BLOCO ou VAZIO já confirmado. Depois de
+        OBSERVACOES_SUFICIENTES leituras uma aresta ainda desconhecida é decidida pelo
+        sinal da evidência, para o robô não voltar a ela indefinidamente. Arestas
+        INICIO e BLOCO_BRANCO acumulam evidência, mas não mudam de estado.
+
+        Com `simetria`, um BLOCO ou VAZIO decidido é copiado para a aresta espelhada
+        enquanto ela não tiver leituras próprias, com FATOR_SIMETRIA da evidência. A
+        primeira leitura direta descarta essa suposição.
+        """
+        tabela, indice = self._aresta(u, v)
+        bit = self.deslocamentos[id(tabela)] + indice
+        if self.espelhadas[bit]:
+            self.log_odds[bit] = 0.0
+            self.espelhadas[bit] = 0
+        evidencia = self.log_odds[bit] + log(probabilidade_bloco / (1 - probabilidade_bloco))
+        evidencia = max(-self.LIMITE_LOG_ODDS, min(self.LIMITE_LOG_ODDS, evidencia))
+        self.log_odds[bit] = evidencia
+        self.observacoes[bit] = min(self.observacoes[bit] + 1, 0xFFFF)
+
+        codigo = tabela[indice]
+        if codigo in (self.INICIO, self.BLOCO_BRANCO):
+            return self.OPCOES[codigo]
+
+        if evidencia > self.LIMIAR_LOG_ODDS:
+            codigo = self.BLOCO
+        elif evidencia < -self.LIMIAR_LOG_ODDS:
+            codigo = self.VAZIO
+        elif codigo == self.DESCONHECIDA and self.observacoes[bit] >= self.OBSERVACOES_SUFICIENTES:
+            codigo = self.BLOCO if evidencia > 0 else self.VAZIO
+
+        id_u, id_v = sorted((self.ids[u], self.ids[v]))
+        self._definir_codigo(tabela, indice, id_u, id_v, codigo)
+        if self.simetria and codigo in (self.VAZIO, self.BLOCO):
+            self._espelhar(bit, codigo, evidencia)
+        return self.OPCOES[codigo]
+
+    def _espelhar(self, bit: int, codigo: int, evidencia: float):
+        """Repassa o estado decidido da aresta à espelhada, se ela ainda não foi observada."""
+        espelho = self.espelhos[bit]
+        if espelho < 0 or espelho == bit or self.assimetricas[bit] or self.observacoes[espelho]:
+            return
+        tabela, indice, id_u, id_v = self.arestas_por_bit[espelho]
+        if tabela[indice] in (self.INICIO, self.BLOCO_BRANCO):
+            return
+        self.log_odds[espelho] = evidencia * self.FATOR_SIMETRIA
+        self.espelhadas[espelho] = 1
+        self._definir_codigo(tabela, indice, id_u, id_v, codigo)
+
+    def confianca_aresta(self, u: tuple[int, int], v: tuple[int, int]) -> float:
+        """Confiança no estado da aresta, de 0 (sem evidência) a 1 (evidência saturada).
+
+        Equivale a |2p - 1|, onde p é a probabilidade de bloco dada pelas leituras fundidas.
+        """
+        tabela, indice = self._aresta(u, v)
+        return tanh(abs(self.log_odds[self.deslocamentos[id(tabela)] + indice]) / 2)
+
+    def duvidar_blocos(self, fator: float = FATOR_DUVIDA) -> int:
+        """Reduz a evidência de todas as arestas com BLOCO, para quando nenhum caminho é possível.
+
+        Leituras falsas de bloco próximo saturam a evidência em LIMITE_LOG_ODDS, e a
+        histerese mantém a aresta fechada até o robô ficar sem saída. Cada chamada
+        multiplica a evidência por `fator`; as arestas que ficam abaixo de
+        LIMIAR_LOG_ODDS voltam a ser desconhecidas e sem evidência, para a próxima
+        leitura decidi-las, e as menos confirmadas abrem primeiro. A aresta não fica
+        assimétrica, já que nenhum bloco foi retirado. Retorna quantas arestas deixaram
+        de ser BLOCO.
+        """
+        reabertas = 0
+        mascara = self.mascaras[self.BLOCO]
+        for bit in range(mascara.bit_length()):
+            if not mascara >> bit & 1:
+                continue
+            tabela, indice, id_u, id_v = self.arestas_por_bit[bit]
+            self.log_odds[bit] *= fator
+            if self.log_odds[bit] <= self.LIMIAR_LOG_ODDS:
+                self._esquecer_evidencia(tabela, indice)
+                self._definir_codigo(tabela, indice, id_u, id_v, self.DESCONHECIDA)
+                reabertas += 1
+        return reabertas
+
+    def _esquecer_evidencia(self, tabela: array, indice: int):
+        bit = self.deslocamentos[id(tabela)] + indice
+        self.log_odds[bit] = 0.0
+        self.observacoes[bit] = 0
+        self.espelhadas[bit] = 0
+
+    def _definir_codigo(self, tabela: array, indice: int, id_u: int, id_v: int, codigo: int):
+        """Único ponto de escrita nos arrays: atualiza os índices e avisa os ouvintes."""
+        codigo_antigo = tabela[indice]
+        if codigo_antigo == codigo:
+            return
+        self._indexar(tabela, indice, id_u, id_v, codigo_antigo, -1)
+        tabela[indice] = codigo
+        self._indexar(tabela, indice, id_u, id_v, codigo, 1)
+        self._notificar(id_u, id_v)
+
+    def estado(self) -> tuple[int, ...]:
+        """Retorna o conhecimento de todas as arestas como uma tupla de bitboards.
+
+        A tupla tem as dimensões do mapa e uma máscara por estado (INICIO, VAZIO,
+        DESCONHECIDA, BLOCO, BLOCO_BRANCO). Por ser feita apenas de inteiros, seu hash
+        é o mesmo em qualquer execução e serve de chave para memorizar planos.
+        """
+        return (self.altura, self.largura, *self.mascaras)
+
+    def registrar_ouvinte(self, ouvinte: Callable[[int, int], None]):
+        """Registra uma função chamada com os ids (u, v) de cada aresta cujo conhecimento mudar."""
+        self.ouvintes.append(ouvinte)
+
+    def _notificar(self, id_u: int, id_v: int):
+        for ouvinte in self.ouvintes:
+            ouvinte(id_u, id_v)
+
+    def arestas(self) -> Iterable[tuple[tuple[int, int], tuple[int, int], dict]]:
+        """Itera sobre todas as arestas do mapa como (u, v, conhecimento)."""
+        for id_no in range(self.qtd_nos):
+            if self.horizontais[id_no] != self.SEM_ARESTA:
+                yield self.nos[id_no], self.nos[id_no + 1], self.OPCOES[self.horizontais[id_no]]
+            if self.verticais[id_no] != self.SEM_ARESTA:
+                yield (
+                    self.nos[id_no],
+                    self.nos[id_no + self.largura],
+                    self.OPCOES[self.verticais[id_no]],
                 )
+        for linha in range(self.altura):
+            yield self.AREA_VERDE, (linha, 0), self.OPCOES[self.entradas[linha]]
+
+    # ==========================================================================
+    # CONSULTAS DE PLANEJAMENTO
+    # ==========================================================================
 
     def caminho_saida(self, origem):
         """Calcula o caminho mais curto do nó de origem até a área verde (0, -1) usando Dijkstra."""
-        return nx.dijkstra_path(
-            self.grafo,
-            source=origem,
-            target=self.AREA_VERDE,
-            weight=lambda u, v, a: a['conhecimento']['peso'],
-        )
+        caminho = self._dijkstra((self.ids[origem],), self.id_area_verde)
+        return None if caminho is None else caminho[::-1]
 
     def nos_com_bloco(self) -> set[tuple[int, int]]:
         """Retorna um conjunto de nós que possuem arestas com conhecimento de bloco."""
-        nos_com_bloco = set()
-        for u, v, conhecimento in self.grafo.edges.data('conhecimento'):
-            if conhecimento == OpçõesConhecimentoAresta.BLOCO:
-                nos_com_bloco.add(u)
-                nos_com_bloco.add(v)
-        return nos_com_bloco
+        return {self.nos[id_no] for id_no in self.ids_com_bloco}
+
+    def prioridade_desconhecido(self, id_no: int) -> int:
+        """Conta as arestas desconhecidas vizinhas ao nó e as que estão em linha reta a dois passos."""
+        return self.prioridades[id_no]
 
     def nos_com_arestas_desconhecidas(self) -> list[tuple[int, int]]:
         """Retorna uma lista de nós que possuem arestas com conhecimento desconhecido."""
-        nos_com_arestas_desconhecidas = set()
-        for u, v, conhecimento in self.grafo.edges.data('conhecimento'):
-            if conhecimento == OpçõesConhecimentoAresta.DESCONHECIDA:
-                nos_com_arestas_desconhecidas.add(u)
-                nos_com_arestas_desconhecidas.add(v)
-        nos_com_arestas_desconhecidas = list(nos_com_arestas_desconhecidas)
-
-        # Ordena os nós por prioridade baseada na quantidade de vizinhos desconhecidos
-        def contar_vizinhos_desconhecidos(no):
-            vizinhos_desconhecidos = set()
-            # Conta vizinhos diretos com arestas desconhecidas
-            for vizinho in self.grafo.neighbors(no):
-                if self.grafo.edges[no, vizinho]['conhecimento'] == OpçõesConhecimentoAresta.DESCONHECIDA:
-                    vizinhos_desconhecidos.add(vizinho)
-
-                # Conta vizinhos indiretos com arestas desconhecidas
-                # Considera o vizinho como um ponto de referência para encontrar vizinhos indiretos
-                # que estão na mesma direção do nó atual
-                # Exemplo: se o nó atual é (2, 2) e o vizinho é (3, 2),
-                # então o vizinho vizinho seria (4, 2)
-                diferenca = (vizinho[0] - no[0], vizinho[1] - no[1])
-                vizinho_vizinho = (vizinho[0] + diferenca[0], vizinho[1] + diferenca[1])
-
-                if (
-                    self.grafo.has_edge(vizinho, vizinho_vizinho)
-                    and self.grafo.edges[vizinho, vizinho_vizinho]['conhecimento']
-                    == OpçõesConhecimentoAresta.DESCONHECIDA
-                ):
-                    vizinhos_desconhecidos.add(vizinho_vizinho)
-
-            return len(vizinhos_desconhecidos)
-
-        # A ordenação garante que, em caso de empate, o nó com maior potencial de descoberta de vizinhos desconhecidos seja priorizado na próxima ação.
-        # o algoritmo vai escolher o nó mais próximo que estiver mais no final da lista
-        # por isso, invertemos a lista para que os nós com mais vizinhos desconhecidos fiquem no final
-        nos_com_arestas_desconhecidas.sort(key=contar_vizinhos_desconhecidos, reverse=True)
-        return nos_com_arestas_desconhecidas
+        # Os nós com maior potencial de descoberta de vizinhos desconhecidos vêm primeiro
+        prioridades = self.prioridades
+        ids_ordenados = sorted(self.ids_desconhecidos, key=lambda id_no: (-prioridades[id_no], id_no))
+        return [self.nos[id_no] for id_no in ids_ordenados]
 
     def dijkstra_multiplos_destinos(
         self, origem: tuple[int, int], destinos: Iterable[tuple[int, int]]
     ) -> list[tuple[int, int]] | None:
-        """Calcula o caminho mais curto do nó de origem até qualquer um dos nós de destino usando Dijkstra."""
-        try:
-            _, caminho = nx.multi_source_dijkstra(
-                self.grafo,
-                sources=destinos,
-                target=origem,
-                weight=lambda u, v, a: a['conhecimento']['peso'],
-            )
-        except nx.NetworkXNoPath:
-            return None
+        """Calcula o caminho mais curto do nó de origem até qualquer um dos nós de destino usando Dijkstra.
+
+        Entre destinos à mesma distância vale a ordem de `destinos`, como no `MapaGrafo`: a
+        busca parte deles, na ordem dada, em direção à origem.
+        """
+        ids = self.ids
+        ids_destinos = [ids[destino] for destino in destinos]
+        id_origem = ids[origem]
+        if id_origem in ids_destinos:
+            return [origem]
+        return self._dijkstra(ids_destinos, id_origem)
+
+    def _dijkstra(self, ids_origens: Iterable[int], id_alvo: int) -> list[tuple[int, int]] | None:
+        """Busca a partir de todas as origens até o alvo e retorna o caminho do alvo até a origem dele.
+
+        Desempata como o `nx.multi_source_dijkstra`: entre nós à mesma distância sai primeiro
+        o que entrou antes na fila, então os resultados são os mesmos do `MapaGrafo`.
+        """
+        pesos = self.PESOS
+        vizinhos = self.vizinhos
+        contador = count()
+        # As origens entram com distância 0 e contador crescente: a lista já é um heap
+        fila = [(0, next(contador), id_origem) for id_origem in ids_origens]
+        distancias = {id_origem: 0 for _, _, id_origem in fila}
+        anteriores = {}
+        visitados = set()
+
+        while fila:
+            distancia, _, id_no = heappop(fila)
+            if id_no in visitados:
+                continue
+            visitados.add(id_no)
+
+            if id_no == id_alvo:
+                caminho = [self.nos[id_no]]
+                while id_no in anteriores:
+                    id_no = anteriores[id_no]
+                    caminho.append(self.nos[id_no])
+                return caminho
 
-        # Inverte pois a lib retorna do destino para a origem
-        return list(reversed(caminho))
+            for id_vizinho, tabela, indice in vizinhos[id_no]:
+                peso = pesos[tabela[indice]]
+                if peso is None or id_vizinho in visitados:
+                    continue
+                nova_distancia = distancia + peso
+                if nova_distancia < distancias.get(id_vizinho, INFINITO):
+                    distancias[id_vizinho] = nova_distancia
+                    anteriores[id_vizinho] = id_no
+                    heappush(fila, (nova_distancia, next(contador), id_vizinho))
+
+        return None
+
+    def distancias(self, origem: tuple[int, int]) -> list[float]:
+        """Calcula a distância da origem até todos os nós, indexada pelo id do nó (INFINITO se inalcançável)."""
+        pesos = self.PESOS
+        vizinhos = self.vizinhos
+        distancias = [INFINITO] * (self.qtd_nos + 1)
+        id_origem = self.ids[origem]
+        distancias[id_origem] = 0
+        fila = [(0, id_origem)]
+
+        while fila:
+            distancia, id_no = heappop(fila)
+            if distancia > distancias[id_no]:
+                continue
+            for id_vizinho, tabela, indice in vizinhos[id_no]:
+                peso = pesos[tabela[indice]]
+                if peso is None:
+                    continue
+                nova_distancia = distancia + peso
+                if nova_distancia < distancias[id_vizinho]:
+                    distancias[id_vizinho] = nova_distancia
+                    heappush(fila, (nova_distancia, id_vizinho))
+
+        return distancias
+
+    def arestas_com_bloco(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Retorna as arestas (u, v) com conhecimento de bloco."""
+        return [(self.nos[id_u], self.nos[id_v]) for id_u, id_v in sorted(self.arestas_bloco)]
+
+    # ==========================================================================
+    # VISUALIZAÇÃO E MANUTENÇÃO
+    # ==========================================================================
+
+    def para_grafo(self):
+        """Monta um grafo do NetworkX com o conhecimento atual, usado na visualização."""
+        import networkx as nx  # noqa: PLC0415
+
+        grafo = nx.Graph()
+        grafo.add_nodes_from(self.nos)
+        for u, v, conhecimento in self.arestas():
+            grafo.add_edge(u, v, conhecimento=conhecimento)
+        return grafo
 
     def print(self):
         """Desenha o grafo usando Matplotlib."""
-        pos = {(i, j): (j, -i) for i in range(5) for j in range(6)}
+        import matplotlib.pyplot as plt  # noqa: PLC0415
+        import networkx as nx  # noqa: PLC0415
+
+        grafo = self.para_grafo()
+        pos = {(i, j): (j, -i) for i in range(self.altura) for j in range(self.largura)}
         pos[self.AREA_VERDE] = (-1, -2)
-        cores_arestas = [conhecimento['cor'] for u, v, conhecimento in self.grafo.edges.data('conhecimento')]
+        cores_arestas = [conhecimento['cor'] for u, v, conhecimento in grafo.edges.data('conhecimento')]
         labels_arestas = {
-            (u, v): conhecimento['peso'] for u, v, conhecimento in self.grafo.edges.data('conhecimento')
+            (u, v): conhecimento['peso'] for u, v, conhecimento in grafo.edges.data('conhecimento')
         }
         nx.draw(
-            self.grafo,
+            grafo,
             pos=pos,
             with_labels=True,
             node_size=500,
@@ -126,17 +572,22 @@ class Mapa:
             font_size=8,
             font_color='black',
         )
-        nx.draw_networkx_edge_labels(self.grafo, pos, edge_labels=labels_arestas)
+        nx.draw_networkx_edge_labels(grafo, pos, edge_labels=labels_arestas)
         plt.show()
 
     def zerar(self):
         """Zera o mapa, removendo todas as informações de conhecimento."""
-        for u, v in self.grafo.edges:
-            if self.grafo.edges[u, v]['conhecimento'] not in (  # noqa
-                OpçõesConhecimentoAresta.INICIO,
-                OpçõesConhecimentoAresta.BLOCO_BRANCO,
-            ):
-                self.grafo.edges[u, v]['conhecimento'] = OpçõesConhecimentoAresta.DESCONHECIDA
+        for tabela, passo in ((self.horizontais, 1), (self.verticais, self.largura)):
+            for indice, codigo in enumerate(tabela):
+                if codigo not in (self.INICIO, self.BLOCO_BRANCO, self.SEM_ARESTA):
+                    self._esquecer_evidencia(tabela, indice)
+                    self._definir_codigo(tabela, indice, indice, indice + passo, self.DESCONHECIDA)
+        for linha, codigo in enumerate(self.entradas):
+            if codigo not in (self.INICIO, self.BLOCO_BRANCO):
+                self._esquecer_evidencia(self.entradas, linha)
+                self._definir_codigo(
+                    self.entradas, linha, linha * self.largura, self.id_area_verde, self.DESCONHECIDA
+                )
 
 
 if __name__ == '__main__':
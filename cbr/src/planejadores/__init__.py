@@ -0,0 +1,20 @@
+from .interface_planejador import InterfacePlanejador
+from .planejador_coleta import PlanejadorColeta
+from .planejador_dijkstra import PlanejadorDijkstra
+from .planejador_direcional import PlanejadorDirecional
+from .planejador_ganho_informacao import PlanejadorGanhoInformacao
+from .planejador_incremental import PlanejadorIncremental
+from .planejador_memorizado import CacheLRU, PlanejadorMemorizado
+from .planejador_tabelas import PlanejadorTabelas
+
+__all__ = [
+    'CacheLRU',
+    'InterfacePlanejador',
+    'PlanejadorColeta',
+    'PlanejadorDijkstra',
+    'PlanejadorDirecional',
+    'PlanejadorGanhoInformacao',
+    'PlanejadorIncremental',
+    'PlanejadorMemorizado',
+    'PlanejadorTabelas',
+]
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from settings import CUSTO_ARESTA
+from src.mapa import Mapa
+
+
+class InterfacePlanejador(ABC):
+    """Interface dos planejadores de caminho usados pelas estratégias.
+
+    Todos os métodos recebem o nó de origem e, opcionalmente, a direção atual do robô
+    (valores de EstrategiaBase.Direcoes), que só é usada pelos planejadores que
+    consideram giros. Os métodos de caminho retornam uma lista de nós começando na
+    origem, ou None se nenhum destino for alcançável.
+    """
+
+    # Indica se o caminho retornado depende da direção do robô
+    considera_direcao = False
+
+    def __init__(self, mapa: Mapa):
+        self.mapa = mapa
+
+    @abstractmethod
+    def caminho_saida(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        """Caminho mais curto até a área verde."""
+
+    @abstractmethod
+    def caminho_bloco_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        """Caminho mais curto até um nó com bloco conhecido."""
+
+    @abstractmethod
+    def caminho_desconhecido_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        """Caminho mais curto até um nó com arestas desconhecidas."""
+
+    @abstractmethod
+    def caminho_ate(
+        self, origem: tuple[int, int], destinos: Iterable[tuple[int, int]], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        """Caminho mais curto até o mais próximo dos nós de destino."""
+
+    def custos(self, origem: tuple[int, int], direcao: int | None = None) -> list[float]:
+        """Tempo estimado, em segundos, da origem até cada nó, indexado pelo id do nó.
+
+        É o custo que o planejador minimiza, então quem escolhe entre destinos (como o
+        `PlanejadorColeta`) compara os trajetos que o robô de fato vai fazer. Sem giros, é a
+        distância do mapa vezes CUSTO_ARESTA.
+        """
+        return [distancia * CUSTO_ARESTA for distancia in self.mapa.distancias(origem)]
@@ -0,0 +1,159 @@
+"""Planejador da ordem de coleta dos blocos conhecidos.
+
+Cada viagem sai de um nó, vai até um bloco, volta para a área verde pela linha de
+saída mais próxima, procura a lixeira da cor do bloco e volta ao mapa pela linha
+alinhada com essa lixeira (a lixeira de índice i fica na linha 4 - i). Como a cor
+só é conhecida depois de pegar o bloco, a linha de entrada da próxima viagem é
+incerta: o custo de cada escolha é o valor esperado considerando todas as
+lixeiras com cor como igualmente prováveis.
+
+Os tempos dos trechos no mapa vêm dos `custos` do mesmo planejador que depois
+traça o caminho até o bloco escolhido, então com o `PlanejadorDirecional` a ordem
+também considera paradas e giros. Na volta à área verde o robô entra no mapa
+virado para a direita.
+
+Para poucos blocos a escolha é exata, por programação dinâmica sobre
+(blocos restantes, linha de entrada). Para muitos blocos usa-se uma escolha
+gulosa que olha uma viagem à frente.
+"""
+
+from functools import cache
+
+from settings import CUSTO_LIXEIRA
+from src.definicao_cores import Cores
+from src.mapa import INFINITO
+
+from .interface_planejador import InterfacePlanejador
+from .planejador_direcional import DIREITA
+from .planejador_memorizado import CacheLRU
+
+Aresta = tuple[tuple[int, int], tuple[int, int]]
+
+
+class PlanejadorColeta:
+    """Escolhe o próximo bloco a coletar minimizando o tempo total esperado da coleta."""
+
+    LIMITE_EXATO = 8  # Acima dessa quantidade de blocos a escolha passa a ser gulosa
+
+    def __init__(
+        self,
+        planejador: InterfacePlanejador,
+        custo_lixeira: float = CUSTO_LIXEIRA,
+        cache: CacheLRU | None = None,
+    ):
+        self.planejador = planejador
+        self.mapa = planejador.mapa
+        self.custo_lixeira = custo_lixeira
+        self.cache = cache
+
+    def linhas_de_entrada(self, posicoes_lixeiras: list[Cores]) -> list[int]:
+        """Linhas do mapa em que o robô pode voltar após um depósito, uma por lixeira com cor."""
+        indices = [
+            indice
+            for indice, cor in enumerate(posicoes_lixeiras)
+            if cor not in (None, Cores.VAZIO, Cores.BRANCO)
+        ]
+        # Sem lixeiras conhecidas qualquer linha é possível
+        if not indices:
+            indices = range(self.mapa.altura)
+        # Como em EstrategiaAreaVerde.andar_ate_mapa, as lixeiras além da quinta voltam pela linha 0
+        return [max(0, self.mapa.altura - 1 - indice) for indice in indices]
+
+    def custo_area_verde(self, linha_saida: int, linha_entrada: int) -> float:
+        """Tempo para ir da linha de saída até a lixeira alinhada com a linha de entrada."""
+        return (abs(linha_saida - linha_entrada) + 1) * self.custo_lixeira
+
+    def proxima_coleta(
+        self, origem: tuple[int, int], posicoes_lixeiras: list[Cores], direcao: int | None = None
+    ) -> tuple[Aresta, float] | None:
+        """Retorna o bloco que deve ser coletado agora e o tempo esperado para coletar todos.
+
+        No modo guloso o tempo retornado considera apenas a viagem atual e a seguinte.
+
+        A ordem é uma política e não uma lista fixa: a melhor continuação depende da
+        cor do bloco pego, então a estratégia deve chamar este método a cada viagem.
+        Com um cache, o resultado é memorizado pelo estado do mapa, origem e lixeiras
+        (e pela direção, se o planejador considerar giros).
+        """
+        if not self.planejador.considera_direcao:
+            direcao = None
+        if self.cache is None:
+            return self._proxima_coleta(origem, posicoes_lixeiras, direcao)
+
+        chave = ('proxima_coleta', self.mapa.estado(), origem, direcao, tuple(posicoes_lixeiras))
+        return self.cache.obter(chave, lambda: self._proxima_coleta(origem, posicoes_lixeiras, direcao))
+
+    def _proxima_coleta(
+        self, origem: tuple[int, int], posicoes_lixeiras: list[Cores], direcao: int | None
+    ) -> tuple[Aresta, float] | None:
+        blocos = self.mapa.arestas_com_bloco()
+        if not blocos:
+            return None
+
+        linhas_entrada = self.linhas_de_entrada(posicoes_lixeiras)
+        viagens_origem, viagens_entrada = self._custos_viagens(origem, direcao, blocos)
+
+        # Blocos inalcançáveis a partir da origem ficam para quando o mapa mudar
+        alcancaveis = frozenset(bloco for bloco, (custo, _) in enumerate(viagens_origem) if custo < INFINITO)
+        if not alcancaveis:
+            return None
+
+        def custo_viagem(viagens: list[tuple[float, int]], bloco: int, pendentes: frozenset[int]) -> float:
+            """Custo de coletar o bloco com as viagens de um nó, mais a média do que vem depois."""
+            custo_ida, linha_saida = viagens[bloco]
+            custo_depois = sum(
+                self.custo_area_verde(linha_saida, linha) + custo_restante(pendentes, linha)
+                for linha in linhas_entrada
+            )
+            return custo_ida + custo_depois / len(linhas_entrada)
+
+        if len(alcancaveis) <= self.LIMITE_EXATO:
+
+            @cache
+            def custo_restante(pendentes: frozenset[int], linha: int) -> float:
+                return min(
+                    (custo_viagem(viagens_entrada[linha], bloco, pendentes - {bloco}) for bloco in pendentes),
+                    default=0,
+                )
+
+        else:
+
+            def custo_restante(pendentes: frozenset[int], linha: int) -> float:
+                # Estimativa gulosa: considera apenas a ida até o bloco seguinte mais barato
+                return min((viagens_entrada[linha][bloco][0] for bloco in pendentes), default=0)
+
+        custo, melhor = min(
+            (custo_viagem(viagens_origem, bloco, alcancaveis - {bloco}), bloco) for bloco in alcancaveis
+        )
+        return blocos[melhor], custo
+
+    def _custos_viagens(
+        self, origem: tuple[int, int], direcao: int | None, blocos: list[Aresta]
+    ) -> tuple[list[tuple[float, int]], list[list[tuple[float, int]]]]:
+        """Calcula o custo de ir até cada bloco e voltar à coluna 0, da origem e de cada linha de entrada.
+
+        Retorna as viagens da origem e as de cada linha de entrada, cada uma como uma
+        lista de (custo, linha de saída) por bloco.
+        """
+        planejador = self.planejador
+        entradas = [(linha, 0) for linha in range(self.mapa.altura)]
+        custos_entrada = [planejador.custos(entrada, DIREITA) for entrada in entradas]
+
+        # Tempo de cada nó até a coluna 0 e a linha por onde ele sai. A volta é o caminho
+        # da entrada até o nó ao contrário, então parte sem direção conhecida
+        custos_volta = [planejador.custos(entrada) for entrada in entradas]
+        saidas = [
+            min((custos_volta[linha][id_no], linha) for linha in range(self.mapa.altura))
+            for id_no in range(self.mapa.qtd_nos + 1)
+        ]
+
+        def viagens(custos: list[float]) -> list[tuple[float, int]]:
+            return [
+                min(
+                    (custos[id_no] + saidas[id_no][0], saidas[id_no][1])
+                    for id_no in (self.mapa.ids[u], self.mapa.ids[v])
+                )
+                for u, v in blocos
+            ]
+
+        return viagens(planejador.custos(origem, direcao)), [viagens(custos) for custos in custos_entrada]
@@ -0,0 +1,33 @@
+from collections.abc import Iterable
+
+from .interface_planejador import InterfacePlanejador
+
+
+class PlanejadorDijkstra(InterfacePlanejador):
+    """Planejador que refaz uma busca de Dijkstra completa a cada consulta."""
+
+    def caminho_saida(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self.mapa.caminho_saida(origem)
+
+    def caminho_bloco_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        nos_com_bloco = self.mapa.nos_com_bloco()
+        if not nos_com_bloco:
+            return None
+        return self.mapa.dijkstra_multiplos_destinos(origem, nos_com_bloco)
+
+    def caminho_desconhecido_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        nos_com_arestas_desconhecidas = self.mapa.nos_com_arestas_desconhecidas()
+        if not nos_com_arestas_desconhecidas:
+            return None
+        return self.mapa.dijkstra_multiplos_destinos(origem, nos_com_arestas_desconhecidas)
+
+    def caminho_ate(
+        self, origem: tuple[int, int], destinos: Iterable[tuple[int, int]], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self.mapa.dijkstra_multiplos_destinos(origem, destinos)
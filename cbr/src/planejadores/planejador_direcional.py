@@ -0,0 +1,227 @@
+"""Planejador que estima o tempo real dos trajetos considerando a direção do robô.
+
+A busca é feita sobre estados (nó, direção de chegada). Além do peso da aresta,
+cada passo cobra a parada na encruzilhada e o giro necessário para sair na nova
+direção, de modo que caminhos com menos curvas sejam preferidos.
+"""
+
+from collections.abc import Iterable
+from heapq import heappop, heappush
+from typing import Callable
+
+from settings import CUSTO_ARESTA, CUSTO_GIRO_90, CUSTO_GIRO_180, CUSTO_PARADA
+from src.mapa import INFINITO, Mapa
+
+from .interface_planejador import InterfacePlanejador
+from .planejador_incremental import DESCONTO_PRIORIDADE
+
+# Mesmos valores de EstrategiaBase.Direcoes
+CIMA, DIREITA, BAIXO, ESQUERDA, DIRECAO_DESCONHECIDA = range(5)
+DIRECOES = {(-1, 0): CIMA, (0, 1): DIREITA, (1, 0): BAIXO, (0, -1): ESQUERDA}
+
+# Quantidade de direções por nó no id do estado (as 4 direções mais a desconhecida)
+QTD_DIRECOES = 5
+
+
+class PlanejadorDirecional(InterfacePlanejador):
+    """Planejador de Dijkstra sobre estados (nó, direção) que minimiza o tempo estimado."""
+
+    considera_direcao = True
+
+    def __init__(
+        self,
+        mapa: Mapa,
+        custo_aresta: float = CUSTO_ARESTA,
+        custo_parada: float = CUSTO_PARADA,
+        custo_giro_90: float = CUSTO_GIRO_90,
+        custo_giro_180: float = CUSTO_GIRO_180,
+    ):
+        super().__init__(mapa)
+        self.custo_aresta = custo_aresta
+        self.custo_parada = custo_parada
+        # Custo indexado pela diferença (direção nova - direção atual) % 4
+        self.custos_giro = (0, custo_giro_90, custo_giro_180, custo_giro_90)
+        # Tabelas usadas na busca: giro por [direção atual][direção nova] e passo por código da aresta
+        self.tabela_giros = [
+            [self.custo_giro(direcao_atual, direcao_nova) for direcao_nova in range(4)]
+            for direcao_atual in range(QTD_DIRECOES)
+        ]
+        self.custos_passo = [
+            None if peso is None else peso * custo_aresta + custo_parada for peso in mapa.PESOS
+        ]
+
+        # Vizinhos de cada nó com a direção em que o robô sai para alcançá-los
+        self.vizinhos = [
+            [
+                (id_vizinho, tabela, indice, self._direcao(mapa.nos[id_no], mapa.nos[id_vizinho]))
+                for id_vizinho, tabela, indice in vizinhos
+            ]
+            for id_no, vizinhos in enumerate(mapa.vizinhos)
+        ]
+
+    def _direcao(self, no: tuple[int, int], vizinho: tuple[int, int]) -> int:
+        if no == Mapa.AREA_VERDE:
+            return DIREITA
+        if vizinho == Mapa.AREA_VERDE:
+            return ESQUERDA
+        return DIRECOES[(vizinho[0] - no[0], vizinho[1] - no[1])]
+
+    def custo_giro(self, direcao_atual: int, direcao_nova: int) -> float:
+        """Custo de girar da direção atual para a nova. Sem direção conhecida o giro não é cobrado."""
+        if direcao_atual == DIRECAO_DESCONHECIDA:
+            return 0
+        return self.custos_giro[(direcao_nova - direcao_atual) % 4]
+
+    def buscar(
+        self,
+        origem: tuple[int, int],
+        direcao: int | None,
+        custo_destino: Callable[[int, int], float | None],
+    ) -> list[tuple[int, int]] | None:
+        """Busca o caminho de menor tempo até um destino.
+
+        `custo_destino(id_no, direcao)` retorna o custo de encerrar o trajeto no nó
+        chegando na direção dada, ou None se o nó não for destino.
+        """
+        if direcao is None:
+            direcao = DIRECAO_DESCONHECIDA
+
+        custos_passo = self.custos_passo
+        vizinhos = self.vizinhos
+        estado_origem = self.mapa.id_no(origem) * QTD_DIRECOES + direcao
+        distancias = {estado_origem: 0}
+        anteriores = {}
+        fila = [(0, estado_origem)]
+
+        while fila:
+            custo, estado = heappop(fila)
+
+            # Estados negativos marcam o fim do trajeto no estado -(estado + 1)
+            if estado < 0:
+                return self.reconstruir(-estado - 1, estado_origem, anteriores)
+
+            if custo > distancias[estado]:
+                continue
+
+            id_no, direcao_atual = divmod(estado, QTD_DIRECOES)
+            final = custo_destino(id_no, direcao_atual)
+            if final is not None:
+                heappush(fila, (custo + final, -estado - 1))
+
+            giros = self.tabela_giros[direcao_atual]
+            for id_vizinho, tabela, indice, direcao_nova in vizinhos[id_no]:
+                custo_passo = custos_passo[tabela[indice]]
+                if custo_passo is None:
+                    continue
+                novo_custo = custo + giros[direcao_nova] + custo_passo
+                novo_estado = id_vizinho * QTD_DIRECOES + direcao_nova
+                if novo_custo < distancias.get(novo_estado, INFINITO):
+                    distancias[novo_estado] = novo_custo
+                    anteriores[novo_estado] = estado
+                    heappush(fila, (novo_custo, novo_estado))
+
+        return None
+
+    def arvore(self, origem: tuple[int, int], direcao: int | None) -> tuple[int, dict, dict]:
+        """Calcula o menor tempo da origem até todos os estados (nó, direção) alcançáveis.
+
+        Retorna o estado de origem e os dicionários de distâncias e anteriores por estado.
+        """
+        if direcao is None:
+            direcao = DIRECAO_DESCONHECIDA
+
+        custos_passo = self.custos_passo
+        vizinhos = self.vizinhos
+        estado_origem = self.mapa.id_no(origem) * QTD_DIRECOES + direcao
+        distancias = {estado_origem: 0}
+        anteriores = {}
+        fila = [(0, estado_origem)]
+
+        while fila:
+            custo, estado = heappop(fila)
+            if custo > distancias[estado]:
+                continue
+
+            id_no, direcao_atual = divmod(estado, QTD_DIRECOES)
+            giros = self.tabela_giros[direcao_atual]
+            for id_vizinho, tabela, indice, direcao_nova in vizinhos[id_no]:
+                custo_passo = custos_passo[tabela[indice]]
+                if custo_passo is None:
+                    continue
+                novo_custo = custo + giros[direcao_nova] + custo_passo
+                novo_estado = id_vizinho * QTD_DIRECOES + direcao_nova
+                if novo_custo < distancias.get(novo_estado, INFINITO):
+                    distancias[novo_estado] = novo_custo
+                    anteriores[novo_estado] = estado
+                    heappush(fila, (novo_custo, novo_estado))
+
+        return estado_origem, distancias, anteriores
+
+    def custos(self, origem: tuple[int, int], direcao: int | None = None) -> list[float]:
+        _, distancias, _ = self.arvore(origem, direcao)
+        custos = [INFINITO] * (self.mapa.qtd_nos + 1)
+        for estado, custo in distancias.items():
+            id_no = estado // QTD_DIRECOES
+            custos[id_no] = min(custos[id_no], custo)
+        return custos
+
+    def reconstruir(self, estado: int, estado_origem: int, anteriores: dict) -> list[tuple[int, int]]:
+        """Monta a lista de nós do estado de origem até o estado dado."""
+        caminho = []
+        while estado != estado_origem:
+            caminho.append(self.mapa.nos[estado // QTD_DIRECOES])
+            estado = anteriores[estado]
+        caminho.append(self.mapa.nos[estado_origem // QTD_DIRECOES])
+        caminho.reverse()
+        return caminho
+
+    def caminho_saida(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        id_area_verde = self.mapa.id_area_verde
+        return self.buscar(origem, direcao, lambda id_no, _: 0 if id_no == id_area_verde else None)
+
+    def caminho_bloco_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        if not self.mapa.ids_com_bloco:
+            return None
+        return self.buscar(origem, direcao, self._giro_ate_bloco)
+
+    def _giro_ate_bloco(self, id_no: int, direcao_chegada: int) -> float | None:
+        """Custo de se virar para o bloco mais barato do nó, ou None se o nó não tiver bloco."""
+        if not self.mapa.qtd_blocos[id_no]:
+            return None
+        giros = [
+            self.custo_giro(direcao_chegada, direcao_bloco)
+            for _, tabela, indice, direcao_bloco in self.vizinhos[id_no]
+            if tabela[indice] == Mapa.BLOCO and tabela is not self.mapa.entradas
+        ]
+        return min(giros) if giros else None
+
+    def caminho_ate(
+        self, origem: tuple[int, int], destinos: Iterable[tuple[int, int]], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        ids_destinos = {self.mapa.ids[destino] for destino in destinos}
+
+        def custo_destino(id_no: int, direcao_chegada: int) -> float | None:
+            if id_no not in ids_destinos:
+                return None
+            # Num nó com bloco, como as pontas do bloco escolhido, o giro até ele também conta
+            giro = self._giro_ate_bloco(id_no, direcao_chegada)
+            return 0 if giro is None else giro
+
+        return self.buscar(origem, direcao, custo_destino)
+
+    def caminho_desconhecido_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        if not self.mapa.ids_desconhecidos:
+            return None
+
+        def custo_destino(id_no: int, direcao_chegada: int) -> float | None:
+            if not self.mapa.qtd_desconhecidas[id_no]:
+                return None
+            return -self.mapa.prioridades[id_no] * DESCONTO_PRIORIDADE
+
+        return self.buscar(origem, direcao, custo_destino)
@@ -0,0 +1,95 @@
+"""Política de exploração que maximiza as arestas reveladas por segundo de trajeto.
+
+Ao chegar em uma encruzilhada, `EstrategiaBase.atualizacao_dinamica_mapa` lê os
+sensores da esquerda, da frente e da direita. Cada leitura decide a aresta até o
+vizinho e, quando essa aresta está livre (leituras MEDIO e NAO_ENCONTRADO), também a
+aresta do vizinho ao vizinho do vizinho. Por isso o que é revelado depende do nó e da
+direção de chegada, e um nó vizinho de várias arestas desconhecidas pode valer menos
+que outro de onde os sensores alcançam mais longe.
+
+O tempo dos trajetos vem do modelo do `PlanejadorDirecional` (arestas, paradas e
+giros). O destino escolhido é o estado (nó, direção) com maior ganho esperado dividido
+pelo tempo para alcançá-lo.
+"""
+
+from array import array
+from math import exp
+
+from src.mapa import Mapa
+
+from .planejador_direcional import DIRECAO_DESCONHECIDA, QTD_DIRECOES, PlanejadorDirecional
+
+
+class PlanejadorGanhoInformacao(PlanejadorDirecional):
+    """Planejador direcional cuja exploração escolhe o destino pelo ganho de informação por segundo."""
+
+    def __init__(self, mapa: Mapa, **custos):
+        super().__init__(mapa, **custos)
+
+        # Arestas lidas pelos sensores em cada estado (nó, direção): (perto, longe), cada
+        # uma como (tabela, índice, bit). A aresta longe é None quando não existe.
+        self.leituras = [[] for _ in range((mapa.qtd_nos + 1) * QTD_DIRECOES)]
+        for id_no in range(mapa.qtd_nos):
+            for direcao in range(DIRECAO_DESCONHECIDA):
+                estado = id_no * QTD_DIRECOES + direcao
+                for direcao_sensor in (direcao, (direcao + 1) % 4, (direcao - 1) % 4):
+                    perto = self._aresta_na_direcao(id_no, direcao_sensor)
+                    if perto is None:
+                        continue
+                    longe = self._aresta_na_direcao(perto[0], direcao_sensor)
+                    self.leituras[estado].append((perto[1:], None if longe is None else longe[1:]))
+
+    def _aresta_na_direcao(self, id_no: int, direcao: int) -> tuple[int, array, int, int] | None:
+        """Retorna (id do vizinho, tabela, índice, bit) da aresta da grade que sai do nó na direção."""
+        for id_vizinho, tabela, indice, direcao_vizinho in self.vizinhos[id_no]:
+            if direcao_vizinho == direcao and tabela is not self.mapa.entradas:
+                return id_vizinho, tabela, indice, self.mapa.deslocamentos[id(tabela)] + indice
+        return None
+
+    def ganho(self, estado: int) -> float:
+        """Quantidade esperada de arestas desconhecidas reveladas ao chegar no estado.
+
+        A aresta longe só é lida se a aresta perto estiver livre. Para uma aresta perto
+        desconhecida essa chance vem da evidência já acumulada no modelo de ocupação
+        do mapa (metade, sem nenhuma leitura).
+        """
+        desconhecida = Mapa.DESCONHECIDA
+        log_odds = self.mapa.log_odds
+        ganho = 0.0
+        for (tabela_perto, indice_perto, bit_perto), longe in self.leituras[estado]:
+            codigo_perto = tabela_perto[indice_perto]
+            if codigo_perto == desconhecida:
+                ganho += 1
+            if longe is None or longe[0][longe[1]] != desconhecida:
+                continue
+            if codigo_perto == Mapa.VAZIO:
+                ganho += 1
+            elif codigo_perto == desconhecida:
+                ganho += 1 / (1 + exp(log_odds[bit_perto]))
+        return ganho
+
+    def caminho_desconhecido_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        if not self.mapa.ids_desconhecidos:
+            return None
+
+        estado_origem, distancias, anteriores = self.arvore(origem, direcao)
+
+        # A leitura do estado de origem já foi feita: só conta o que muda ao se mover
+        melhor = None
+        melhor_chave = (0.0, 0.0)
+        for estado, custo in distancias.items():
+            if estado == estado_origem:
+                continue
+            ganho = self.ganho(estado)
+            if not ganho:
+                continue
+            chave = (ganho / custo, -custo)
+            if chave > melhor_chave:
+                melhor, melhor_chave = estado, chave
+
+        if melhor is None:
+            # Nenhuma leitura alcança as arestas restantes: vai até a mais próxima
+            return super().caminho_desconhecido_mais_proximo(origem, direcao)
+        return self.reconstruir(melhor, estado_origem, anteriores)
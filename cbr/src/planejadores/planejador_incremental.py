@@ -0,0 +1,186 @@
+"""Planejador incremental baseado no LPA* (equivalente ao D* Lite sem heurística).
+
+Cada tipo de destino (área verde, blocos e arestas desconhecidas) tem uma busca
+própria feita a partir dos destinos em direção ao robô. Como a busca parte dos
+destinos, o robô pode se mover livremente entre consultas sem invalidar nada: só
+as arestas alteradas no mapa marcam nós para reparo, e o reparo é feito na
+próxima consulta, expandindo apenas os nós cuja distância realmente mudou.
+"""
+
+from collections.abc import Iterable
+from heapq import heappop, heappush
+from typing import Callable
+
+from src.mapa import INFINITO, Mapa
+
+from .interface_planejador import InterfacePlanejador
+
+# Desconto aplicado aos nós desconhecidos por unidade de prioridade. Como os pesos
+# das arestas são inteiros e a prioridade não passa de 8, o desconto só desempata
+# destinos à mesma distância, preferindo os que revelam mais arestas.
+DESCONTO_PRIORIDADE = 1e-3
+
+# Buscas de `caminho_ate` mantidas ao mesmo tempo, uma por conjunto de destinos
+MAX_BUSCAS_DESTINOS = 16
+
+
+class BuscaIncremental:
+    """Busca LPA* com múltiplos destinos sobre os arrays do mapa.
+
+    `valor_destino(id_no)` retorna o custo inicial do nó quando ele é um destino, ou
+    None caso contrário. `g` guarda a distância consolidada de cada nó até o destino
+    mais próximo e `rhs` a estimativa calculada a partir dos vizinhos; a busca só
+    expande nós em que os dois valores divergem.
+    """
+
+    def __init__(self, mapa: Mapa, valor_destino: Callable[[int], float | None]):
+        self.mapa = mapa
+        self.valor_destino = valor_destino
+
+        qtd_nos = mapa.qtd_nos + 1
+        self.g = [INFINITO] * qtd_nos
+        self.rhs = [INFINITO] * qtd_nos
+        self.fila = []
+        self.pendentes = set(range(qtd_nos))
+        self.expansoes = 0
+
+    def invalidar(self, *ids_nos: int):
+        """Marca nós cujo custo ou condição de destino pode ter mudado."""
+        self.pendentes.update(ids_nos)
+
+    def _atualizar_no(self, id_no: int):
+        pesos = self.mapa.PESOS
+        g = self.g
+
+        melhor = self.valor_destino(id_no)
+        if melhor is None:
+            melhor = INFINITO
+        for id_vizinho, tabela, indice in self.mapa.vizinhos[id_no]:
+            peso = pesos[tabela[indice]]
+            if peso is not None and g[id_vizinho] + peso < melhor:
+                melhor = g[id_vizinho] + peso
+
+        self.rhs[id_no] = melhor
+        if g[id_no] != melhor:
+            heappush(self.fila, (min(g[id_no], melhor), id_no))
+
+    def _calcular(self, id_origem: int):
+        for id_no in self.pendentes:
+            self._atualizar_no(id_no)
+        self.pendentes.clear()
+
+        g, rhs, fila, vizinhos = self.g, self.rhs, self.fila, self.mapa.vizinhos
+        while fila and (fila[0][0] < min(g[id_origem], rhs[id_origem]) or g[id_origem] != rhs[id_origem]):
+            chave, id_no = heappop(fila)
+            chave_atual = min(g[id_no], rhs[id_no])
+            if g[id_no] == rhs[id_no]:
+                continue
+            if chave != chave_atual:
+                # Entrada antiga na fila: reinsere com a chave atual se ela aumentou
+                if chave < chave_atual:
+                    heappush(fila, (chave_atual, id_no))
+                continue
+
+            self.expansoes += 1
+            if g[id_no] > rhs[id_no]:
+                g[id_no] = rhs[id_no]
+            else:
+                g[id_no] = INFINITO
+                self._atualizar_no(id_no)
+            for id_vizinho, _, _ in vizinhos[id_no]:
+                self._atualizar_no(id_vizinho)
+
+    def caminho(self, origem: tuple[int, int]) -> list[tuple[int, int]] | None:
+        """Retorna o caminho da origem até o destino mais próximo, ou None se não houver."""
+        id_no = self.mapa.id_no(origem)
+        self._calcular(id_no)
+        if self.g[id_no] == INFINITO:
+            return None
+
+        pesos = self.mapa.PESOS
+        caminho = [origem]
+        for _ in range(len(self.g)):
+            melhor, proximo = INFINITO, None
+            for id_vizinho, tabela, indice in self.mapa.vizinhos[id_no]:
+                peso = pesos[tabela[indice]]
+                if peso is not None and self.g[id_vizinho] + peso < melhor:
+                    melhor, proximo = self.g[id_vizinho] + peso, id_vizinho
+
+            valor_destino = self.valor_destino(id_no)
+            if valor_destino is not None and valor_destino <= melhor:
+                return caminho
+
+            id_no = proximo
+            caminho.append(self.mapa.nos[id_no])
+
+        return None
+
+
+class PlanejadorIncremental(InterfacePlanejador):
+    """Planejador que mantém o estado das buscas entre as consultas.
+
+    Registra-se como ouvinte do mapa e, a cada aresta alterada, apenas invalida os
+    nós afetados em cada busca.
+    """
+
+    def __init__(self, mapa: Mapa):
+        super().__init__(mapa)
+        self.busca_saida = BuscaIncremental(mapa, self._valor_saida)
+        self.busca_blocos = BuscaIncremental(mapa, self._valor_bloco)
+        self.busca_desconhecidos = BuscaIncremental(mapa, self._valor_desconhecido)
+        # Por conjunto de ids de destino, na ordem do uso mais antigo para o mais recente
+        self.buscas_destinos: dict[frozenset[int], BuscaIncremental] = {}
+        mapa.registrar_ouvinte(self._aresta_alterada)
+
+    def _aresta_alterada(self, id_u: int, id_v: int):
+        self.busca_saida.invalidar(id_u, id_v)
+        self.busca_blocos.invalidar(id_u, id_v)
+        for busca in self.buscas_destinos.values():
+            busca.invalidar(id_u, id_v)
+
+        # A prioridade dos nós desconhecidos também olha as arestas a dois passos em linha reta
+        self.busca_desconhecidos.invalidar(id_u, id_v)
+        for id_no in (id_u, id_v):
+            self.busca_desconhecidos.invalidar(
+                *(id_vizinho for id_vizinho, _, _ in self.mapa.vizinhos[id_no])
+            )
+
+    def _valor_saida(self, id_no: int) -> float | None:
+        return 0 if id_no == self.mapa.id_area_verde else None
+
+    def _valor_bloco(self, id_no: int) -> float | None:
+        return 0 if self.mapa.qtd_blocos[id_no] else None
+
+    def _valor_desconhecido(self, id_no: int) -> float | None:
+        if not self.mapa.qtd_desconhecidas[id_no]:
+            return None
+        return -self.mapa.prioridades[id_no] * DESCONTO_PRIORIDADE
+
+    def caminho_saida(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self.busca_saida.caminho(origem)
+
+    def caminho_bloco_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self.busca_blocos.caminho(origem)
+
+    def caminho_desconhecido_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self.busca_desconhecidos.caminho(origem)
+
+    def caminho_ate(
+        self, origem: tuple[int, int], destinos: Iterable[tuple[int, int]], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        # O mesmo destino (como um bloco) é pedido a cada encruzilhada até ser alcançado, e a
+        # busca dele só repara o que mudou desde a consulta anterior
+        ids_destinos = frozenset(self.mapa.ids[destino] for destino in destinos)
+        busca = self.buscas_destinos.pop(ids_destinos, None)
+        if busca is None:
+            busca = BuscaIncremental(self.mapa, lambda id_no: 0 if id_no in ids_destinos else None)
+            if len(self.buscas_destinos) >= MAX_BUSCAS_DESTINOS:
+                del self.buscas_destinos[next(iter(self.buscas_destinos))]
+        self.buscas_destinos[ids_destinos] = busca
+        return busca.caminho(origem)
@@ -0,0 +1,85 @@
+"""Memorização dos planos calculados para cada estado do mapa.
+
+O robô e o simulador costumam voltar a estados de conhecimento idênticos (por
+exemplo depois de `Mapa.zerar()`), e simulações em lote repetem os mesmos mapas.
+Os caminhos são guardados em um cache LRU indexado pelo bitboard do mapa
+(`Mapa.estado()`), pela posição e, quando o planejador considera giros, pela direção.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Callable
+
+from .interface_planejador import InterfacePlanejador
+
+
+class CacheLRU:
+    """Cache com capacidade limitada que descarta o item usado há mais tempo."""
+
+    def __init__(self, capacidade: int = 4096):
+        self.capacidade = capacidade
+        self.itens = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave: Hashable, calcular: Callable[[], object]):
+        """Retorna o valor da chave, calculando e guardando-o se ainda não estiver no cache."""
+        try:
+            valor = self.itens[chave]
+        except KeyError:
+            self.falhas += 1
+            valor = self.itens[chave] = calcular()
+            if len(self.itens) > self.capacidade:
+                self.itens.popitem(last=False)
+            return valor
+
+        self.acertos += 1
+        self.itens.move_to_end(chave)
+        return valor
+
+    def limpar(self):
+        self.itens.clear()
+
+
+class PlanejadorMemorizado(InterfacePlanejador):
+    """Envolve outro planejador e memoriza seus caminhos e custos.
+
+    O cache pode ser compartilhado entre vários mapas (por exemplo em simulações em
+    lote), pois a chave inclui as dimensões e o conhecimento completo do mapa.
+    """
+
+    def __init__(self, planejador: InterfacePlanejador, cache: CacheLRU | None = None):
+        super().__init__(planejador.mapa)
+        self.planejador = planejador
+        self.cache = cache if cache is not None else CacheLRU()
+        self.considera_direcao = planejador.considera_direcao
+
+    def _memorizar(self, nome: str, origem: tuple[int, int], direcao: int | None, *argumentos) -> list | None:
+        if not self.considera_direcao:
+            direcao = None
+        chave = (nome, self.mapa.estado(), origem, direcao, *argumentos)
+        valor = self.cache.obter(chave, lambda: getattr(self.planejador, nome)(origem, *argumentos, direcao))
+        return None if valor is None else list(valor)
+
+    def caminho_saida(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self._memorizar('caminho_saida', origem, direcao)
+
+    def caminho_bloco_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self._memorizar('caminho_bloco_mais_proximo', origem, direcao)
+
+    def caminho_desconhecido_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self._memorizar('caminho_desconhecido_mais_proximo', origem, direcao)
+
+    def caminho_ate(
+        self, origem: tuple[int, int], destinos: Iterable[tuple[int, int]], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self._memorizar('caminho_ate', origem, direcao, frozenset(destinos))
+
+    def custos(self, origem: tuple[int, int], direcao: int | None = None) -> list[float]:
+        return self._memorizar('custos', origem, direcao)
@@ -0,0 +1,144 @@
+"""Planejador baseado em tabelas de distâncias entre todos os pares de nós.
+
+A geometria do mapa nunca muda, apenas o conhecimento das arestas. Para cada nó de
+origem consultado é guardada uma linha com a distância e o nó anterior no caminho
+mais curto até todos os outros nós. Quando uma aresta muda, só as linhas em que
+ela realmente afeta algum caminho são descartadas e elas são recalculadas na
+próxima consulta que as usar. As consultas viram leituras das tabelas.
+"""
+
+from collections.abc import Iterable
+from heapq import heappop, heappush
+
+from settings import CUSTO_ARESTA
+from src.mapa import INFINITO, Mapa
+
+from .interface_planejador import InterfacePlanejador
+from .planejador_incremental import DESCONTO_PRIORIDADE
+
+
+class PlanejadorTabelas(InterfacePlanejador):
+    """Planejador que lê caminhos de tabelas de distância e anterior por origem."""
+
+    def __init__(self, mapa: Mapa):
+        super().__init__(mapa)
+        qtd_nos = mapa.qtd_nos + 1
+        self.distancias: list[list[float] | None] = [None] * qtd_nos
+        self.anteriores: list[list[int] | None] = [None] * qtd_nos
+        self.recalculos = 0
+        mapa.registrar_ouvinte(self._aresta_alterada)
+
+    def _aresta_alterada(self, id_u: int, id_v: int):
+        peso = self.mapa.conhecimento_aresta(self.mapa.nos[id_u], self.mapa.nos[id_v])['peso']
+
+        for id_origem, distancias in enumerate(self.distancias):
+            if distancias is None:
+                continue
+            anteriores = self.anteriores[id_origem]
+
+            # A aresta faz parte da árvore de caminhos: qualquer mudança de peso afeta a linha
+            na_arvore = anteriores[id_v] == id_u or anteriores[id_u] == id_v
+            # Fora da árvore, só importa se a aresta passou a encurtar algum caminho
+            encurta = peso is not None and (
+                distancias[id_u] + peso < distancias[id_v] or distancias[id_v] + peso < distancias[id_u]
+            )
+            if na_arvore or encurta:
+                self.distancias[id_origem] = None
+                self.anteriores[id_origem] = None
+
+    def precalcular(self):
+        """Calcula as linhas de todas as origens de uma vez."""
+        for id_origem in range(self.mapa.qtd_nos + 1):
+            self._linha(id_origem)
+
+    def _linha(self, id_origem: int) -> tuple[list[float], list[int]]:
+        """Retorna a linha da origem, recalculando-a com Dijkstra se estiver suja."""
+        distancias = self.distancias[id_origem]
+        if distancias is not None:
+            return distancias, self.anteriores[id_origem]
+
+        self.recalculos += 1
+        pesos = self.mapa.PESOS
+        vizinhos = self.mapa.vizinhos
+        distancias = [INFINITO] * (self.mapa.qtd_nos + 1)
+        anteriores = [-1] * (self.mapa.qtd_nos + 1)
+        distancias[id_origem] = 0
+        fila = [(0, id_origem)]
+
+        while fila:
+            distancia, id_no = heappop(fila)
+            if distancia > distancias[id_no]:
+                continue
+            for id_vizinho, tabela, indice in vizinhos[id_no]:
+                peso = pesos[tabela[indice]]
+                if peso is None:
+                    continue
+                nova_distancia = distancia + peso
+                if nova_distancia < distancias[id_vizinho]:
+                    distancias[id_vizinho] = nova_distancia
+                    anteriores[id_vizinho] = id_no
+                    heappush(fila, (nova_distancia, id_vizinho))
+
+        self.distancias[id_origem] = distancias
+        self.anteriores[id_origem] = anteriores
+        return distancias, anteriores
+
+    def _caminho(self, id_origem: int, id_destino: int | None) -> list[tuple[int, int]] | None:
+        if id_destino is None:
+            return None
+        distancias, anteriores = self._linha(id_origem)
+        if distancias[id_destino] == INFINITO:
+            return None
+
+        caminho = [self.mapa.nos[id_destino]]
+        while id_destino != id_origem:
+            id_destino = anteriores[id_destino]
+            caminho.append(self.mapa.nos[id_destino])
+        caminho.reverse()
+        return caminho
+
+    def proximo_passo(self, origem: tuple[int, int], destino: tuple[int, int]) -> tuple[int, int] | None:
+        """Retorna o nó seguinte à origem no caminho mais curto até o destino."""
+        caminho = self._caminho(self.mapa.ids[origem], self.mapa.ids[destino])
+        if caminho is None or len(caminho) < 2:
+            return None
+        return caminho[1]
+
+    def caminho_saida(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        return self._caminho(self.mapa.ids[origem], self.mapa.id_area_verde)
+
+    def caminho_bloco_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        id_origem = self.mapa.ids[origem]
+        distancias, _ = self._linha(id_origem)
+        destino = min(self.mapa.ids_com_bloco, key=lambda id_no: (distancias[id_no], id_no), default=None)
+        return self._caminho(id_origem, destino)
+
+    def caminho_ate(
+        self, origem: tuple[int, int], destinos: Iterable[tuple[int, int]], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        id_origem = self.mapa.ids[origem]
+        distancias, _ = self._linha(id_origem)
+        ids_destinos = (self.mapa.ids[destino] for destino in destinos)
+        destino = min(ids_destinos, key=lambda id_no: (distancias[id_no], id_no), default=None)
+        return self._caminho(id_origem, destino)
+
+    def custos(self, origem: tuple[int, int], direcao: int | None = None) -> list[float]:
+        distancias, _ = self._linha(self.mapa.ids[origem])
+        return [distancia * CUSTO_ARESTA for distancia in distancias]
+
+    def caminho_desconhecido_mais_proximo(
+        self, origem: tuple[int, int], direcao: int | None = None
+    ) -> list[tuple[int, int]] | None:
+        id_origem = self.mapa.ids[origem]
+        distancias, _ = self._linha(id_origem)
+        prioridades = self.mapa.prioridades
+        destino = min(
+            self.mapa.ids_desconhecidos,
+            key=lambda id_no: (distancias[id_no] - prioridades[id_no] * DESCONTO_PRIORIDADE, id_no),
+            default=None,
+        )
+        return self._caminho(id_origem, destino)
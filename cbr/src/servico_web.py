@@ -39,6 +39,6 @@ def get_mapa():
     data = {
         'pos_atual': ServicoWeb.estrategia.pos_atual,
         'direcao': ServicoWeb.estrategia.direcao,
-        'grafo': json_graph.node_link_data(ServicoWeb.estrategia.mapa.grafo, edges='edges'),
+        'grafo': json_graph.node_link_data(ServicoWeb.estrategia.mapa.para_grafo(), edges='edges'),
     }
     return data
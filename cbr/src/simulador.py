@@ -1,10 +1,11 @@
+from settings import SIMETRIA_CAMPO
 from src.atuadores import Simulador
+from src.atuadores.simulador.partida import jogar_partida
 from src.estrategias.estrategia_mapa import EstrategiaMapa
 from src.mapa import Mapa
 
-mapa = Mapa()
+mapa = Mapa(simetria=SIMETRIA_CAMPO)
 robo = Simulador()
 estrategia = EstrategiaMapa(robo, mapa)
-while True:
-    robo.ir_para_0_0()
-    estrategia.iniciar()
+jogar_partida(robo, estrategia)
+print(f'Partida concluída: {robo.blocos_depositados} blocos depositados em {robo.tempo:.1f} s')